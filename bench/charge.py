@@ -0,0 +1,283 @@
+# bench/charge.py
+"""
+Test de charge : N sessions simultanées parcourent l’application.
+
+Le banc démarre un vrai serveur (streamlit run, sans navigateur) et le pilote
+par websocket comme le ferait un navigateur : chaque session envoie les
+messages de rerun (valeurs des widgets) et attend la fin du script
+(script_finished). Parcours réaliste : ouverture de Poutre, saisie des
+sollicitations et de la section, pas des étriers, génération du PDF, passage à
+Choix profilé et saisie de M / V. Chaque parcours ouvre une nouvelle session.
+
+On mesure le débit, les percentiles de latence des reruns (par étape et
+global) et la mémoire résidente (RSS) du processus serveur.
+
+    python bench/charge.py [-s 8] [-p 5] [--montee 0.5]
+    python bench/charge.py --url http://hote:8501 [--pid 1234]   # serveur existant
+
+Les erreurs d’une étape (exception de l’app, widget absent) sont comptées
+et résumées sans arrêter le parcours.
+"""
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.parse
+import urllib.request
+
+import numpy as np
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(RACINE, "streamlit_app.py")
+TIMEOUT_S = 120.0
+
+
+def rss_mo(pid):
+    """Mémoire résidente du processus pid [Mo] (Linux ; None ailleurs ou si le processus a disparu)."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for ligne in f:
+                if ligne.startswith("VmRSS:"):
+                    return int(ligne.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def _port_libre():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class Serveur:
+    """streamlit run streamlit_app.py sur un port libre, arrêté à la sortie du bloc with."""
+
+    def __init__(self, metriques=False):
+        self.port = _port_libre()
+        self.url = f"http://127.0.0.1:{self.port}"
+        env = dict(os.environ, METRIQUES="1" if metriques else "0")
+        self.proc = subprocess.Popen(
+            [sys.executable, "-m", "streamlit", "run", APP, "--server.headless", "true",
+             "--server.port", str(self.port), "--browser.gatherUsageStats", "false"],
+            cwd=RACINE, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        self.pid = self.proc.pid
+
+    def __enter__(self):
+        limite = time.monotonic() + 60.0
+        while time.monotonic() < limite:
+            if self.proc.poll() is not None:
+                raise RuntimeError(f"le serveur s’est arrêté (code {self.proc.returncode})")
+            try:
+                with urllib.request.urlopen(self.url + "/_stcore/health", timeout=1.0) as r:
+                    if r.status == 200:
+                        return self
+            except OSError:
+                time.sleep(0.2)
+        self.__exit__()
+        raise RuntimeError("le serveur ne répond pas")
+
+    def __exit__(self, *exc):
+        self.proc.terminate()
+        try:
+            self.proc.wait(10)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+
+
+class Session:
+    """Une session navigateur simulée : widgets du dernier run et valeurs saisies."""
+
+    def __init__(self, ws):
+        self.ws = ws
+        self.widgets = {}    # id -> (type, libellé, proto)
+        self.etats = {}      # id -> WidgetState, renvoyés à chaque rerun comme le fait le navigateur
+
+    def trouver(self, cle):
+        """Widget par clé utilisateur (fin de l’id) ou, à défaut, par libellé."""
+        for wid in self.widgets:
+            if wid.endswith(f"-{cle}"):
+                return wid
+        for wid, (_, label, _) in self.widgets.items():
+            if label == cle:
+                return wid
+        raise KeyError(f"widget absent : {cle}")
+
+    def saisir(self, cle, valeur):
+        """
+        Enregistre la valeur du widget cle ; un bouton (valeur vraie) renvoie un
+        état ponctuel, envoyé avec un seul rerun.
+        """
+        wid = self.trouver(cle)
+        type_ = self.widgets[wid][0]
+        e = WidgetState(id=wid)
+        if type_ == "button":
+            if not valeur:
+                return None
+            e.trigger_value = True
+            return e
+        if type_ in ("text_input", "text_area", "selectbox", "radio"):
+            e.string_value = str(valeur)          # options : libellé affiché (format_func par défaut = str)
+        elif type_ == "number_input":
+            e.double_value = float(valeur)        # entiers compris : Streamlit convertit selon le type du champ
+        elif type_ == "multiselect":
+            e.string_array_value.data.extend(str(v) for v in valeur)
+        elif type_ == "checkbox":
+            e.bool_value = bool(valeur)
+        else:
+            raise TypeError(f"type de widget non géré : {type_}")
+        self.etats[wid] = e
+        return None
+
+    async def rerun(self, page, ponctuels=()):
+        """Rerun complet → (durée [ms], première exception affichée par l’app ou None)."""
+        m = BackMsg()
+        m.rerun_script.query_string = urllib.parse.urlencode({"page": page})
+        m.rerun_script.widget_states.widgets.extend(list(self.etats.values()) + list(ponctuels))
+        t0 = time.perf_counter()
+        await self.ws.send(m.SerializeToString())
+        widgets, erreur = {}, None
+        while True:
+            f = ForwardMsg()
+            f.ParseFromString(await asyncio.wait_for(self.ws.recv(), TIMEOUT_S))
+            type_ = f.WhichOneof("type")
+            if type_ == "delta" and f.delta.WhichOneof("type") == "new_element":
+                el = f.delta.new_element
+                nom = el.WhichOneof("type")
+                sous = getattr(el, nom)
+                if nom == "exception":
+                    erreur = erreur or (sous.message.splitlines()[0] if sous.message else sous.type)
+                elif getattr(sous, "id", ""):
+                    widgets[sous.id] = (nom, getattr(sous, "label", ""), sous)
+            elif type_ == "script_finished" and f.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                break
+        self.widgets = widgets
+        self.etats = {wid: e for wid, e in self.etats.items() if wid in widgets}
+        return (time.perf_counter() - t0) * 1000.0, erreur
+
+
+def _etapes(i):
+    """(nom, page, saisies) du parcours ; i fait varier les valeurs d’une session à l’autre."""
+    M = 60.0 + 7.5 * (i % 10)
+    return (
+        ("poutre – ouverture", "Poutre", ()),
+        ("poutre – M, V", "Poutre", (("M_inf_raw", f"{M:.1f}".replace(".", ",")), ("V_raw", "120,0"))),
+        ("poutre – section", "Poutre", (("h", 40 + 5 * (i % 4)),)),
+        ("poutre – pas étriers", "Poutre", (("pas_etrier_raw", f"{10 + i % 5},0"),)),
+        ("poutre – PDF", "Poutre", (("btn_pdf", True),)),
+        ("choix profilé – ouverture", "Choix profilé", ()),
+        ("choix profilé – M, V", "Choix profilé", (("M [kN·m]", 2 * M), ("V [kN]", 150.0))),
+    )
+
+
+async def session(ws_url, i, parcours, depart, mesures):
+    """Parcours d’une session ; ajoute (étape, durée [ms], erreur | None) à mesures."""
+    await asyncio.sleep(depart)
+    for _ in range(parcours):
+        async with websockets.connect(ws_url, max_size=None) as ws:
+            s = Session(ws)
+            page_courante = None
+            for nom, page, saisies in _etapes(i):
+                if page != page_courante:
+                    s.etats.clear()
+                    page_courante = page
+                try:
+                    ponctuels = [e for e in (s.saisir(cle, v) for cle, v in saisies) if e is not None]
+                except (KeyError, TypeError) as e:
+                    mesures.append((nom, 0.0, str(e)))
+                    continue
+                try:
+                    duree, erreur = await s.rerun(page, ponctuels)
+                except (asyncio.TimeoutError, websockets.ConnectionClosed) as e:
+                    mesures.append((nom, 0.0, f"banc – {type(e).__name__}"))
+                    break
+                mesures.append((nom, duree, erreur))
+
+
+async def echantillonner(pid, valeurs, arret, periode=0.2):
+    """Relève le RSS du serveur toutes les periode secondes jusqu’à arret."""
+    while not arret.is_set():
+        v = rss_mo(pid)
+        if v is not None:
+            valeurs.append(v)
+        try:
+            await asyncio.wait_for(arret.wait(), periode)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def charge(url, pid, sessions, parcours, montee):
+    ws_url = url.replace("http", "ws", 1).rstrip("/") + "/_stcore/stream"
+    mesures, rss, arret = [], [], asyncio.Event()
+    echant = asyncio.create_task(echantillonner(pid, rss, arret)) if pid is not None else None
+    t0 = time.perf_counter()
+    await asyncio.gather(*(session(ws_url, i, parcours, i * montee, mesures) for i in range(sessions)))
+    duree_s = time.perf_counter() - t0
+    arret.set()
+    if echant is not None:
+        await echant
+        if rss_mo(pid) is not None:
+            rss.append(rss_mo(pid))
+    return mesures, duree_s, rss
+
+
+def _p(v, q):
+    return float(np.percentile(v, q)) if len(v) else float("nan")
+
+
+def rapport(mesures, duree_s, rss, sessions, parcours, montee):
+    reruns = [d for _, d, e in mesures if e is None]
+    print(f"{sessions} sessions × {parcours} parcours en {duree_s:.1f} s (montée {montee:.1f} s/session)")
+    print(f"débit : {len(reruns) / duree_s:.1f} reruns/s, {sessions * parcours / duree_s:.2f} parcours/s\n")
+
+    print(f"{'étape':28s} {'n':>5s} {'err':>4s} {'p50 [ms]':>9s} {'p95 [ms]':>9s} {'p99 [ms]':>9s}")
+    erreurs = {}
+    for nom, _, _ in _etapes(0):
+        lignes = [(d, e) for n, d, e in mesures if n == nom]
+        ok = [d for d, e in lignes if e is None]
+        ko = [e for _, e in lignes if e is not None]
+        if ko:
+            erreurs[nom] = (len(ko), ko[0])
+        print(f"{nom:28s} {len(lignes):5d} {len(ko):4d} {_p(ok, 50):9.1f} {_p(ok, 95):9.1f} {_p(ok, 99):9.1f}")
+    print(f"{'tous reruns':28s} {len(mesures):5d} {len(mesures) - len(reruns):4d} "
+          f"{_p(reruns, 50):9.1f} {_p(reruns, 95):9.1f} {_p(reruns, 99):9.1f}")
+
+    if rss:
+        print(f"\nRSS serveur : début {rss[0]:.0f} Mo, pic {max(rss):.0f} Mo, fin {rss[-1]:.0f} Mo "
+              f"(médiane {statistics.median(rss):.0f} Mo)")
+    for nom, (n, e) in erreurs.items():
+        print(f"⚠️ {nom} ({n}×) : {e}")
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    p.add_argument("-s", "--sessions", type=int, default=8, help="sessions simultanées")
+    p.add_argument("-p", "--parcours", type=int, default=5, help="parcours par session")
+    p.add_argument("--montee", type=float, default=0.5, help="délai entre deux démarrages de session [s]")
+    p.add_argument("--url", default=None, help="serveur déjà lancé (défaut : un serveur est démarré)")
+    p.add_argument("--pid", type=int, default=None, help="avec --url : pid du serveur, pour le RSS")
+    p.add_argument("--metriques", action="store_true", help="serveur démarré : activer modules.metriques (METRIQUES=1)")
+    a = p.parse_args(argv)
+
+    args = (a.sessions, a.parcours, a.montee)
+    if a.url:
+        mesures, duree_s, rss = asyncio.run(charge(a.url, a.pid, *args))
+    else:
+        with Serveur(a.metriques) as srv:
+            asyncio.run(charge(srv.url, None, 1, 1, 0.0))     # parcours hors mesure : serveur chaud
+            mesures, duree_s, rss = asyncio.run(charge(srv.url, srv.pid, *args))
+    rapport(mesures, duree_s, rss, *args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+# bench/fragments.py
+"""
+Banc d’essai : rerun complet de la page vs rerun du seul fragment.
+
+Streamlit ne réexécute que la fonction fragment quand un widget de ce bloc
+change ; on compare donc le temps et la taille des éléments envoyés
+(octets protobuf) d’un run complet avec ceux du fragment seul.
+
+    python bench/fragments.py [-n 20]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+from streamlit.testing.v1 import AppTest
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENTETE = f"""
+import os, sys
+sys.path.insert(0, {RACINE!r}); os.chdir({RACINE!r})
+import streamlit as st
+"""
+
+POUTRE_ETAT = {
+    "beton": "C30/37", "fyk": "500", "b": 20, "h": 40, "enrobage": 5.0,
+    "M_inf": 85.5, "V": 120.0, "n_etriers": 1, "ø_etrier": 8, "pas_etrier": 12.0,
+}
+
+SCRIPTS = {
+    "poutre – page complète": (
+        ENTETE + "from modules import poutre\npoutre.show()\n",
+        POUTRE_ETAT, "pas_etrier_raw",
+    ),
+    "poutre – fragment étriers": (
+        ENTETE + "from modules import poutre\n"
+                 "poutre.bloc_etriers('etriers', 'Détermination des étriers', '', "
+                 "'n_etriers', 'ø_etrier', 'pas_etrier')\n",
+        POUTRE_ETAT, "pas_etrier_raw",
+    ),
+    "rigidite_sol – page complète": (
+        ENTETE + "from modules import rigidite_sol\nrigidite_sol.show()\n",
+        {}, None,
+    ),
+    # panneau remplacé par une fonction vide : ce qui reste est le coût évité par le fragment
+    "rigidite_sol – hors panneau": (
+        ENTETE + "from modules import rigidite_sol\n"
+                 "frag, rigidite_sol.fragment = rigidite_sol.fragment, lambda f: (lambda: None)\n"
+                 "try:\n    rigidite_sol.show()\nfinally:\n    rigidite_sol.fragment = frag\n",
+        {}, None,
+    ),
+}
+
+
+def _octets(noeud):
+    proto = getattr(noeud, "proto", None)
+    n = proto.ByteSize() if proto is not None else 0
+    return n + sum(_octets(c) for c in getattr(noeud, "children", {}).values())
+
+
+def mesurer(script, etat, cle_pas, n):
+    """Temps médian d’un rerun [ms] et taille des éléments rendus [octets]."""
+    at = AppTest.from_string(script, default_timeout=60)
+    for k, v in etat.items():
+        at.session_state[k] = v
+    at.run()
+    temps = []
+    for i in range(n):
+        if cle_pas:
+            at.session_state[cle_pas] = f"{10 + i % 5},0"
+        t0 = time.perf_counter()
+        at.run()
+        temps.append((time.perf_counter() - t0) * 1000.0)
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return statistics.median(temps), _octets(at._tree)
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    p.add_argument("-n", type=int, default=20, help="nombre de reruns mesurés")
+    a = p.parse_args(argv)
+
+    res = {nom: mesurer(script, etat, cle, a.n) for nom, (script, etat, cle) in SCRIPTS.items()}
+    print(f"{'cas':34s} {'rerun [ms]':>11s} {'éléments [o]':>13s}")
+    for nom, (t, o) in res.items():
+        print(f"{nom:34s} {t:11.1f} {o:13,d}")
+
+    t_p, o_p = res["poutre – page complète"]
+    t_f, o_f = res["poutre – fragment étriers"]
+    print(f"\npoutre : changement du pas d’étriers → {t_f / t_p:.0%} du temps, {o_f / o_p:.0%} des octets")
+    t_r, o_r = res["rigidite_sol – page complète"]
+    t_h, o_h = res["rigidite_sol – hors panneau"]
+    print(f"rigidite_sol : saisie dans le panneau → {(t_r - t_h) / t_r:.0%} du temps, "
+          f"{(o_r - o_h) / o_r:.0%} des octets")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
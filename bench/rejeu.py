@@ -0,0 +1,175 @@
+# bench/rejeu.py
+"""
+Rejeu des traces de sessions réelles (modules.enregistrement) contre un serveur.
+
+Chaque trace est rejouée dans une nouvelle session websocket (voir
+bench/charge.py) : pour chaque événement, les valeurs enregistrées sont
+appliquées aux widgets de même clé, puis un rerun de la page est demandé et
+chronométré. Les clés qui ne correspondent à aucun widget (état dérivé
+calculé par la page) sont ignorées et comptées.
+
+    python bench/rejeu.py .cache/traces/*.jsonl [-r 3] [--vitesse 0]
+    python bench/rejeu.py traces/*.jsonl --json v2.json --comparer v1.json
+
+Lancé depuis deux versions de l’application (deux checkouts), --json puis
+--comparer donnent l’écart de coût des reruns, page par page.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import websockets
+
+BANC = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.dirname(BANC), BANC]     # racine (modules.*) et bench/ (charge), d’où que l’on lance
+
+from charge import Serveur, Session, rss_mo    # noqa: E402
+from modules.enregistrement import lire         # noqa: E402
+
+
+async def rejouer(ws_url, evenements, vitesse, mesures, ignorees):
+    """Rejoue une trace ; ajoute (page, durée [ms], erreur | None) à mesures."""
+    async with websockets.connect(ws_url, max_size=None) as ws:
+        s = Session(ws)
+        page_courante, t_prec = None, 0.0
+        for ev in evenements:
+            if vitesse > 0:
+                await asyncio.sleep(max(0.0, ev["t"] - t_prec) / vitesse)
+            t_prec = ev["t"]
+            if ev["page"] != page_courante:
+                s.etats.clear()
+                page_courante = ev["page"]
+
+            ponctuels, appliquees = [], 0
+            for cle, valeur in ev["changes"].items():
+                try:
+                    e = s.saisir(cle, valeur)
+                except (KeyError, TypeError):
+                    ignorees[cle] = ignorees.get(cle, 0) + 1
+                    continue
+                if e is not None:
+                    ponctuels.append(e)
+                if e is not None or s.widgets[s.trouver(cle)][0] != "button":
+                    appliquees += 1
+            # relâchement d’un bouton (True → False) : pas de rerun côté navigateur
+            if ev["changes"] and not appliquees:
+                continue
+            try:
+                duree, erreur = await s.rerun(page_courante, ponctuels)
+            except (asyncio.TimeoutError, websockets.ConnectionClosed) as e:
+                mesures.append((page_courante, 0.0, f"banc – {type(e).__name__}"))
+                return
+            mesures.append((page_courante, duree, erreur))
+
+
+async def rejeu(url, traces, repetitions, vitesse):
+    ws_url = url.replace("http", "ws", 1).rstrip("/") + "/_stcore/stream"
+    mesures, ignorees = [], {}
+    t0 = time.perf_counter()
+    for _ in range(repetitions):
+        for _, evenements in traces:
+            await rejouer(ws_url, evenements, vitesse, mesures, ignorees)
+    return mesures, ignorees, time.perf_counter() - t0
+
+
+def resume(mesures):
+    """{page: {"n", "erreurs", "p50", "p95", "total"}} (durées en ms, reruns sans erreur)."""
+    res = {}
+    for page in sorted({p for p, _, _ in mesures}):
+        ok = [d for p, d, e in mesures if p == page and e is None]
+        res[page] = {
+            "n": len(ok),
+            "erreurs": sum(1 for p, _, e in mesures if p == page and e is not None),
+            "p50": float(np.percentile(ok, 50)) if ok else None,
+            "p95": float(np.percentile(ok, 95)) if ok else None,
+            "total": float(sum(ok)),
+        }
+    return res
+
+
+def _ms(v):
+    return f"{v:9.1f}" if v is not None else f"{'—':>9s}"
+
+
+def afficher(res, repetitions, ref=None):
+    """
+    Tableau par page ; avec ref (résumé JSON d’une autre version), écarts de p50 et
+    du total par répétition (les deux rejeux peuvent avoir un -r différent).
+    """
+    entete = f"{'page':22s} {'n':>5s} {'err':>4s} {'p50 [ms]':>9s} {'p95 [ms]':>9s} {'total/rép. [ms]':>15s}"
+    print(entete + ("   Δ p50  Δ total/rép." if ref else ""))
+    pages_ref = (ref or {}).get("pages", {})
+    rep_ref = (ref or {}).get("repetitions", 1)
+    ecarts_n = []
+    for page, r in res.items():
+        total = r["total"] / repetitions
+        ligne = f"{page:22s} {r['n']:5d} {r['erreurs']:4d} {_ms(r['p50'])} {_ms(r['p95'])} {total:15.1f}"
+        a = pages_ref.get(page)
+        if a and a["p50"] and r["p50"]:
+            ligne += f"  {r['p50'] / a['p50'] - 1:+7.0%}  {total / (a['total'] / rep_ref) - 1:+11.0%}"
+            if r["n"] * rep_ref != a["n"] * repetitions:
+                ecarts_n.append(page)
+        print(ligne)
+    total = sum(r["total"] for r in res.values()) / repetitions
+    ligne = f"{'total':22s} {sum(r['n'] for r in res.values()):5d} {sum(r['erreurs'] for r in res.values()):4d} " \
+            f"{'':9s} {'':9s} {total:15.1f}"
+    if ref:
+        total_ref = sum(r["total"] for p, r in pages_ref.items() if p in res) / rep_ref
+        if total_ref:
+            ligne += f"  {'':7s}  {total / total_ref - 1:+11.0%}"
+    print(ligne)
+    if ecarts_n:
+        print(f"\n⚠️ nombre de reruns par répétition différent de la référence ({', '.join(ecarts_n)}) : "
+              "traces ou erreurs différentes, écarts de total indicatifs.")
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    p.add_argument("traces", nargs="+", help="fichiers .jsonl (modules.enregistrement)")
+    p.add_argument("-r", "--repetitions", type=int, default=1, help="nombre de rejeux de l’ensemble des traces")
+    p.add_argument("--vitesse", type=float, default=0.0,
+                   help="0 : enchaîné sans pause (défaut) ; 1 : temps réel ; 2 : deux fois plus vite…")
+    p.add_argument("--url", default=None, help="serveur déjà lancé (défaut : un serveur est démarré)")
+    p.add_argument("--json", default=None, help="écrit le résumé par page (référence pour --comparer)")
+    p.add_argument("--comparer", default=None, help="résumé JSON d’une autre version : affiche les écarts")
+    a = p.parse_args(argv)
+
+    traces = [lire(t) for t in a.traces]
+    n_ev = sum(len(ev) for _, ev in traces)
+    print(f"{len(traces)} traces, {n_ev} événements, {a.repetitions} répétition(s)")
+
+    rss = None
+    if a.url:
+        mesures, ignorees, duree_s = asyncio.run(rejeu(a.url, traces, a.repetitions, a.vitesse))
+    else:
+        with Serveur() as srv:
+            asyncio.run(rejeu(srv.url, traces[:1], 1, 0.0))        # hors mesure : serveur chaud
+            mesures, ignorees, duree_s = asyncio.run(rejeu(srv.url, traces, a.repetitions, a.vitesse))
+            rss = rss_mo(srv.pid)
+
+    res = resume(mesures)
+    ref = None
+    if a.comparer:
+        with open(a.comparer, encoding="utf-8") as f:
+            ref = json.load(f)
+    print(f"{len(mesures)} reruns en {duree_s:.1f} s" + (f", RSS serveur {rss:.0f} Mo" if rss else "") + "\n")
+    afficher(res, a.repetitions, ref)
+    if ignorees:
+        print(f"\nclés sans widget (état dérivé), ignorées : {', '.join(sorted(ignorees))}")
+    erreurs = {e for _, _, e in mesures if e is not None}
+    for e in sorted(erreurs):
+        print(f"⚠️ {e}")
+
+    if a.json:
+        with open(a.json, "w", encoding="utf-8") as f:
+            json.dump({"traces": a.traces, "repetitions": a.repetitions, "pages": res}, f,
+                      ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,32 +1,14 @@
 import streamlit as st
 
-def show():
-    st.markdown("<h1 style='text-align: center;'>Études Structure</h1>", unsafe_allow_html=True)
-
-    base_url = "https://raw.githubusercontent.com/LLE4000/Etudes-structure/main/assets"
+from modules.logos import css_logos
+from modules.styles import inclure
 
-    # Style CSS pour cartes
-    st.markdown("""
-        <style>
-        .tool-card {
-            background-color: #ffffff;
-            border-radius: 12px;
-            padding: 15px;
-            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.05);
-            transition: 0.3s;
-        }
-        .tool-card:hover {
-            box-shadow: 0 4px 16px rgba(0, 0, 0, 0.1);
-            transform: translateY(-3px);
-        }
-        .tool-container {
-            background-color: #f9f9f9;
-            border-radius: 15px;
-            padding: 20px 10px;
-            margin-bottom: 30px;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+def show():
+    inclure("accueil.css")
+    # logos locaux : une planche en data URI, préparée une fois par processus
+    style_logos, rang_logo = css_logos()
+    st.markdown(style_logos, unsafe_allow_html=True)
+    st.markdown("<h1 class='titre-accueil'>Études Structure</h1>", unsafe_allow_html=True)
 
     def render_section(titre_html, tools, cols_per_row=5):
         st.markdown(f"<div class='tool-container'>{titre_html}", unsafe_allow_html=True)
@@ -38,14 +20,9 @@ def show():
             for j, tool in enumerate(ligne_tools):
                 with cols[j]:
                     st.markdown(
-                        f"""
-                        <div class="tool-card" style="text-align: center;">
-                            <a href="?page={tool['page']}" target="_self" style="text-decoration: none;">
-                                <img src="{base_url}/{tool['image']}" style="width: 100px; height: 100px; margin-bottom: 8px;" />
-                                <div style="font-size: 16px; color: black;">{tool['label']}</div>
-                            </a>
-                        </div>
-                        """,
+                        f"<div class='tool-card'><a href='?page={tool['page']}' target='_self'>"
+                        f"<div class='logo logo-{rang_logo[tool['image']]}' role='img' aria-label='{tool['label']}'></div>"
+                        f"<div class='tool-label'>{tool['label']}</div></a></div>",
                         unsafe_allow_html=True
                     )
 
@@ -3,6 +3,9 @@ import numpy as np
 import matplotlib.pyplot as plt
 import math
 
+from modules.cache import cache
+from modules.ui import png
+
 # ==============================
 # Utilitaires EC2 + Température
 # ==============================
@@ -88,6 +91,29 @@ def t_equivalent_for_target_with_T(fck28: float, s: float, target_MPa: float,
         return None
     return 0.5 * (lo + hi)
 
+@cache()
+def graphe_fck(T_celsius, titre, traces):
+    """
+    Graphe fck(t) en PNG, mis en cache (le rendu matplotlib domine le rerun).
+    traces, dans l'ordre du tracé : ("courbe", label, fck28, s), ("v" | "h", position, style, label, alpha).
+    """
+    t_real = np.linspace(1, 40, 500)
+    t_equiv = age_equiv_arrhenius(t_real, T_celsius)   # transforme en âge équivalent
+    fig, ax = plt.subplots(figsize=(8, 5))
+    for tr in traces:
+        if tr[0] == "courbe":
+            _, label, fck28, s = tr
+            ax.plot(t_real, fck_of_age_equiv(fck28, s, t_equiv), label=label, linewidth=2)
+        else:
+            genre, pos, style, label, alpha = tr
+            (ax.axvline if genre == "v" else ax.axhline)(pos, linestyle=style, alpha=alpha, label=label)
+    ax.set_xlabel("Âge du béton (jours réels)")
+    ax.set_ylabel("Résistance fck(t) [MPa]")
+    ax.set_title(titre)
+    ax.grid(True)
+    ax.legend()
+    return png(fig)
+
 # ==============================
 # Page
 # ==============================
@@ -140,10 +166,7 @@ def show():
         )
 
     # --------- Courbe de référence (dépend de T)
-    # Axe en jours RÉELS (ce que tu manipules dans l'UI)
-    t_real = np.linspace(1, 40, 500)
-    t_equiv_curve = age_equiv_arrhenius(t_real, temperature_c)   # transforme en âge équivalent
-    fck_curve_ref = fck_of_age_equiv(fck28_ref, s_ref, t_equiv_curve)
+    # Axe en jours RÉELS (ce que tu manipules dans l'UI) : tracé par graphe_fck
 
     # Éventuelle estimation d'âge (réel) depuis une mesure à la même T
     estimated_age_real = None
@@ -154,17 +177,16 @@ def show():
             T_celsius=temperature_c, tmax=90.0
         )
 
-    # --------- Graphe (colonne droite)
-    with col_d:
-        fig, ax = plt.subplots(figsize=(8, 5))
-        ax.plot(t_real, fck_curve_ref, label=f"{beton_label} ({type_ciment})", linewidth=2)
-        ax.axvline(x=t_selected_real, linestyle='--', label=f"{t_selected_real} j")
-        ax.axhline(y=fck_val, linestyle='--', label=f"fck = {fck_val:.2f} MPa")
-
-        if res_mesuree > 0:
-            ax.axhline(y=res_mesuree, linestyle=':', label=f"Mesure {res_mesuree:.2f} MPa")
-            if estimated_age_real:
-                ax.axvline(x=estimated_age_real, linestyle=':', label=f"Âge estimé {estimated_age_real:.1f} j")
+    # --------- Graphe (colonne droite) : tracés collectés, rendu unique en fin de page
+    traces = [
+        ("courbe", f"{beton_label} ({type_ciment})", fck28_ref, s_ref),
+        ("v", t_selected_real, "--", f"{t_selected_real} j", None),
+        ("h", fck_val, "--", f"fck = {fck_val:.2f} MPa", None),
+    ]
+    if res_mesuree > 0:
+        traces.append(("h", res_mesuree, ":", f"Mesure {res_mesuree:.2f} MPa", None))
+        if estimated_age_real:
+            traces.append(("v", estimated_age_real, ":", f"Âge estimé {estimated_age_real:.1f} j", None))
 
     # --------- COMPARATEUR (UNE SEULE CLASSE)
     with col_g:
@@ -195,21 +217,14 @@ def show():
             st.warning(f"{alt_label} n’atteint pas {target:.2f} MPa (≤ fck(28) = {fck28_alt} MPa) aux conditions choisies.")
 
         # Ajoute la courbe comparée côté graphe (même température)
-        with col_d:
-            fck_curve_alt = fck_of_age_equiv(fck28_alt, s_alt, age_equiv_arrhenius(t_real, temperature_c))
-            ax.plot(t_real, fck_curve_alt, label=f"{alt_label} ({type_ciment_alt})", linewidth=2)
-            if t_eq_real is not None:
-                ax.axvline(x=t_eq_real, linestyle='--', alpha=0.8, label=f"t_eq {alt_label} ≈ {t_eq_real:.1f} j")
+        traces.append(("courbe", f"{alt_label} ({type_ciment_alt})", fck28_alt, s_alt))
+        if t_eq_real is not None:
+            traces.append(("v", t_eq_real, "--", f"t_eq {alt_label} ≈ {t_eq_real:.1f} j", 0.8))
 
     # --------- Finalisation graphe
-    ax.set_xlabel("Âge du béton (jours réels)")
-    ax.set_ylabel("Résistance fck(t) [MPa]")
-    ax.set_title(f"Évolution de la résistance — {beton_label} — {type_ciment} — {temperature_c:.1f} °C")
-    ax.grid(True)
-    ax.legend()
-
+    titre = f"Évolution de la résistance — {beton_label} — {type_ciment} — {temperature_c:.1f} °C"
     with col_d:
-        st.pyplot(fig)
+        st.image(graphe_fck(float(temperature_c), titre, tuple(traces)), width="stretch")
 
     # --------- Bloc court “Référence”
     with col_g:
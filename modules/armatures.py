@@ -0,0 +1,122 @@
+# modules/armatures.py
+"""
+Barres d’armature : diamètres courants et tableau des sections.
+
+Liste de diamètres commune aux pages (poutre, tableau des armatures) ;
+le tableau est calculé (numpy) plutôt que stocké en image :
+  - n barres (1 à 10) : section totale [mm²], ou par mètre pour un espacement de 100/n cm ;
+  - masse linéique [kg/m] (acier 7860 kg/m³) ;
+  - section par mètre [mm²/m] pour des espacements fixés [cm].
+"""
+import numpy as np
+import pandas as pd
+
+from modules.cache import cache
+
+DIAMETRES = (6, 8, 10, 12, 14, 16, 20, 25, 28, 30, 32, 40)   # mm
+DIAM_ETRIERS = (6, 8, 10, 12)                                 # mm
+NB_BARRES = tuple(range(1, 11))
+ESPACEMENTS = (15, 30, 35, 40)                                # cm
+RHO_ACIER = 7860.0                                            # kg/m³
+
+
+def aire_barre(diam):
+    """Section d’une barre [mm²] (diamètre en mm, scalaire ou tableau)."""
+    return np.pi * (np.asarray(diam, dtype=float) / 2.0) ** 2
+
+
+def masse_lineique(diam):
+    """Masse d’une barre [kg/m]."""
+    return aire_barre(diam) * 1e-6 * RHO_ACIER
+
+
+def aire_par_metre(diam, espacement_cm):
+    """Section par mètre de largeur [mm²/m] pour un espacement en cm."""
+    return aire_barre(diam) * 100.0 / np.asarray(espacement_cm, dtype=float)
+
+
+def _fr(x, dec=1):
+    return f"{x:.{dec}f}".replace(".", ",")
+
+
+def tableau_sections(diametres=DIAMETRES, nb_barres=NB_BARRES, espacements=ESPACEMENTS):
+    """
+    Tableau des sections (une ligne par Ø) : colonnes « n (e=…) » en mm²,
+    « poids [kg/m] » et « e=… cm » en mm²/m.
+    """
+    d = np.asarray(diametres, dtype=float)
+    n = np.asarray(nb_barres, dtype=float)
+    e = np.asarray(espacements, dtype=float)
+    A = aire_barre(d)
+
+    df = pd.DataFrame({"Ø [mm]": np.asarray(diametres, dtype=int)})
+    barres = np.outer(A, n)
+    for j, nb in enumerate(nb_barres):
+        df[f"{nb} (e={_fr(100.0 / nb)})"] = barres[:, j]
+    df["poids [kg/m]"] = masse_lineique(d)
+    par_m = A[:, None] * 100.0 / e[None, :]
+    for j, esp in enumerate(espacements):
+        df[f"e={esp:g} cm"] = par_m[:, j]
+    return df
+
+
+# ---------- Recherche inverse : As requise → dispositions ----------
+N_MIN_POUTRE, N_MAX_POUTRE = 2, 12
+ESPACEMENTS_DALLE = (7.5, 10, 12.5, 15, 17.5, 20, 22.5, 25, 30, 35, 40)   # cm
+
+
+@cache(copie=False)
+def index_dispositions(type_="poutre"):
+    """
+    Index trié de toutes les dispositions : Ø × n (poutre, As en mm²) ou
+    Ø / espacement (dalle, As en mm²/m). Tableaux en lecture seule, triés par As
+    croissante puis par nombre de barres (poutre) ou espacement décroissant (dalle).
+    La masse d’acier (kg/m ou kg/m²) vaut As · ρ · 1e-6 : l’ordre de As est aussi celui de la masse.
+    """
+    d = np.asarray(DIAMETRES, dtype=float)
+    if type_ == "poutre":
+        p = np.arange(N_MIN_POUTRE, N_MAX_POUTRE + 1, dtype=float)
+        dd, pp = np.meshgrid(d, p, indexing="ij")
+        As = pp * aire_barre(dd)
+        ordre = np.lexsort((pp.ravel(), As.ravel()))
+    elif type_ == "dalle":
+        p = np.asarray(ESPACEMENTS_DALLE, dtype=float)
+        dd, pp = np.meshgrid(d, p, indexing="ij")
+        As = aire_par_metre(dd, pp)
+        ordre = np.lexsort((-pp.ravel(), As.ravel()))
+    else:
+        raise ValueError(f"Type inconnu : {type_!r} (poutre ou dalle)")
+    index = {
+        "As": As.ravel()[ordre],
+        "diam": dd.ravel()[ordre].astype(int),
+        "param": pp.ravel()[ordre],
+    }
+    for v in index.values():
+        v.setflags(write=False)
+    return index
+
+
+def dispositions(As_min, type_="poutre", As_max=None, largeur_mm=None, limite=None):
+    """
+    Dispositions avec As ≥ As_min (et ≤ As_max), triées par masse d’acier croissante.
+    Recherche dichotomique dans index_dispositions(type_).
+    largeur_mm (poutre) : ne garde que les n barres qui tiennent dans la largeur utile,
+    avec un espacement libre ≥ max(Ø, 20 mm).
+    """
+    idx = index_dispositions(type_)
+    As = idx["As"]
+    i = int(np.searchsorted(As, As_min, side="left"))
+    j = len(As) if As_max is None else int(np.searchsorted(As, As_max, side="right"))
+    sel = slice(i, max(i, j))
+    diam, param, As_sel = idx["diam"][sel], idx["param"][sel], As[sel]
+
+    if type_ == "poutre":
+        if largeur_mm is not None:
+            garde = param * diam + (param - 1) * np.maximum(diam, 20) <= largeur_mm
+            diam, param, As_sel = diam[garde], param[garde], As_sel[garde]
+        df = pd.DataFrame({"n": param.astype(int), "Ø [mm]": diam, "As [mm²]": As_sel,
+                           "masse [kg/m]": As_sel * 1e-6 * RHO_ACIER})
+    else:
+        df = pd.DataFrame({"Ø [mm]": diam, "e [cm]": param, "As [mm²/m]": As_sel,
+                           "masse [kg/m²]": As_sel * 1e-6 * RHO_ACIER})
+    return df.head(limite) if limite else df
@@ -0,0 +1,405 @@
+# modules/cache.py
+"""
+Couche de cache commune aux calculs et aux catalogues.
+
+Chaque fonction décorée par @cache("nom") a son propre cache borné, réglé
+dans cache_config.json (un seul fichier pour toute l’application) :
+  - max_entrees : nombre d’entrées (éviction LRU) ;
+  - ttl_s       : durée de vie d’une entrée en secondes (null = illimitée) ;
+  - memoire_mo  : budget mémoire du cache ;
+et memoire_totale_mo borne l’ensemble des caches (éviction de l’entrée la
+moins récemment utilisée, tous caches confondus).
+
+copie=True (défaut, comme st.cache_data) : le résultat est stocké sérialisé
+(pickle) et chaque appel reçoit sa propre copie. copie=False (comme
+st.cache_resource) : l’objet est partagé tel quel entre sessions.
+Les compteurs (succès, échecs, évictions, expirations) sont lus par statistiques().
+
+disque=True ajoute un second niveau persistant (section "disque" de la config) :
+un fichier par résultat, adressé par le hachage des arguments, de la version du
+code (source du module de la fonction + version globale) et du contenu des
+fichiers de données déclarés. Écriture atomique (fichier temporaire puis
+os.replace) : plusieurs processus serveur peuvent partager le dossier.
+Éviction par taille totale, la moins récemment lue d’abord. Après un
+redémarrage, les résultats déjà calculés sont relus sans recalcul.
+"""
+import functools
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+
+import numpy as np
+
+from modules import metriques
+from modules.profilage import releve
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CONFIG = os.path.join(RACINE, "cache_config.json")
+
+DEFAUT = {"max_entrees": 64, "ttl_s": None, "memoire_mo": 64}
+MEMOIRE_TOTALE_MO = 512
+DISQUE = {"dossier": ".cache/resultats", "taille_max_mo": 1024, "version": 1}
+
+_MO = 1024 * 1024
+_verrou = threading.RLock()
+_caches = {}    # nom -> _Cache
+_en_cours = {}  # (nom, clé) -> (thread, threading.Event) : calculs en cours
+
+
+def charger_config(chemin=CONFIG):
+    """Réglages {"defaut", "memoire_totale_mo", "caches": {nom: réglages}} (valeurs par défaut si absent)."""
+    try:
+        with open(chemin, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        data = {}
+    return {
+        "defaut": {**DEFAUT, **data.get("defaut", {})},
+        "memoire_totale_mo": data.get("memoire_totale_mo", MEMOIRE_TOTALE_MO),
+        "caches": data.get("caches", {}),
+        "disque": {**DISQUE, **data.get("disque", {})},
+    }
+
+
+_config = charger_config()
+
+
+def reglages(nom):
+    return {**_config["defaut"], **_config["caches"].get(nom, {})}
+
+
+def taille(obj, _vus=None):
+    """Estimation de l’empreinte mémoire d’un objet [octets] (numpy, pandas, conteneurs)."""
+    _vus = set() if _vus is None else _vus
+    if id(obj) in _vus:
+        return 0
+    _vus.add(id(obj))
+    if isinstance(obj, np.ndarray):
+        n = obj.nbytes
+        if obj.dtype == object:
+            n += sum(taille(v, _vus) for v in obj.ravel())
+        return n
+    if hasattr(obj, "memory_usage") and hasattr(obj, "columns"):
+        return int(obj.memory_usage(deep=True).sum())
+    n = sys.getsizeof(obj)
+    if isinstance(obj, Mapping):
+        n += sum(taille(k, _vus) + taille(v, _vus) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        n += sum(taille(v, _vus) for v in obj)
+    elif hasattr(obj, "__dict__"):
+        n += taille(vars(obj), _vus)
+    return n
+
+
+def empreinte(obj):
+    """Hachage du contenu sérialisé (pickle) d’un objet : tableaux et DataFrames compris."""
+    brut = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    return hashlib.blake2b(brut, digest_size=16).hexdigest()
+
+
+def _cle(args, kwargs):
+    return empreinte((args, sorted(kwargs.items())))
+
+
+class _Cache:
+    def __init__(self, nom, copie):
+        self.nom = nom
+        self.copie = copie
+        r = reglages(nom)
+        self.max_entrees = r["max_entrees"]
+        self.ttl = r["ttl_s"]
+        self.budget = None if r["memoire_mo"] is None else r["memoire_mo"] * _MO
+        self.entrees = OrderedDict()   # clé -> (valeur, octets, date de création, dernier accès)
+        self.octets = 0
+        self.compteurs = {"succes": 0, "echecs": 0, "evictions": 0, "expirations": 0,
+                          "disque": 0, "ecrits_disque": 0}
+
+    def lire(self, cle):
+        e = self.entrees.get(cle)
+        if e is None:
+            self.compteurs["echecs"] += 1
+            return False, None
+        valeur, octets, cree, _ = e
+        if self.ttl is not None and time.monotonic() - cree > self.ttl:
+            self._retirer(cle)
+            self.compteurs["expirations"] += 1
+            self.compteurs["echecs"] += 1
+            return False, None
+        self.entrees[cle] = (valeur, octets, cree, time.monotonic())
+        self.entrees.move_to_end(cle)
+        self.compteurs["succes"] += 1
+        return True, pickle.loads(valeur) if self.copie else valeur
+
+    def ecrire(self, cle, resultat):
+        if self.copie:
+            valeur = pickle.dumps(resultat, protocol=pickle.HIGHEST_PROTOCOL)
+            octets = len(valeur)
+        else:
+            valeur, octets = resultat, taille(resultat)
+        if self.budget is not None and octets > self.budget:
+            return                                   # trop gros pour ce cache : non conservé
+        if cle in self.entrees:
+            self._retirer(cle)
+        maintenant = time.monotonic()
+        self.entrees[cle] = (valeur, octets, maintenant, maintenant)
+        self.octets += octets
+        while self.entrees and (
+            (self.max_entrees is not None and len(self.entrees) > self.max_entrees)
+            or (self.budget is not None and self.octets > self.budget)
+        ):
+            self.evincer()
+
+    def evincer(self):
+        cle = next(iter(self.entrees))
+        self._retirer(cle)
+        self.compteurs["evictions"] += 1
+
+    def plus_ancien(self):
+        """Date du dernier accès de l’entrée LRU (None si vide)."""
+        return next(iter(self.entrees.values()))[3] if self.entrees else None
+
+    def _retirer(self, cle):
+        self.octets -= self.entrees.pop(cle)[1]
+
+    def vider(self):
+        self.entrees.clear()
+        self.octets = 0
+
+
+def _budget_global():
+    """Évince l’entrée la moins récemment utilisée, tous caches confondus, tant que le total dépasse le budget."""
+    limite = _config["memoire_totale_mo"]
+    if limite is None:
+        return
+    while sum(c.octets for c in _caches.values()) > limite * _MO:
+        pleins = [c for c in _caches.values() if c.entrees]
+        if not pleins:
+            return
+        min(pleins, key=lambda c: c.plus_ancien()).evincer()
+
+
+def _empreinte_fichier(chemin, _memo={}):
+    """Hachage du contenu d’un fichier, recalculé seulement si sa taille ou sa date change."""
+    try:
+        s = os.stat(chemin)
+    except FileNotFoundError:
+        return "absent"
+    signature = (s.st_size, s.st_mtime_ns)
+    connu = _memo.get(chemin)
+    if connu is None or connu[0] != signature:
+        with open(chemin, "rb") as f:
+            connu = (signature, hashlib.blake2b(f.read(), digest_size=16).hexdigest())
+        _memo[chemin] = connu
+    return connu[1]
+
+
+class _Disque:
+    """Niveau persistant d’un cache : <dossier>/<nom>/<2 car.>/<clé>.pkl."""
+
+    TMP_PERIME_S = 3600     # fichiers temporaires orphelins (processus interrompu)
+
+    def __init__(self, nom, fn, fichiers):
+        self.nom = nom
+        r = _config["disque"]
+        self.dossier = os.path.join(RACINE, r["dossier"])
+        source = inspect.getsourcefile(fn)
+        self.version_code = f'{r["version"]}:{_empreinte_fichier(source) if source else fn.__qualname__}'
+        self.fichiers = tuple(os.path.join(RACINE, f) for f in fichiers)
+
+    def _chemin(self, cle):
+        donnees = ",".join(_empreinte_fichier(f) for f in self.fichiers)
+        h = hashlib.blake2b(f"{self.nom}|{self.version_code}|{donnees}|{cle}".encode(), digest_size=20).hexdigest()
+        return os.path.join(self.dossier, self.nom, h[:2], h + ".pkl")
+
+    def lire(self, cle):
+        chemin = self._chemin(cle)
+        try:
+            with open(chemin, "rb") as f:
+                valeur = pickle.load(f)
+        except FileNotFoundError:
+            return False, None
+        except Exception:                            # fichier illisible : supprimé, recalcul
+            _supprimer(chemin)
+            return False, None
+        try:
+            os.utime(chemin)                         # date d’accès pour l’éviction LRU
+        except OSError:
+            pass
+        return True, valeur
+
+    def ecrire(self, cle, resultat):
+        """Écrit le résultat ; renvoie le nombre d’octets écrits (0 si non sérialisable)."""
+        chemin = self._chemin(cle)
+        os.makedirs(os.path.dirname(chemin), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(chemin), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(resultat, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, chemin)
+        except Exception:
+            _supprimer(tmp)
+            return 0
+        return os.path.getsize(chemin)
+
+
+def _supprimer(chemin):
+    try:
+        os.remove(chemin)
+    except OSError:
+        pass
+
+
+_ecrits_disque = {"octets": 0, "balaye": False}
+
+
+def _fichiers_disque(dossier):
+    """(chemin, octets, date d’accès) de tous les fichiers du cache disque."""
+    res = []
+    for racine, _, noms in os.walk(dossier):
+        for n in noms:
+            chemin = os.path.join(racine, n)
+            try:
+                s = os.stat(chemin)
+            except FileNotFoundError:
+                continue                             # supprimé par un autre processus
+            res.append((chemin, s.st_size, s.st_mtime))
+    return res
+
+
+def evincer_disque(force=False):
+    """
+    Ramène le cache disque sous 90 % de taille_max_mo (les moins récemment lus d’abord)
+    et supprime les fichiers temporaires orphelins. Sans force, le dossier n’est
+    parcouru qu’au premier écrit du processus puis tous les 10 % de la limite écrits.
+    """
+    r = _config["disque"]
+    if r["taille_max_mo"] is None:
+        return
+    limite = r["taille_max_mo"] * _MO
+    with _verrou:
+        if not force and _ecrits_disque["balaye"] and _ecrits_disque["octets"] < 0.1 * limite:
+            return
+        _ecrits_disque.update(octets=0, balaye=True)
+    maintenant = time.time()
+    fichiers = []
+    for chemin, octets, date in _fichiers_disque(os.path.join(RACINE, r["dossier"])):
+        if chemin.endswith(".tmp"):
+            if maintenant - date > _Disque.TMP_PERIME_S:
+                _supprimer(chemin)
+        else:
+            fichiers.append((date, octets, chemin))
+    total = sum(o for _, o, _ in fichiers)
+    for _, octets, chemin in sorted(fichiers):
+        if total <= 0.9 * limite:
+            break
+        _supprimer(chemin)
+        total -= octets
+
+
+def cache(nom=None, copie=True, disque=False, fichiers=()):
+    """
+    Décorateur : mémoïse fn dans le cache nom (défaut : nom de la fonction),
+    réglé par cache_config.json. Arguments : tout objet sérialisable (pickle).
+    disque=True : résultats aussi conservés sur disque (voir l’en-tête du module) ;
+    fichiers : fichiers (données ou modules de calcul appelés, chemins depuis la
+    racine) dont le contenu entre dans la clé disque.
+    """
+    def deco(fn):
+        c = _Cache(nom or fn.__name__, copie)
+        d = _Disque(c.nom, fn, fichiers) if disque else None
+        with _verrou:
+            _caches[c.nom] = c     # une redéfinition (rechargement du module) repart d’un cache vide
+
+        def calculer(cle, args, kwargs):
+            """
+            (résultat, source) : "memoire", "disque" ou "calcul".
+            Un seul calcul par clé à la fois : les autres threads attendent son résultat.
+            """
+            while True:
+                with _verrou:
+                    trouve, valeur = c.lire(cle)
+                    if trouve:
+                        return valeur, "memoire"
+                    autre = _en_cours.get((c.nom, cle))
+                    if autre is None or autre[0] is threading.current_thread():
+                        fin = threading.Event()
+                        _en_cours[(c.nom, cle)] = (threading.current_thread(), fin)
+                        break
+                autre[1].wait()          # puis relecture (résultat trop gros ou calcul en erreur : recalcul)
+            try:
+                return _calculer(cle, args, kwargs)
+            finally:
+                with _verrou:
+                    _en_cours.pop((c.nom, cle), None)
+                fin.set()
+
+        def _calculer(cle, args, kwargs):
+            trouve, source = False, "calcul"
+            if d is not None:
+                trouve, resultat = d.lire(cle)
+                if trouve:
+                    source = "disque"
+                    with _verrou:
+                        c.compteurs["disque"] += 1
+            if not trouve:
+                r = releve()
+                resultat = fn(*args, **kwargs) if r is None else r.chrono("noyau", c.nom, fn, *args, **kwargs)
+                if d is not None:
+                    octets = d.ecrire(cle, resultat)
+                    with _verrou:
+                        c.compteurs["ecrits_disque"] += 1 if octets else 0
+                        _ecrits_disque["octets"] += octets
+                    evincer_disque()
+            with _verrou:
+                c.ecrire(cle, resultat)
+                _budget_global()
+            return resultat, source
+
+        @functools.wraps(fn)
+        def appel(*args, **kwargs):
+            cle = _cle(args, kwargs)
+            t0 = time.perf_counter()
+            resultat, source = calculer(cle, args, kwargs)
+            if source != "memoire":      # succès mémoire (µs) non journalisés
+                metriques.noter("noyau", c.nom, (time.perf_counter() - t0) * 1000.0, cle, source)
+            return resultat
+
+        appel.vider = lambda: _vider(c)
+        appel.cache = c
+        return appel
+    return deco
+
+
+def _vider(c):
+    with _verrou:
+        c.vider()
+
+
+def vider(nom=None):
+    """Vide un cache, ou tous si nom est None."""
+    with _verrou:
+        for c in _caches.values():
+            if nom is None or c.nom == nom:
+                c.vider()
+
+
+def statistiques():
+    """Une ligne par cache : entrées, mémoire, réglages et compteurs."""
+    with _verrou:
+        return [
+            {
+                "cache": c.nom, "entrées": len(c.entrees), "mémoire [Mo]": c.octets / _MO,
+                "max_entrees": c.max_entrees, "ttl_s": c.ttl,
+                "budget [Mo]": None if c.budget is None else c.budget / _MO,
+                **c.compteurs,
+            }
+            for c in _caches.values()
+        ]
@@ -0,0 +1,36 @@
+# modules/catalogues.py
+"""
+Catalogues de référence partagés par toutes les sessions.
+
+Un catalogue (profilés, classes de béton, cornières…) est chargé une seule
+fois par processus (modules.cache, copie=False : même objet pour tous les
+utilisateurs, sans copie par appel contrairement à st.cache_data), puis figé : dicts en
+MappingProxyType, listes en tuples, tableaux numpy en lecture seule. Une
+modification accidentelle lève une erreur au lieu de polluer les autres sessions.
+"""
+import functools
+from collections.abc import Mapping
+from types import MappingProxyType
+
+import numpy as np
+
+from modules.cache import cache
+
+
+def figer(obj):
+    """Copie en lecture seule (récursive) de dicts / listes / tableaux numpy."""
+    if isinstance(obj, Mapping):
+        return MappingProxyType({k: figer(v) for k, v in obj.items()})
+    if isinstance(obj, (list, tuple)):
+        return tuple(figer(v) for v in obj)
+    if isinstance(obj, np.ndarray):
+        obj.setflags(write=False)
+    return obj
+
+
+def catalogue(fn):
+    """Décorateur : chargeur mis en cache par processus (modules.cache, sans copie), résultat figé."""
+    @functools.wraps(fn)
+    def charger(*args, **kwargs):
+        return figer(fn(*args, **kwargs))
+    return cache(fn.__name__, copie=False)(charger)
@@ -3,8 +3,11 @@ import json
 import math
 import pandas as pd
 
-# ---------- Chargement / nettoyage des profils ----------
-@st.cache_data
+from modules.catalogues import catalogue
+from modules.ui import selectbox_recherche
+
+# ---------- Chargement / nettoyage des profils (catalogue partagé, lecture seule) ----------
+@catalogue
 def load_profiles():
     def pick(d, *keys, default=None):
         for k in keys:
@@ -137,7 +140,8 @@ def show():
 
         noms = df.index.tolist()
         default_idx = noms.index(best_name) if best_name in noms else 0
-        nom_selectionne = st.selectbox("Sélectionner un profilé :", options=noms, index=default_idx)
+        nom_selectionne = selectbox_recherche("Sélectionner un profilé :", noms, key="profil_selectionne",
+                                              defaut=noms[default_idx])
 
         def _row_style(row):
             u = row["Utilisation [%]"]
@@ -2,6 +2,60 @@
 import math
 import streamlit as st
 
+from modules.catalogues import figer
+from modules.ui import selectbox_recherche
+
+
+# ----------------------------
+# Données cornières standards (extrait – complète au besoin), partagées en lecture seule
+# format: "A x B x t (mm)": {"A":..., "B":..., "t":..., "kg_m": ...}
+ANGLES_STD = figer({
+    # égales
+    "15x15x3": {"A": 15, "B": 15, "t": 3, "kg_m": 0.70},
+    "20x20x3": {"A": 20, "B": 20, "t": 3, "kg_m": 0.90},
+    "25x25x3": {"A": 25, "B": 25, "t": 3, "kg_m": 1.14},
+    "25x25x4": {"A": 25, "B": 25, "t": 4, "kg_m": 1.48},
+    "30x30x3": {"A": 30, "B": 30, "t": 3, "kg_m": 1.39},
+    "30x30x4": {"A": 30, "B": 30, "t": 4, "kg_m": 1.81},
+    "30x30x5": {"A": 30, "B": 30, "t": 5, "kg_m": 2.22},
+    "35x35x4": {"A": 35, "B": 35, "t": 4, "kg_m": 2.13},
+    "40x40x4": {"A": 40, "B": 40, "t": 4, "kg_m": 2.46},
+    "40x40x5": {"A": 40, "B": 40, "t": 5, "kg_m": 3.03},
+    "40x40x6": {"A": 40, "B": 40, "t": 6, "kg_m": 3.58},
+    "45x45x5": {"A": 45, "B": 45, "t": 5, "kg_m": 3.44},
+    "50x50x5": {"A": 50, "B": 50, "t": 5, "kg_m": 3.84},
+    "50x50x6": {"A": 50, "B": 50, "t": 6, "kg_m": 4.57},
+    "50x50x8": {"A": 50, "B": 50, "t": 8, "kg_m": 5.93},
+    "60x60x6": {"A": 60, "B": 60, "t": 6, "kg_m": 5.53},
+    "60x60x8": {"A": 60, "B": 60, "t": 8, "kg_m": 7.22},
+    "70x70x7": {"A": 70, "B": 70, "t": 7, "kg_m": 7.52},
+    "80x80x8": {"A": 80, "B": 80, "t": 8, "kg_m": 9.81},
+    "80x80x10": {"A": 80, "B": 80, "t": 10, "kg_m": 12.09},
+    "80x80x12": {"A": 80, "B": 80, "t": 12, "kg_m": 14.29},
+    "90x90x9": {"A": 90, "B": 90, "t": 9, "kg_m": 12.42},
+    # inégales et autres tailles
+    "100x100x10": {"A": 100, "B": 100, "t": 10, "kg_m": 15.32},
+    "100x100x12": {"A": 100, "B": 100, "t": 12, "kg_m": 18.17},
+    "120x120x10": {"A": 120, "B": 120, "t": 10, "kg_m": 18.55},
+    "120x120x12": {"A": 120, "B": 120, "t": 12, "kg_m": 22.03},
+    "120x120x15": {"A": 120, "B": 120, "t": 15, "kg_m": 27.15},
+    "150x150x10": {"A": 150, "B": 150, "t": 10, "kg_m": 23.42},
+    "150x150x12": {"A": 150, "B": 150, "t": 12, "kg_m": 27.87},
+    "150x150x15": {"A": 150, "B": 150, "t": 15, "kg_m": 34.42},
+    "200x200x20": {"A": 200, "B": 200, "t": 20, "kg_m": 61.08},
+    "40x20x4": {"A": 40, "B": 20, "t": 4, "kg_m": 1.80},
+    "40x25x4": {"A": 40, "B": 25, "t": 4, "kg_m": 1.97},
+    "50x30x5": {"A": 50, "B": 30, "t": 5, "kg_m": 3.02},
+    "60x40x6": {"A": 60, "B": 40, "t": 6, "kg_m": 4.55},
+    "70x50x6": {"A": 70, "B": 50, "t": 6, "kg_m": 5.51},
+    "80x40x6": {"A": 80, "B": 40, "t": 6, "kg_m": 5.52},
+    "80x60x7": {"A": 80, "B": 60, "t": 7, "kg_m": 7.51},
+    "90x90x10": {"A": 90, "B": 90, "t": 10, "kg_m": 18.54},
+    "150x100x10": {"A": 150, "B": 100, "t": 10, "kg_m": 19.36},
+    "200x100x10": {"A": 200, "B": 100, "t": 10, "kg_m": 23.42},
+})
+ANGLES_NOMS = tuple(sorted(ANGLES_STD))
+
 
 def show():
     """
@@ -9,55 +63,6 @@ def show():
     - Colonne gauche: entrées (section, charges, ancrages, critères)
     - Colonne droite: dimensionnement (transversal, longitudinal) + TODO ancrages
     """
-    # ----------------------------
-    # Données cornières standards (extrait – complète au besoin)
-    # format: "A x B x t (mm)": {"A":..., "B":..., "t":..., "kg_m": ...}
-    ANGLES_STD = {
-        # égales
-        "15x15x3": {"A": 15, "B": 15, "t": 3, "kg_m": 0.70},
-        "20x20x3": {"A": 20, "B": 20, "t": 3, "kg_m": 0.90},
-        "25x25x3": {"A": 25, "B": 25, "t": 3, "kg_m": 1.14},
-        "25x25x4": {"A": 25, "B": 25, "t": 4, "kg_m": 1.48},
-        "30x30x3": {"A": 30, "B": 30, "t": 3, "kg_m": 1.39},
-        "30x30x4": {"A": 30, "B": 30, "t": 4, "kg_m": 1.81},
-        "30x30x5": {"A": 30, "B": 30, "t": 5, "kg_m": 2.22},
-        "35x35x4": {"A": 35, "B": 35, "t": 4, "kg_m": 2.13},
-        "40x40x4": {"A": 40, "B": 40, "t": 4, "kg_m": 2.46},
-        "40x40x5": {"A": 40, "B": 40, "t": 5, "kg_m": 3.03},
-        "40x40x6": {"A": 40, "B": 40, "t": 6, "kg_m": 3.58},
-        "45x45x5": {"A": 45, "B": 45, "t": 5, "kg_m": 3.44},
-        "50x50x5": {"A": 50, "B": 50, "t": 5, "kg_m": 3.84},
-        "50x50x6": {"A": 50, "B": 50, "t": 6, "kg_m": 4.57},
-        "50x50x8": {"A": 50, "B": 50, "t": 8, "kg_m": 5.93},
-        "60x60x6": {"A": 60, "B": 60, "t": 6, "kg_m": 5.53},
-        "60x60x8": {"A": 60, "B": 60, "t": 8, "kg_m": 7.22},
-        "70x70x7": {"A": 70, "B": 70, "t": 7, "kg_m": 7.52},
-        "80x80x8": {"A": 80, "B": 80, "t": 8, "kg_m": 9.81},
-        "80x80x10": {"A": 80, "B": 80, "t": 10, "kg_m": 12.09},
-        "80x80x12": {"A": 80, "B": 80, "t": 12, "kg_m": 14.29},
-        "90x90x9": {"A": 90, "B": 90, "t": 9, "kg_m": 12.42},
-        # inégales et autres tailles
-        "100x100x10": {"A": 100, "B": 100, "t": 10, "kg_m": 15.32},
-        "100x100x12": {"A": 100, "B": 100, "t": 12, "kg_m": 18.17},
-        "120x120x10": {"A": 120, "B": 120, "t": 10, "kg_m": 18.55},
-        "120x120x12": {"A": 120, "B": 120, "t": 12, "kg_m": 22.03},
-        "120x120x15": {"A": 120, "B": 120, "t": 15, "kg_m": 27.15},
-        "150x150x10": {"A": 150, "B": 150, "t": 10, "kg_m": 23.42},
-        "150x150x12": {"A": 150, "B": 150, "t": 12, "kg_m": 27.87},
-        "150x150x15": {"A": 150, "B": 150, "t": 15, "kg_m": 34.42},
-        "200x200x20": {"A": 200, "B": 200, "t": 20, "kg_m": 61.08},
-        "40x20x4": {"A": 40, "B": 20, "t": 4, "kg_m": 1.80},
-        "40x25x4": {"A": 40, "B": 25, "t": 4, "kg_m": 1.97},
-        "50x30x5": {"A": 50, "B": 30, "t": 5, "kg_m": 3.02},
-        "60x40x6": {"A": 60, "B": 40, "t": 6, "kg_m": 4.55},
-        "70x50x6": {"A": 70, "B": 50, "t": 6, "kg_m": 5.51},
-        "80x40x6": {"A": 80, "B": 40, "t": 6, "kg_m": 5.52},
-        "80x60x7": {"A": 80, "B": 60, "t": 7, "kg_m": 7.51},
-        "90x90x10": {"A": 90, "B": 90, "t": 10, "kg_m": 18.54},
-        "150x100x10": {"A": 150, "B": 100, "t": 10, "kg_m": 19.36},
-        "200x100x10": {"A": 200, "B": 100, "t": 10, "kg_m": 23.42},
-    }
-
     # ----------------------------
     # UI – deux colonnes
     left, right = st.columns([1, 1.2])
@@ -67,7 +72,7 @@ def show():
         use_std = st.toggle("Utiliser une cornière **standard**", value=True)
 
         if use_std:
-            sel = st.selectbox("Section", sorted(ANGLES_STD.keys()))
+            sel = selectbox_recherche("Section", ANGLES_NOMS, key="corniere_section")
             A = ANGLES_STD[sel]["A"]
             B = ANGLES_STD[sel]["B"]
             t = ANGLES_STD[sel]["t"]
@@ -0,0 +1,181 @@
+# modules/cpt.py
+"""
+Lecture de sondages CPT et calcul vectorisé de E(z) puis de k équivalent.
+
+Le log (profondeur, qc, fs, u2) est traité en tableaux numpy sur toute la
+profondeur ; seule la boucle sur les sondages reste en Python.
+Utilisable depuis la page « Rigidité du sol » ou en ligne de commande :
+
+    python -m modules.cpt S1.csv S2.csv --B 2.0 --nu 0.3
+"""
+import argparse
+import csv
+import io
+import math
+import os
+
+import numpy as np
+import pandas as pd
+
+from modules.unites import from_kPa_to, kNpm3_to_MNpm3, to_kPa_from
+
+GAMMA_W = 9.81     # kN/m³
+PA_KPA = 100.0     # pression atmosphérique de référence (kPa)
+
+# Noms de colonnes acceptés (insensible à la casse)
+COLONNES = {
+    "z":  ("z", "depth", "profondeur", "prof", "penetration length", "diepte"),
+    "qc": ("qc", "cone resistance", "conusweerstand"),
+    "fs": ("fs", "sleeve friction", "frottement", "wrijving"),
+    "u2": ("u2", "u", "pore pressure", "waterspanning"),
+}
+
+
+# ---------- Lecture ----------
+def detecter_format(text):
+    """Détecte séparateur et séparateur décimal d’un log texte."""
+    head = "\n".join(l for l in text.splitlines()[:20] if l.strip() and not l.lstrip().startswith("#"))
+    try:
+        sep = csv.Sniffer().sniff(head, delimiters=";,\t").delimiter
+    except csv.Error:
+        sep = r"\s+"
+    dec = "," if sep in (";", "\t", r"\s+") and any(c.isdigit() for c in head) and "," in head else "."
+    return sep, dec
+
+
+def _colonne(df, cle):
+    cols = {str(c).strip().lower(): c for c in df.columns}
+    for alias in COLONNES[cle]:
+        for nom, c in cols.items():
+            if nom == alias or nom.startswith(alias + " ") or nom.startswith(alias + "["):
+                return c
+    return None
+
+
+def lire_cpt(source, qc_unit="MPa", fs_unit="kPa", u2_unit="kPa"):
+    """
+    Lit un log CPT (chemin, bytes ou fichier ouvert) et renvoie
+    un dict de tableaux : z [m], qc [kPa], fs [kPa], u2 [kPa].
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            raw = f.read()
+    elif isinstance(source, bytes):
+        raw = source
+    else:
+        raw = source.read()
+    text = raw.decode("utf-8", errors="replace") if isinstance(raw, bytes) else raw
+
+    sep, dec = detecter_format(text)
+    df = pd.read_csv(io.StringIO(text), sep=sep, decimal=dec, comment="#",
+                     engine="python" if sep == r"\s+" else "c")
+
+    cz, cqc = _colonne(df, "z"), _colonne(df, "qc")
+    if cz is None or cqc is None:
+        raise ValueError("Colonnes profondeur (z) et qc introuvables dans le log CPT.")
+    cfs, cu2 = _colonne(df, "fs"), _colonne(df, "u2")
+
+    n = len(df)
+    z  = pd.to_numeric(df[cz],  errors="coerce").to_numpy(float)
+    qc = to_kPa_from(pd.to_numeric(df[cqc], errors="coerce").to_numpy(float), qc_unit)
+    fs = to_kPa_from(pd.to_numeric(df[cfs], errors="coerce").to_numpy(float), fs_unit) if cfs is not None else np.zeros(n)
+    u2 = to_kPa_from(pd.to_numeric(df[cu2], errors="coerce").to_numpy(float), u2_unit) if cu2 is not None else np.zeros(n)
+
+    ok = np.isfinite(z) & np.isfinite(qc)
+    z, qc, fs, u2 = z[ok], qc[ok], np.nan_to_num(fs[ok]), np.nan_to_num(u2[ok])
+    order = np.argsort(z, kind="stable")
+    return {"z": z[order], "qc": qc[order], "fs": fs[order], "u2": u2[order]}
+
+
+# ---------- Calculs le long de la profondeur ----------
+def profil_E(log, alphaE=2.5, z_nappe=0.0, gamma=None, a_net=0.8):
+    """
+    qt, σv0, σ'v0 et E = α_E (qt − σ'v0) pour chaque échantillon (kPa).
+    gamma=None → γ estimé par Robertson & Cabal (2010), sinon γ constant (kN/m³).
+    """
+    z, qc, fs, u2 = log["z"], log["qc"], log["fs"], log["u2"]
+    qt = qc + u2 * (1.0 - a_net)
+
+    if gamma is None:
+        Rf = np.clip(np.divide(fs, qt, out=np.zeros_like(fs), where=qt > 0) * 100.0, 0.1, None)
+        g = GAMMA_W * (0.27 * np.log10(Rf) + 0.36 * np.log10(np.maximum(qt, 1.0) / PA_KPA) + 1.236)
+        g = np.clip(g, 14.0, 22.0)
+    else:
+        g = np.full_like(z, float(gamma))
+
+    # σv0 = ∫ γ dz (trapèzes, depuis la surface)
+    dz = np.diff(z, prepend=0.0)
+    g_moy = np.concatenate(([g[0]], 0.5 * (g[1:] + g[:-1]))) if len(g) else g
+    sv0 = np.cumsum(g_moy * dz)
+    u0 = GAMMA_W * np.maximum(z - z_nappe, 0.0)
+    sv0_eff = sv0 - u0
+
+    E = alphaE * np.maximum(qt - sv0_eff, 0.0)
+    return {"z": z, "qt": qt, "gamma": g, "sv0": sv0, "sv0_eff": sv0_eff, "E": E}
+
+
+def k_equivalent(profil, B, nu=0.30, D_f=0.0, n_B=2.0):
+    """
+    Intègre E(z) en série sur la profondeur d’influence [D_f ; D_f + n_B·B] :
+    E_eq = H / ∫ dz/E   puis   k ≈ E_eq / [B(1−ν²)]   (kN/m³).
+    """
+    z, E = profil["z"], profil["E"]
+    z_top, z_bot = D_f, D_f + n_B * B
+    if len(z) < 2 or z[-1] <= z_top:
+        return {"H": 0.0, "E_eq": 0.0, "k": 0.0, "z_bot": z_bot}
+
+    # grille restreinte à la zone d’influence (bornes interpolées)
+    inner = (z > z_top) & (z < z_bot)
+    zb = min(z_bot, z[-1])
+    zz = np.concatenate(([z_top], z[inner], [zb]))
+    EE = np.interp(zz, z, E)
+    with np.errstate(divide="ignore"):
+        inv = np.where(EE > 0, 1.0 / EE, np.inf)
+    integ = float(np.sum(0.5 * (inv[1:] + inv[:-1]) * np.diff(zz)))
+    H = zb - z_top
+    E_eq = H / integ if integ > 0 and math.isfinite(integ) else 0.0
+    k = E_eq / (max(B, 1e-6) * (1.0 - nu ** 2))
+    return {"H": H, "E_eq": E_eq, "k": k, "z_bot": z_bot}
+
+
+def k_lot(logs, B, nu=0.30, D_f=0.0, n_B=2.0, alphaE=2.5, z_nappe=0.0, gamma=None, a_net=0.8):
+    """
+    Traite un lot de sondages {nom: log}.
+    Renvoie (résultats par sondage [E_eq en kPa, k en kN/m³], profils E(z) par sondage).
+    """
+    res, profils = [], {}
+    for nom, log in logs.items():
+        prof = profil_E(log, alphaE=alphaE, z_nappe=z_nappe, gamma=gamma, a_net=a_net)
+        eq = k_equivalent(prof, B, nu=nu, D_f=D_f, n_B=n_B)
+        profils[nom] = prof
+        res.append({"nom": nom, "n": len(prof["z"]), "z_max": float(prof["z"][-1]) if len(prof["z"]) else 0.0, **eq})
+    return res, profils
+
+
+# ---------- Ligne de commande ----------
+def main(argv=None):
+    p = argparse.ArgumentParser(description="k équivalent à partir de logs CPT (z, qc, fs, u2).")
+    p.add_argument("fichiers", nargs="+", help="logs CPT (csv / txt)")
+    p.add_argument("--B", type=float, default=2.0, help="largeur de semelle [m]")
+    p.add_argument("--nu", type=float, default=0.30)
+    p.add_argument("--Df", type=float, default=0.0, help="profondeur d’assise [m]")
+    p.add_argument("--nB", type=float, default=2.0, help="profondeur d’influence = nB·B")
+    p.add_argument("--alphaE", type=float, default=2.5)
+    p.add_argument("--nappe", type=float, default=0.0, help="profondeur de la nappe [m]")
+    p.add_argument("--gamma", type=float, default=None, help="γ constant [kN/m³] (défaut : corrélation)")
+    p.add_argument("--qc-unit", default="MPa", choices=["MPa", "kPa"])
+    p.add_argument("--fs-unit", default="kPa", choices=["MPa", "kPa"])
+    p.add_argument("--u2-unit", default="kPa", choices=["MPa", "kPa"])
+    a = p.parse_args(argv)
+
+    logs = {os.path.basename(f): lire_cpt(f, a.qc_unit, a.fs_unit, a.u2_unit) for f in a.fichiers}
+    res, _ = k_lot(logs, a.B, nu=a.nu, D_f=a.Df, n_B=a.nB, alphaE=a.alphaE, z_nappe=a.nappe, gamma=a.gamma)
+
+    print("sondage;n;z_max [m];H [m];E_eq [MPa];k [MN/m3]")
+    for r in res:
+        print(f"{r['nom']};{r['n']};{r['z_max']:.2f};{r['H']:.2f};"
+              f"{from_kPa_to(r['E_eq'], 'MPa'):.2f};{kNpm3_to_MNpm3(r['k']):.2f}")
+
+
+if __name__ == "__main__":
+    main()
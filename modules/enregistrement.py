@@ -0,0 +1,125 @@
+# modules/enregistrement.py
+"""
+Enregistrement des interactions des sessions réelles (traces rejouables).
+
+Avec ENREGISTRER_SESSIONS=1, chaque session écrit un fichier JSON Lines dans
+.cache/traces/ (ou TRACES_DIR) :
+
+    {"trace": 1, "session": "…", "debut": "2026-…", "page": "Poutre"}       (en-tête)
+    {"t": 3.21, "page": "Poutre", "fragment": null, "changes": {"h": 45}}   (un par rerun)
+
+Au début de chaque run (page complète via streamlit_app, ou fragment via
+modules.ui.fragment), les valeurs simples de l’état (clés utilisateur, hors
+« _… » et « page ») sont comparées à celles de la fin du run précédent : les
+différences sont les saisies de l’utilisateur. Les runs sans changement (ceux
+relancés par st.rerun) ne sont pas écrits, ni un fragment exécuté avec sa page.
+Les traces sont rejouées par bench/rejeu.py.
+
+Désactivé par défaut : rerun() se réduit alors à un test de booléen.
+"""
+import functools
+import json
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from modules.metriques import session_courante
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ACTIF = os.environ.get("ENREGISTRER_SESSIONS", "0") == "1"
+DOSSIER = os.environ.get("TRACES_DIR", os.path.join(RACINE, ".cache", "traces"))
+CLE = "_enregistrement"     # état de l’enregistreur dans st.session_state
+EXCLUES = {"page"}
+
+_SIMPLES = (bool, int, float, str, type(None))
+
+
+def _valeurs(etat):
+    """Valeurs simples (sérialisables en JSON) des clés utilisateur de l’état."""
+    res = {}
+    for k, v in etat.items():
+        k = str(k)
+        if k.startswith("_") or k in EXCLUES:
+            continue
+        if isinstance(v, _SIMPLES) or (isinstance(v, (list, tuple)) and all(isinstance(x, _SIMPLES) for x in v)):
+            res[k] = list(v) if isinstance(v, tuple) else v
+    return res
+
+
+def _ecrire(chemin, ligne):
+    with open(chemin, "a", encoding="utf-8") as f:
+        f.write(json.dumps(ligne, ensure_ascii=False) + "\n")
+
+
+def _enregistreur(etat, page):
+    e = etat.get(CLE)
+    if e is None:
+        os.makedirs(DOSSIER, exist_ok=True)
+        session = session_courante() or "hors-session"
+        debut = datetime.now()
+        chemin = os.path.join(DOSSIER, f"{debut:%Y%m%d_%H%M%S}_{session}.jsonl")
+        _ecrire(chemin, {"trace": 1, "session": session, "debut": debut.isoformat(timespec="seconds"),
+                         "page": page})
+        e = etat[CLE] = {"fichier": chemin, "t0": time.monotonic(), "instantane": {}, "premier": True,
+                         "en_cours": False}
+    return e
+
+
+def observer(etat, page, fragment=None):
+    """Début d’un run : écrit les changements depuis la fin du run précédent."""
+    e = _enregistreur(etat, page)
+    courant = _valeurs(etat)
+    avant = e["instantane"]
+    changes = {k: v for k, v in courant.items() if k not in avant or avant[k] != v}
+    e["instantane"] = courant
+    if changes or (e["premier"] and fragment is None):
+        _ecrire(e["fichier"], {"t": round(time.monotonic() - e["t0"], 3), "page": page,
+                               "fragment": fragment, "changes": changes})
+        e["premier"] = False
+
+
+def photographier(etat):
+    """Fin d’un run : valeurs de référence pour le run suivant."""
+    e = etat.get(CLE)
+    if e is not None:
+        e["instantane"] = _valeurs(etat)
+
+
+@contextmanager
+def rerun(page, etat, fragment=None):
+    """Encadre un run de page (ou de fragment) ; sans effet si l’enregistrement est désactivé."""
+    if not ACTIF or (fragment is not None and etat.get(CLE, {}).get("en_cours")):
+        yield                # fragment exécuté avec sa page : déjà couvert par le run de la page
+        return
+    try:
+        observer(etat, page, fragment)
+    except OSError:
+        pass                 # disque plein / lecture seule : la page s’affiche quand même
+    e = etat.get(CLE, {})
+    e["en_cours"] = fragment is None
+    try:
+        yield
+    finally:
+        e["en_cours"] = False
+        photographier(etat)
+
+
+def suivre(fn):
+    """Fonction de fragment enregistrée (modules.ui.fragment, si ACTIF)."""
+    @functools.wraps(fn)
+    def run(*args, **kwargs):
+        import streamlit as st
+
+        with rerun(st.session_state.get("page"), st.session_state, fragment=fn.__qualname__):
+            return fn(*args, **kwargs)
+    return run
+
+
+def lire(chemin):
+    """(en-tête, [événements]) d’un fichier de trace."""
+    with open(chemin, encoding="utf-8") as f:
+        lignes = [json.loads(l) for l in f if l.strip()]
+    if not lignes or lignes[0].get("trace") != 1:
+        raise ValueError(f"{chemin} : trace invalide")
+    return lignes[0], lignes[1:]
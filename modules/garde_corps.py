@@ -2,6 +2,8 @@
 import math
 import streamlit as st
 
+from modules.ui import selectbox_recherche
+
 E_STEEL = 210000.0  # MPa
 
 # ------- sections standard
@@ -90,7 +92,7 @@ def show():
 
             if typ_p=="RHS":
                 if use_std_p:
-                    tag = st.selectbox("RHS (b×h×t)", STD_RHS, key="p_rhs")
+                    tag = selectbox_recherche("RHS (b×h×t)", STD_RHS, key="p_rhs")
                     bp,hp,tp = parse_rhs(tag)
                 else:
                     bp = st.number_input("b (mm)", 20.0, 200.0, 50.0, step=1.0, key="bp")
@@ -99,7 +101,7 @@ def show():
                 I_post, W_post = I_W_RHS(bp,hp,tp); Av_post = shear_area_rhs(bp,hp,tp)
             elif typ_p=="CHS":
                 if use_std_p:
-                    tag = st.selectbox("CHS (Ø×t)", STD_CHS, key="p_chs")
+                    tag = selectbox_recherche("CHS (Ø×t)", STD_CHS, key="p_chs")
                     Dp,tp = parse_chs(tag)
                 else:
                     Dp = st.number_input("D (mm)", 21.3, 168.3, 48.3, step=0.1, key="Dp")
@@ -124,7 +126,7 @@ def show():
 
             if typ_mc=="RHS":
                 if use_std_mc:
-                    tag = st.selectbox("RHS (b×h×t)", STD_RHS, key="mc_rhs")
+                    tag = selectbox_recherche("RHS (b×h×t)", STD_RHS, key="mc_rhs")
                     bmc,hmc,tmc = parse_rhs(tag)
                 else:
                     bmc = st.number_input("b (mm)", 20.0, 200.0, 40.0, step=1.0, key="bmc")
@@ -133,7 +135,7 @@ def show():
                 I_mc, W_mc = I_W_RHS(bmc,hmc,tmc); Av_mc = shear_area_rhs(bmc,hmc,tmc)
             elif typ_mc=="CHS":
                 if use_std_mc:
-                    tag = st.selectbox("CHS (Ø×t)", STD_CHS, key="mc_chs")
+                    tag = selectbox_recherche("CHS (Ø×t)", STD_CHS, key="mc_chs")
                     Dmc,tmc = parse_chs(tag)
                 else:
                     Dmc = st.number_input("D (mm)", 21.3, 168.3, 42.4, step=0.1, key="Dmc")
@@ -164,11 +166,11 @@ def show():
 
             typ_b = st.radio("Type section", ["RHS","CHS","Rectangulaire"], horizontal=True, key="bar_type")
             if typ_b=="RHS":
-                tag = st.selectbox("RHS standard", STD_RHS, key="rhs_bar")
+                tag = selectbox_recherche("RHS standard", STD_RHS, key="rhs_bar")
                 bb,hb,tb = parse_rhs(tag)
                 I_bar, W_bar = I_W_RHS(bb,hb,tb); Av_bar = shear_area_rhs(bb,hb,tb)
             elif typ_b=="CHS":
-                tag = st.selectbox("CHS standard", STD_CHS, key="chs_bar")
+                tag = selectbox_recherche("CHS standard", STD_CHS, key="chs_bar")
                 Db,tb = parse_chs(tag)
                 I_bar, W_bar = I_W_CHS(Db,tb); Av_bar = shear_area_chs(Db,tb)
             else:
@@ -0,0 +1,111 @@
+# modules/graphe.py
+"""
+Petit graphe de calcul incrémental, commun aux pages de dimensionnement.
+
+Chaque nœud est une fonction qui déclare ses entrées : des clés de l’état
+(st.session_state ou tout dict) ou d’autres nœuds. Le résultat est mémorisé
+avec l’empreinte de ses entrées (hachage du contenu, modules.cache.empreinte :
+tableaux numpy et DataFrames compris) ; lors du rerun suivant, un nœud n’est
+recalculé que si l’une de ses entrées a changé. Une modification ne relance donc que les nœuds en aval de la clé modifiée.
+
+    calc = Graphe(defauts={"b": 20})
+
+    @calc.noeud(entrees=("b", "h"))
+    def section(b, h):
+        return b * h
+
+    aire = calc.valeur("section", st.session_state)
+"""
+import inspect
+
+from modules.cache import empreinte
+from modules.profilage import releve
+
+_ABSENT = object()
+
+
+class Graphe:
+    def __init__(self, nom="graphe", defauts=None):
+        self.nom = nom
+        self.defauts = dict(defauts or {})
+        self._noeuds = {}   # nom -> (fonction, entrées)
+
+    # ---------- Déclaration ----------
+    def noeud(self, fn=None, *, nom=None, entrees=None):
+        """Décorateur : enregistre fn comme nœud. Entrées par défaut = noms des paramètres."""
+        def deco(f):
+            ent = tuple(entrees) if entrees is not None else tuple(inspect.signature(f).parameters)
+            self._noeuds[nom or f.__name__] = (f, ent)
+            return f
+        return deco(fn) if fn is not None else deco
+
+    def entrees(self, nom):
+        return self._noeuds[nom][1]
+
+    def aval(self, cle):
+        """Ensemble des nœuds qui dépendent (directement ou non) de cle."""
+        res, pile = set(), [cle]
+        while pile:
+            c = pile.pop()
+            for n, (_, ent) in self._noeuds.items():
+                if c in ent and n not in res:
+                    res.add(n)
+                    pile.append(n)
+        return res
+
+    # ---------- Évaluation ----------
+    def memo(self, etat):
+        """Mémoire du graphe rangée dans l’état (une par session Streamlit)."""
+        cle = f"_graphe_{self.nom}"
+        if cle not in etat:
+            etat[cle] = {"valeurs": {}, "calculs": {}}
+        return etat[cle]
+
+    def valeur(self, nom, etat, memo=None):
+        """Valeur du nœud nom (recalculé seulement si une entrée a changé)."""
+        memo = self.memo(etat) if memo is None else memo
+        f, ent = self._noeuds[nom]
+        args = tuple(self._entree(e, etat, memo) for e in ent)
+        signature = tuple(self._empreinte(e, a, memo) for e, a in zip(ent, args))
+
+        ancien = memo["valeurs"].get(nom, _ABSENT)
+        if ancien is not _ABSENT and None not in signature and ancien[0] == signature:
+            return ancien[1]
+        r = releve()
+        res = f(*args) if r is None else r.chrono("calcul", nom, f, *args)
+        memo["calculs"][nom] = memo["calculs"].get(nom, 0) + 1
+        memo["valeurs"][nom] = (signature, res, self._hacher(res) or ("calcul", memo["calculs"][nom]))
+        return res
+
+    @staticmethod
+    def _hacher(v):
+        try:
+            return empreinte(v)
+        except Exception:
+            return None
+
+    def _empreinte(self, e, v, memo):
+        """
+        Empreinte d’une entrée (None si non sérialisable : recalcul systématique).
+        Nœud amont : hachage de son résultat, calculé une seule fois à chaque recalcul.
+        """
+        if e in self._noeuds:
+            return memo["valeurs"][e][2]
+        return self._hacher(v)
+
+    def _entree(self, e, etat, memo):
+        if e in self._noeuds:
+            return self.valeur(e, etat, memo)
+        v = etat.get(e, _ABSENT)
+        if v is _ABSENT:
+            v = self.defauts.get(e)
+        return v
+
+    def invalider(self, etat, nom=None):
+        """Oublie un nœud (et son aval), ou toute la mémoire si nom est None."""
+        memo = self.memo(etat)
+        if nom is None:
+            memo["valeurs"].clear()
+            return
+        for n in {nom} | self.aval(nom):
+            memo["valeurs"].pop(n, None)
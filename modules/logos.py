@@ -0,0 +1,51 @@
+# modules/logos.py
+"""
+Logos de la page d’accueil, servis depuis assets/ sans ressource externe.
+
+Les images sont réduites une fois par processus (PIL), assemblées en une
+planche unique (sprite) et envoyées en data URI dans une règle CSS : la page
+s’affiche en un seul aller-retour, y compris hors ligne.
+"""
+import base64
+import io
+import os
+
+from modules.cache import cache
+
+ASSETS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+
+TAILLE = 100     # px affichés
+ECHELLE = 2      # résolution de la planche (écrans haute densité)
+COULEURS = 128   # palette PNG (logos en aplats)
+
+
+def _noms():
+    return tuple(sorted(f for f in os.listdir(ASSETS) if f.lower().endswith(".png")))
+
+
+@cache(copie=False)
+def planche(noms=None):
+    """
+    Sprite horizontal des logos noms (défaut : tous les PNG de assets/) → (data URI PNG, {nom: rang}).
+    """
+    from PIL import Image
+
+    noms = _noms() if noms is None else tuple(noms)
+    t = TAILLE * ECHELLE
+    sprite = Image.new("RGB", (t * len(noms), t), "white")
+    for i, nom in enumerate(noms):
+        with Image.open(os.path.join(ASSETS, nom)) as im:
+            sprite.paste(im.convert("RGB").resize((t, t), Image.LANCZOS), (i * t, 0))
+    buf = io.BytesIO()
+    sprite.quantize(COULEURS).save(buf, "PNG", optimize=True)
+    uri = "data:image/png;base64," + base64.b64encode(buf.getvalue()).decode("ascii")
+    return uri, {nom: i for i, nom in enumerate(noms)}
+
+
+@cache(copie=False)
+def css_logos(noms=None):
+    """<style> des classes .logo / .logo-<rang> (fond = planche décalée sur le logo) et {nom: rang}."""
+    uri, rangs = planche(noms)
+    regles = [f".logo{{background:url({uri}) 0 0/{TAILLE * len(rangs)}px {TAILLE}px no-repeat}}"]
+    regles += [f".logo-{i}{{background-position:-{i * TAILLE}px 0}}" for i in rangs.values()]
+    return "<style>" + "".join(regles) + "</style>", rangs
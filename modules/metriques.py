@@ -0,0 +1,268 @@
+# modules/metriques.py
+"""
+Journal local des temps de réponse (SQLite) et rapports par percentiles.
+
+Chaque rerun de page (streamlit_app, via rerun()), chaque rerun d’un fragment
+seul (modules.ui.fragment) et chaque appel d’une fonction mise en cache
+(modules.cache) dont le résultat n’était pas déjà en mémoire ajoute une mesure :
+horodatage, type ("page" / "fragment" / "noyau"), nom, page en cours, durée [ms],
+empreinte des entrées, session (hachée) et source du résultat
+(noyau : "memoire", "disque" ou "calcul").
+
+Les mesures sont tamponnées en mémoire et écrites par lots (toutes les
+TAMPON lignes ou FLUSH_S secondes, et à l’arrêt du processus) dans une base
+SQLite en mode WAL, partageable entre plusieurs processus serveur. Une erreur
+d’écriture est ignorée : les métriques ne doivent jamais bloquer l’application.
+
+    python -m modules.metriques rapport [--depuis 24h] [--type page]
+    python -m modules.metriques export  [--depuis 5m] [-o metriques.prom]
+
+Désactivé par défaut (comme ENREGISTRER_SESSIONS) : METRIQUES=1 active
+l’enregistrement ; METRIQUES_DB change le fichier (défaut : .cache/metriques.sqlite).
+"""
+import argparse
+import atexit
+import functools
+import hashlib
+import os
+import re
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASE = os.environ.get("METRIQUES_DB", os.path.join(RACINE, ".cache", "metriques.sqlite"))
+ACTIF = os.environ.get("METRIQUES", "0") == "1"
+
+TAMPON = 200          # lignes avant écriture
+FLUSH_S = 5.0         # délai max avant écriture [s]
+RETENTION_J = 30      # mesures plus anciennes purgées à l’ouverture
+QUANTILES = (0.5, 0.95, 0.99)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS mesures (
+    ts       REAL NOT NULL,
+    type     TEXT NOT NULL,
+    nom      TEXT NOT NULL,
+    page     TEXT,
+    duree_ms REAL NOT NULL,
+    entrees  TEXT,
+    session  TEXT,
+    source   TEXT
+);
+CREATE INDEX IF NOT EXISTS mesures_type_nom_ts ON mesures (type, nom, ts);
+CREATE INDEX IF NOT EXISTS mesures_ts ON mesures (ts);
+"""
+
+_verrou = threading.Lock()
+_tampon = []
+_dernier_flush = time.monotonic()
+_local = threading.local()      # page et session du rerun en cours (thread du script)
+
+
+def connecter(chemin=BASE):
+    dossier = os.path.dirname(chemin)
+    if dossier:             # METRIQUES_DB=m.sqlite : répertoire courant
+        os.makedirs(dossier, exist_ok=True)
+    con = sqlite3.connect(chemin, timeout=5.0)
+    con.execute("PRAGMA journal_mode=WAL")
+    con.execute("PRAGMA synchronous=NORMAL")
+    con.executescript(SCHEMA)
+    return con
+
+
+_purge_faite = False
+
+
+def flush():
+    """Écrit les mesures tamponnées (sans effet si le tampon est vide)."""
+    global _dernier_flush, _purge_faite
+    with _verrou:
+        lot = _tampon[:]
+        _tampon.clear()
+        _dernier_flush = time.monotonic()
+    if not lot:
+        return
+    try:
+        con = connecter()
+        try:
+            with con:
+                if not _purge_faite:
+                    con.execute("DELETE FROM mesures WHERE ts < ?", (time.time() - RETENTION_J * 86400,))
+                    _purge_faite = True
+                con.executemany("INSERT INTO mesures VALUES (?, ?, ?, ?, ?, ?, ?, ?)", lot)
+        finally:
+            con.close()
+    except (sqlite3.Error, OSError):
+        pass
+
+
+atexit.register(flush)
+
+
+def noter(type_, nom, duree_ms, entrees=None, source=None):
+    """Ajoute une mesure ; la page et la session sont celles du rerun en cours."""
+    if not ACTIF:
+        return
+    page, session = getattr(_local, "contexte", None) or (None, None)
+    with _verrou:
+        _tampon.append((time.time(), type_, nom, page, duree_ms, entrees, session, source))
+        plein = len(_tampon) >= TAMPON or time.monotonic() - _dernier_flush > FLUSH_S
+    if plein:
+        flush()
+
+
+def session_courante():
+    """Identifiant haché de la session Streamlit en cours (None hors script)."""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+    except Exception:
+        ctx = None
+    if ctx is None:
+        return None
+    return hashlib.blake2b(ctx.session_id.encode(), digest_size=6).hexdigest()
+
+
+def empreinte_etat(etat):
+    """Empreinte des valeurs simples de l’état (widgets), hors clés internes."""
+    simples = sorted(
+        (str(k), repr(v)) for k, v in etat.items()
+        if not str(k).startswith("_") and isinstance(v, (bool, int, float, str, type(None)))
+    )
+    return hashlib.blake2b(repr(simples).encode(), digest_size=8).hexdigest()
+
+
+@contextmanager
+def rerun(page, etat, fragment=None):
+    """
+    Mesure un rerun de la page (y compris interrompu par st.rerun / st.stop), ou
+    d’un fragment seul (type "fragment", nom du fragment).
+    """
+    if not ACTIF or (fragment is not None and getattr(_local, "contexte", None) is not None):
+        yield                # fragment exécuté avec sa page : compté dans le rerun de la page
+        return
+    _local.contexte = (page, session_courante())
+    entrees = empreinte_etat(etat)
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        duree = (time.perf_counter() - t0) * 1000.0
+        if fragment is None:
+            noter("page", page, duree, entrees)
+        else:
+            noter("fragment", fragment, duree, entrees)
+        _local.contexte = None
+
+
+def suivre(fn):
+    """Fonction de fragment mesurée (modules.ui.fragment, si ACTIF)."""
+    nom = f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__name__}"
+
+    @functools.wraps(fn)
+    def run(*args, **kwargs):
+        import streamlit as st
+
+        with rerun(st.session_state.get("page"), st.session_state, fragment=nom):
+            return fn(*args, **kwargs)
+    return run
+
+
+# ---------- Rapports ----------
+def duree_s(texte):
+    """« 90s », « 15m », « 24h », « 7j » / « 7d » → secondes."""
+    m = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhjd]?)\s*", texte)
+    if not m:
+        raise ValueError(f"durée invalide : {texte!r}")
+    return float(m.group(1)) * {"": 1, "s": 1, "m": 60, "h": 3600, "j": 86400, "d": 86400}[m.group(2)]
+
+
+def percentiles(depuis_s=None, type_=None, chemin=BASE):
+    """[{"type", "nom", "n", "p50", "p95", "p99", "max", "somme"}] sur la fenêtre, trié par p95 décroissant."""
+    flush()
+    if not os.path.exists(chemin):
+        return []
+    requete, params = "SELECT type, nom, duree_ms FROM mesures WHERE 1=1", []
+    if depuis_s is not None:
+        requete += " AND ts >= ?"
+        params.append(time.time() - depuis_s)
+    if type_:
+        requete += " AND type = ?"
+        params.append(type_)
+    con = connecter(chemin)
+    try:
+        lignes = con.execute(requete + " ORDER BY type, nom", params).fetchall()
+    finally:
+        con.close()
+
+    groupes = {}
+    for t, n, d in lignes:
+        groupes.setdefault((t, n), []).append(d)
+    res = []
+    for (t, n), durees in groupes.items():
+        v = np.asarray(durees)
+        p = np.percentile(v, [q * 100 for q in QUANTILES])
+        res.append({"type": t, "nom": n, "n": len(v), "p50": p[0], "p95": p[1], "p99": p[2],
+                    "max": v.max(), "somme": v.sum()})
+    return sorted(res, key=lambda r: (r["type"], -r["p95"]))
+
+
+def formater(stats):
+    lignes = [f"{'type':6s} {'nom':28s} {'n':>7s} {'p50 [ms]':>9s} {'p95 [ms]':>9s} {'p99 [ms]':>9s} {'max [ms]':>9s}"]
+    for r in stats:
+        lignes.append(f"{r['type']:6s} {r['nom'][:28]:28s} {r['n']:7d} {r['p50']:9.2f} "
+                      f"{r['p95']:9.2f} {r['p99']:9.2f} {r['max']:9.2f}")
+    return "\n".join(lignes)
+
+
+def _etiquette(v):
+    return str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def exposition(stats):
+    """Texte au format d’exposition Prometheus (summary etudes_duree_ms)."""
+    lignes = [
+        "# HELP etudes_duree_ms Durée des reruns de page et des appels de noyaux [ms].",
+        "# TYPE etudes_duree_ms summary",
+    ]
+    for r in stats:
+        et = f'type="{_etiquette(r["type"])}",nom="{_etiquette(r["nom"])}"'
+        for q, cle in zip(QUANTILES, ("p50", "p95", "p99")):
+            lignes.append(f'etudes_duree_ms{{{et},quantile="{q}"}} {r[cle]:.3f}')
+        lignes.append(f"etudes_duree_ms_sum{{{et}}} {r['somme']:.3f}")
+        lignes.append(f"etudes_duree_ms_count{{{et}}} {r['n']}")
+    return "\n".join(lignes) + "\n"
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    p.add_argument("commande", choices=("rapport", "export"))
+    p.add_argument("--depuis", type=duree_s, default=None, help="fenêtre : 15m, 24h, 7j… (défaut : tout)")
+    p.add_argument("--type", choices=("page", "fragment", "noyau"), default=None)
+    p.add_argument("--base", default=BASE, help="fichier SQLite")
+    p.add_argument("-o", "--sortie", default=None, help="export : fichier écrit atomiquement (défaut : stdout)")
+    a = p.parse_args(argv)
+
+    stats = percentiles(a.depuis, a.type, a.base)
+    if a.commande == "rapport":
+        print(formater(stats))
+        return 0
+    texte = exposition(stats)
+    if a.sortie is None:
+        sys.stdout.write(texte)
+        return 0
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(a.sortie)), suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(texte)
+    os.replace(tmp, a.sortie)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,31 +1,28 @@
 import streamlit as st
+from contextlib import contextmanager
 from datetime import datetime
 import json
 import math
 
-# ========= Styles blocs =========
-C_COULEURS = {"ok": "#e6ffe6", "warn": "#fffbe6", "nok": "#ffe6e6"}
+from modules.armatures import DIAMETRES, DIAM_ETRIERS, aire_barre, dispositions
+from modules.catalogues import catalogue
+from modules.graphe import Graphe
+from modules.profilage import jalon
+from modules.styles import inclure
+from modules.ui import fragment, interrupteur_saisie_groupee, saisie_groupee
+
+# ========= Styles blocs (classes de static/blocs.css) =========
 C_ICONES   = {"ok": "✅",       "warn": "⚠️",      "nok": "❌"}
 
-def open_bloc(titre: str, etat: str = "ok"):
-    st.markdown(
-        f"""
-        <div style="
-            background-color:{C_COULEURS.get(etat,'#f6f6f6')};
-            padding:12px 14px 10px 14px;
-            border-radius:10px;
-            border:1px solid #d9d9d9;
-            margin:10px 0 12px 0;">
-          <div style="display:flex;justify-content:space-between;align-items:center;gap:8px;margin-bottom:6px;">
-            <div style="font-weight:700;">{titre}</div>
-            <div style="font-size:20px;line-height:1;">{C_ICONES.get(etat,'')}</div>
-          </div>
-        """,
-        unsafe_allow_html=True
-    )
-
-def close_bloc():
-    st.markdown("</div>", unsafe_allow_html=True)
+@contextmanager
+def bloc(cle: str, titre: str, etat: str = "ok"):
+    """Bloc résultat : conteneur Streamlit de classe st-key-bloc-<etat>-<cle> (couleur dans blocs.css)."""
+    with st.container(border=True, key=f"bloc-{etat}-{cle}"):
+        st.markdown(
+            f"<div class='bloc-tete'>{titre}<span class='bloc-icone'>{C_ICONES.get(etat,'')}</span></div>",
+            unsafe_allow_html=True
+        )
+        yield
 
 # ========= Clés à sauvegarder/charger (métier uniquement) =========
 SAVE_KEYS = {
@@ -43,6 +40,179 @@ SAVE_KEYS = {
     "n_etriers_r", "ø_etrier_r", "pas_etrier_r",
 }
 
+# ========= Graphe de calcul (recalcul des seuls nœuds en aval d’une modification) =========
+@catalogue
+def load_beton_data():
+    with open("beton_classes.json", "r") as f:
+        return json.load(f)
+
+CALCUL = Graphe("poutre", defauts={
+    "M_inf": 0.0, "M_sup": 0.0, "V": 0.0, "V_lim": 0.0,
+    "n_as_inf": 2, "ø_as_inf": 16, "n_as_sup": 2, "ø_as_sup": 16,
+    "n_etriers": 1, "ø_etrier": 8, "pas_etrier": 30.0,
+    "n_etriers_r": 1, "ø_etrier_r": 8, "pas_etrier_r": 30.0,
+})
+
+@CALCUL.noeud(entrees=("beton", "fyk"))
+def materiaux(beton, fyk):
+    data = load_beton_data()[beton]
+    return {
+        "fck": data["fck"], "fck_cube": data["fck_cube"], "alpha_b": data["alpha_b"],
+        "mu_val": data[f"mu_a{fyk}"], "fyd": int(fyk) / 1.5,
+    }
+
+@CALCUL.noeud(entrees=("materiaux", "M_inf", "M_sup", "b", "h", "enrobage"))
+def hauteur(mat, M_inf, M_sup, b, h, enrobage):
+    M_max = max(M_inf, M_sup)
+    hmin_calc = math.sqrt((M_max * 1e6) / (mat["alpha_b"] * b * 10 * mat["mu_val"])) / 10  # cm
+    return {"hmin": hmin_calc, "etat": "ok" if hmin_calc + enrobage <= h else "nok"}
+
+@CALCUL.noeud(entrees=("b", "h", "enrobage"))
+def section(b, h, enrobage):
+    return {
+        "d_utile": h - enrobage,           # cm
+        "As_min": 0.0013 * b * h * 1e2,
+        "As_max": 0.04 * b * h * 1e2,
+    }
+
+def _armatures(mat, sec, M, n, diam):
+    As_req = (M * 1e6) / (mat["fyd"] * 0.9 * sec["d_utile"] * 10)
+    As_choisi = n * aire_barre(diam)
+    ok = (sec["As_min"] <= As_choisi <= sec["As_max"]) and (As_choisi >= As_req)
+    return {"As": As_req, "As_choisi": As_choisi, "etat": "ok" if ok else "nok"}
+
+@CALCUL.noeud(entrees=("materiaux", "section", "M_inf", "n_as_inf", "ø_as_inf"))
+def armatures_inf(mat, sec, M, n, diam):
+    return _armatures(mat, sec, M, n, diam)
+
+@CALCUL.noeud(entrees=("materiaux", "section", "M_sup", "n_as_sup", "ø_as_sup"))
+def armatures_sup(mat, sec, M, n, diam):
+    return _armatures(mat, sec, M, n, diam)
+
+@CALCUL.noeud(entrees=("materiaux",))
+def tau_limites(mat):
+    return {
+        "tau_1": 0.016 * mat["fck_cube"] / 1.05,
+        "tau_2": 0.032 * mat["fck_cube"] / 1.05,
+        "tau_4": 0.064 * mat["fck_cube"] / 1.05,
+    }
+
+def _cisaillement(lim, V, b, h):
+    tau = V * 1e3 / (0.75 * b * h * 100)
+    tau_1, tau_2, tau_4 = lim["tau_1"], lim["tau_2"], lim["tau_4"]
+    if   tau <= tau_1: besoin, etat, nom_lim, tau_lim = "Pas besoin d’étriers", "ok",  "τ_adm_I", tau_1
+    elif tau <= tau_2: besoin, etat, nom_lim, tau_lim = "Besoin d’étriers",      "ok",  "τ_adm_II", tau_2
+    elif tau <= tau_4: besoin, etat, nom_lim, tau_lim = "Besoin de barres inclinées et d’étriers", "warn", "τ_adm_IV", tau_4
+    else:              besoin, etat, nom_lim, tau_lim = "Pas acceptable",        "nok", "τ_adm_IV", tau_4
+    return {"tau": tau, "besoin": besoin, "etat": etat, "nom_lim": nom_lim, "tau_lim": tau_lim}
+
+@CALCUL.noeud(entrees=("tau_limites", "V", "b", "h"))
+def cisaillement(lim, V, b, h):
+    return _cisaillement(lim, V, b, h)
+
+@CALCUL.noeud(entrees=("tau_limites", "V_lim", "b", "h"))
+def cisaillement_reduit(lim, V, b, h):
+    return _cisaillement(lim, V, b, h)
+
+def _etriers(mat, sec, V, n, diam, pas):
+    # Calculs (en cm)
+    Ast_e  = n * 2 * aire_barre(diam)                                       # mm²
+    pas_th = Ast_e * mat["fyd"] * sec["d_utile"] * 10 / (10 * V * 1e3)     # cm
+    s_max  = min(0.75 * sec["d_utile"], 30.0)                               # cm
+    return {"pas_th": pas_th, "s_max": s_max, "etat": "ok" if pas <= min(pas_th, s_max) else "nok"}
+
+@CALCUL.noeud(entrees=("materiaux", "section", "V", "n_etriers", "ø_etrier", "pas_etrier"))
+def etriers(mat, sec, V, n, diam, pas):
+    return _etriers(mat, sec, V, int(n), int(diam), float(pas))
+
+@CALCUL.noeud(entrees=("materiaux", "section", "V_lim", "n_etriers_r", "ø_etrier_r", "pas_etrier_r"))
+def etriers_reduits(mat, sec, V, n, diam, pas):
+    return _etriers(mat, sec, V, int(n), int(diam), float(pas))
+
+# ========= Blocs résultats réexécutables seuls (fragments) =========
+DIAM_OPTS = DIAMETRES
+
+def _sauvegarde():
+    """Copie des clés métier, rafraîchie à chaque run (page ou fragment), lue au clic sur « Enregistrer »."""
+    snap = st.session_state.setdefault("_sauvegarde", {})
+    snap.clear()
+    snap.update({k: st.session_state[k] for k in SAVE_KEYS if k in st.session_state})
+    return snap
+
+def _suggestions(As_req, sec, etat, limite=3):
+    """n × Ø les plus légers avec max(As_req, As_min) ≤ As ≤ As_max, tenant dans la largeur utile."""
+    largeur = (float(etat.get("b", 20)) - 2 * float(etat.get("enrobage", 5.0))) * 10   # mm
+    df = dispositions(max(As_req, sec["As_min"]), "poutre", As_max=sec["As_max"],
+                      largeur_mm=largeur, limite=limite)
+    return [f"{n}Ø{d} ({a:.0f} mm²)" for n, d, a in zip(df["n"], df["Ø [mm]"], df["As [mm²]"])]
+
+@fragment
+def bloc_armatures(noeud, titre, nom_As, suffixe, key_n, key_d):
+    etat = st.session_state
+    sec = CALCUL.valeur("section", etat)
+    n_cur = etat.get(key_n, 2)
+    d_cur = etat.get(key_d, 16)
+    r = CALCUL.valeur(noeud, etat)
+
+    with bloc(noeud, titre, r["etat"]):
+        ca1, ca2, ca3 = st.columns(3)
+        with ca1: st.markdown(f"**{nom_As} = {r['As']:.0f} mm²**")
+        with ca2: st.markdown(f"**Aₛ,min = {sec['As_min']:.0f} mm²**")
+        with ca3: st.markdown(f"**Aₛ,max = {sec['As_max']:.0f} mm²**")
+        sugg = _suggestions(r["As"], sec, etat)
+        if sugg:
+            st.caption("Dispositions les plus légères : " + " · ".join(sugg))
+
+        with saisie_groupee(f"form_{noeud}"):
+            row_c1, row_c2, row_c3 = st.columns([3, 3, 2])
+            with row_c1:
+                st.number_input(f"Nb barres{suffixe}", min_value=1, max_value=50,
+                                value=n_cur, step=1, key=key_n)
+            with row_c2:
+                st.selectbox(f"Ø (mm){suffixe}", DIAM_OPTS,
+                             index=DIAM_OPTS.index(d_cur), key=key_d)
+            with row_c3:
+                st.markdown(
+                    f"<div class='as-choisi'>( {CALCUL.valeur(noeud, etat)['As_choisi']:.0f} mm² )</div>",
+                    unsafe_allow_html=True
+                )
+    _sauvegarde()
+
+@fragment
+def bloc_etriers(noeud, titre, suffixe, key_n, key_d, key_pas):
+    etat = st.session_state
+    # placeholder pour afficher le bloc résultat AVANT visuellement,
+    # mais calculé APRÈS avoir lu les inputs
+    det_container = st.container()
+
+    # --- Inputs (après, pour que la session soit à jour)
+    n_cur   = int(etat.get(key_n, 1))
+    d_cur   = int(etat.get(key_d, 8))
+    pas_cur = float(etat.get(key_pas, 30.0))
+
+    with saisie_groupee(f"form_{noeud}"):
+        ce1, ce2, ce3 = st.columns(3)
+        with ce1:
+            st.number_input(f"Nbr. étriers{suffixe}", min_value=1, max_value=8,
+                            value=n_cur, step=1, key=key_n)
+        with ce2:
+            idx = DIAM_ETRIERS.index(d_cur) if d_cur in DIAM_ETRIERS else DIAM_ETRIERS.index(8)
+            st.selectbox(f"Ø étriers (mm){suffixe}", DIAM_ETRIERS, index=idx, key=key_d)
+        with ce3:
+            float_input_fr_simple(f"Pas choisi (cm){suffixe}", key=key_pas,
+                                  default=pas_cur, min_value=1.0)
+
+    r = CALCUL.valeur(noeud, etat)
+
+    # Rendu du bloc résultat (au-dessus) avec 3 colonnes (la 3e vide pour alignement)
+    with det_container:
+        with bloc(noeud, titre, r["etat"]):
+            cpt1, cpt2, cpt3 = st.columns([1,1,1])
+            with cpt1: st.markdown(f"**Pas théorique = {r['pas_th']:.1f} cm**")
+            with cpt2: st.markdown(f"**Pas maximal = {r['s_max']:.1f} cm**")
+            with cpt3: st.markdown("")  # colonne vide pour l’alignement visuel
+    _sauvegarde()
+
 # ========= Réinitialisation propre =========
 def _reset_module():
     current_page = st.session_state.get("page")
@@ -77,9 +247,11 @@ def show():
         st.session_state.retour_accueil_demande = False
         st.rerun()
 
+    inclure("blocs.css")
     st.markdown("## Poutre en béton armé")
 
     # ---------- Barre d’actions ----------
+    jalon("barre d’actions")
     btn1, btn2, btn3, btn4, btn5 = st.columns(5)
 
     with btn1:
@@ -92,10 +264,11 @@ def show():
             _reset_module()
 
     with btn3:
-        payload = {k: st.session_state[k] for k in SAVE_KEYS if k in st.session_state}
+        # données lues au clic : les blocs fragments modifient la copie sans relancer la page
+        payload = _sauvegarde()
         st.download_button(
             label="💾 Enregistrer",
-            data=json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8"),
+            data=lambda: json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8"),
             file_name="poutre_ba.json",
             mime="application/json",
             use_container_width=True,
@@ -166,13 +339,14 @@ def show():
             st.success("✅ Rapport généré")
 
     # ---------- Données béton ----------
-    with open("beton_classes.json", "r") as f:
-        beton_data = json.load(f)
+    jalon("saisie")
+    beton_data = load_beton_data()
 
     input_col_gauche, result_col_droite = st.columns([2, 3])
 
     # ---------- COLONNE GAUCHE ----------
     with input_col_gauche:
+        interrupteur_saisie_groupee()
         st.markdown("### Informations sur le projet")
         afficher_infos = st.checkbox("Ajouter les informations du projet", value=False)
         if afficher_infos:
@@ -187,253 +361,94 @@ def show():
         else:
             st.session_state.setdefault("date", datetime.today().strftime("%d/%m/%Y"))
 
-        st.markdown("### Caractéristiques de la poutre")
-        cbet, cacier = st.columns(2)
-        with cbet:
-            options = list(beton_data.keys())
-            default_beton = options[min(2, len(options)-1)]
-            current_beton = st.session_state.get("beton", default_beton)
-            st.selectbox("Classe de béton", options, index=options.index(current_beton), key="beton")
-        with cacier:
-            acier_opts = ["400", "500"]
-            cur_fyk = st.session_state.get("fyk", "500")
-            st.selectbox("Qualité d'acier [N/mm²]", acier_opts, index=acier_opts.index(cur_fyk), key="fyk")
-
-        csec1, csec2, csec3 = st.columns(3)
-        with csec1:
-            st.number_input("Larg. [cm]", min_value=5, max_value=1000,
-                            value=st.session_state.get("b", 20), step=5, key="b")
-        with csec2:
-            st.number_input("Haut. [cm]", min_value=5, max_value=1000,
-                            value=st.session_state.get("h", 40), step=5, key="h")
-        with csec3:
-            st.number_input("Enrob. (cm)", min_value=0.0, max_value=100.0,
-                            value=st.session_state.get("enrobage", 5.0), step=0.5, key="enrobage")
-
-        # Matériaux
-        beton = st.session_state["beton"]
-        fck       = beton_data[beton]["fck"]
-        fck_cube  = beton_data[beton]["fck_cube"]
-        alpha_b   = beton_data[beton]["alpha_b"]
-        mu_val    = beton_data[beton][f"mu_a{st.session_state['fyk']}"]
-        fyd       = int(st.session_state["fyk"]) / 1.5
+        # saisie groupée : un seul recalcul à la validation du formulaire
+        with saisie_groupee("poutre_saisie"):
+            st.markdown("### Caractéristiques de la poutre")
+            cbet, cacier = st.columns(2)
+            with cbet:
+                options = list(beton_data.keys())
+                default_beton = options[min(2, len(options)-1)]
+                current_beton = st.session_state.get("beton", default_beton)
+                st.selectbox("Classe de béton", options, index=options.index(current_beton), key="beton")
+            with cacier:
+                acier_opts = ["400", "500"]
+                cur_fyk = st.session_state.get("fyk", "500")
+                st.selectbox("Qualité d'acier [N/mm²]", acier_opts, index=acier_opts.index(cur_fyk), key="fyk")
+
+            csec1, csec2, csec3 = st.columns(3)
+            with csec1:
+                st.number_input("Larg. [cm]", min_value=5, max_value=1000,
+                                value=st.session_state.get("b", 20), step=5, key="b")
+            with csec2:
+                st.number_input("Haut. [cm]", min_value=5, max_value=1000,
+                                value=st.session_state.get("h", 40), step=5, key="h")
+            with csec3:
+                st.number_input("Enrob. (cm)", min_value=0.0, max_value=100.0,
+                                value=st.session_state.get("enrobage", 5.0), step=0.5, key="enrobage")
 
         st.markdown("### Sollicitations")
-        cmom, cev  = st.columns(2)
-        with cmom:
-            M_inf = float_input_fr_simple("Moment inférieur M (kNm)", key="M_inf", default=0.0, min_value=0.0)
+        # cases hors formulaire : elles affichent ou masquent M_sup / V_réduit tout de suite
+        ccase1, ccase2 = st.columns(2)
+        with ccase1:
             m_sup = st.checkbox("Ajouter un moment supérieur", key="ajouter_moment_sup",
                                 value=st.session_state.get("ajouter_moment_sup", False))
-            if m_sup:
-                M_sup = float_input_fr_simple("Moment supérieur M_sup (kNm)", key="M_sup", default=0.0, min_value=0.0)
-            else:
-                M_sup = 0.0
-                if "M_sup" in st.session_state:
-                    del st.session_state["M_sup"]
-        with cev:
-            V = float_input_fr_simple("Effort tranchant V (kN)", key="V", default=0.0, min_value=0.0)
+        with ccase2:
             v_sup = st.checkbox("Ajouter un effort tranchant réduit", key="ajouter_effort_reduit",
                                 value=st.session_state.get("ajouter_effort_reduit", False))
-            if v_sup:
-                V_lim = float_input_fr_simple("Effort tranchant réduit V_réduit (kN)", key="V_lim", default=0.0, min_value=0.0)
-            else:
-                V_lim = 0.0
-                if "V_lim" in st.session_state:
-                    del st.session_state["V_lim"]
+        with saisie_groupee("poutre_sollicitations"):
+            cmom, cev  = st.columns(2)
+            with cmom:
+                M_inf = float_input_fr_simple("Moment inférieur M (kNm)", key="M_inf", default=0.0, min_value=0.0)
+                if m_sup:
+                    M_sup = float_input_fr_simple("Moment supérieur M_sup (kNm)", key="M_sup", default=0.0, min_value=0.0)
+                else:
+                    M_sup = 0.0
+                    if "M_sup" in st.session_state:
+                        del st.session_state["M_sup"]
+            with cev:
+                V = float_input_fr_simple("Effort tranchant V (kN)", key="V", default=0.0, min_value=0.0)
+                if v_sup:
+                    V_lim = float_input_fr_simple("Effort tranchant réduit V_réduit (kN)", key="V_lim", default=0.0, min_value=0.0)
+                else:
+                    V_lim = 0.0
+                    if "V_lim" in st.session_state:
+                        del st.session_state["V_lim"]
 
     # ---------- COLONNE DROITE ----------
+    jalon("résultats")
+    etat = st.session_state
     with result_col_droite:
         st.markdown("### Dimensionnement")
 
         # ---- Vérification de la hauteur ----
-        M_max      = max(st.session_state.get("M_inf", 0.0), st.session_state.get("M_sup", 0.0))
-        b = st.session_state["b"]; h = st.session_state["h"]; enrobage = st.session_state["enrobage"]
-        hmin_calc  = math.sqrt((M_max * 1e6) / (alpha_b * b * 10 * mu_val)) / 10  # cm
-        etat_h     = "ok" if hmin_calc + enrobage <= h else "nok"
-        open_bloc("Vérification de la hauteur", etat_h)
-        st.markdown(f"**h,min** = {hmin_calc:.1f} cm  \n"
-                    f"h,min + enrobage = {hmin_calc + enrobage:.1f} cm ≤ h = {h} cm")
-        close_bloc()
-
-        # ---- Données section (communes) ----
-        d_utile = h - enrobage  # cm
-        As_min  = 0.0013 * b * h * 1e2
-        As_max  = 0.04   * b * h * 1e2
-
-        # --- Armatures inférieures ---
-        M_inf = st.session_state.get("M_inf", 0.0)
-        As_inf = (M_inf * 1e6) / (fyd * 0.9 * d_utile * 10)
-        diam_opts = [6, 8, 10, 12, 16, 20, 25, 32, 40]
-        n_inf_cur = st.session_state.get("n_as_inf", 2)
-        diam_inf_cur = st.session_state.get("ø_as_inf", 16)
-        As_inf_choisi = n_inf_cur * (math.pi * (diam_inf_cur/2)**2)
-        ok_inf = (As_min <= As_inf_choisi <= As_max) and (As_inf_choisi >= As_inf)
-        etat_inf = "ok" if ok_inf else "nok"
-        
-        open_bloc("Armatures inférieures", etat_inf)
-        ca1, ca2, ca3 = st.columns(3)
-        with ca1: st.markdown(f"**Aₛ,inf = {As_inf:.0f} mm²**")
-        with ca2: st.markdown(f"**Aₛ,min = {As_min:.0f} mm²**")
-        with ca3: st.markdown(f"**Aₛ,max = {As_max:.0f} mm²**")
-        
-        row1_c1, row1_c2, row1_c3 = st.columns([3, 3, 2])
-        with row1_c1:
-            st.number_input("Nb barres", min_value=1, max_value=50,
-                            value=n_inf_cur, step=1, key="n_as_inf")
-        with row1_c2:
-            st.selectbox("Ø (mm)", diam_opts,
-                         index=diam_opts.index(diam_inf_cur), key="ø_as_inf")
-        n_val = st.session_state.get("n_as_inf", n_inf_cur)
-        d_val = st.session_state.get("ø_as_inf", diam_inf_cur)
-        As_inf_choisi = n_val * (math.pi * (d_val/2)**2)
-        with row1_c3:
-            st.markdown(
-                f"<div style='margin-top:30px;font-weight:600;white-space:nowrap;'>( {As_inf_choisi:.0f} mm² )</div>",
-                unsafe_allow_html=True
-        )
-        close_bloc()
-
-        # ---- Armatures supérieures (si M_sup) ----
-        if st.session_state.get("ajouter_moment_sup", False):
-            M_sup = st.session_state.get("M_sup", 0.0)
-            As_sup = (M_sup * 1e6) / (fyd * 0.9 * d_utile * 10)
-            n_sup_cur = st.session_state.get("n_as_sup", 2)
-            diam_sup_cur = st.session_state.get("ø_as_sup", 16)
-            As_sup_choisi = n_sup_cur * (math.pi * (diam_sup_cur/2)**2)
-            ok_sup = (As_min <= As_sup_choisi <= As_max) and (As_sup_choisi >= As_sup)
-            etat_sup = "ok" if ok_sup else "nok"
-        
-            open_bloc("Armatures supérieures", etat_sup)
-            cs1, cs2, cs3 = st.columns(3)
-            with cs1: st.markdown(f"**Aₛ,sup = {As_sup:.0f} mm²**")
-            with cs2: st.markdown(f"**Aₛ,min = {As_min:.0f} mm²**")
-            with cs3: st.markdown(f"**Aₛ,max = {As_max:.0f} mm²**")
-        
-            row2_c1, row2_c2, row2_c3 = st.columns([3, 3, 2])
-            with row2_c1:
-                st.number_input("Nb barres (sup.)", min_value=1, max_value=50,
-                                value=n_sup_cur, step=1, key="n_as_sup")
-            with row2_c2:
-                st.selectbox("Ø (mm) (sup.)", diam_opts,
-                             index=diam_opts.index(diam_sup_cur), key="ø_as_sup")
-            n_s = st.session_state.get("n_as_sup", n_sup_cur)
-            d_s = st.session_state.get("ø_as_sup", diam_sup_cur)
-            As_sup_choisi = n_s * (math.pi * (d_s/2)**2)
-            with row2_c3:
-                st.markdown(
-                    f"<div style='margin-top:30px;font-weight:600;white-space:nowrap;'>( {As_sup_choisi:.0f} mm² )</div>",
-                    unsafe_allow_html=True
-                )
-            close_bloc()
+        h = etat["h"]; enrobage = etat["enrobage"]
+        r_h = CALCUL.valeur("hauteur", etat)
+        with bloc("hauteur", "Vérification de la hauteur", r_h["etat"]):
+            st.markdown(f"**h,min** = {r_h['hmin']:.1f} cm  \n"
+                        f"h,min + enrobage = {r_h['hmin'] + enrobage:.1f} cm ≤ h = {h} cm")
+
+        # ---- Armatures inférieures / supérieures (si M_sup) ----
+        bloc_armatures("armatures_inf", "Armatures inférieures", "Aₛ,inf", "", "n_as_inf", "ø_as_inf")
+        if etat.get("ajouter_moment_sup", False):
+            bloc_armatures("armatures_sup", "Armatures supérieures", "Aₛ,sup", " (sup.)", "n_as_sup", "ø_as_sup")
 
         # ---- Vérification effort tranchant ----
-        V = st.session_state.get("V", 0.0)
-        tau_1 = 0.016 * fck_cube / 1.05
-        tau_2 = 0.032 * fck_cube / 1.05
-        tau_4 = 0.064 * fck_cube / 1.05
-
-        if V > 0:
-            tau = V * 1e3 / (0.75 * b * h * 100)
-            if   tau <= tau_1: besoin, etat_tau, nom_lim, tau_lim = "Pas besoin d’étriers", "ok",  "τ_adm_I", tau_1
-            elif tau <= tau_2: besoin, etat_tau, nom_lim, tau_lim = "Besoin d’étriers",      "ok",  "τ_adm_II", tau_2
-            elif tau <= tau_4: besoin, etat_tau, nom_lim, tau_lim = "Besoin de barres inclinées et d’étriers", "warn", "τ_adm_IV", tau_4
-            else:              besoin, etat_tau, nom_lim, tau_lim = "Pas acceptable",        "nok", "τ_adm_IV", tau_4
-
-            open_bloc("Vérification de l'effort tranchant", etat_tau)
-            st.markdown(f"τ = {tau:.2f} N/mm² ≤ {nom_lim} = {tau_lim:.2f} N/mm² → {besoin}")
-            close_bloc()
+        if etat.get("V", 0.0) > 0:
+            r_tau = CALCUL.valeur("cisaillement", etat)
+            with bloc("cisaillement", "Vérification de l'effort tranchant", r_tau["etat"]):
+                st.markdown(f"τ = {r_tau['tau']:.2f} N/mm² ≤ {r_tau['nom_lim']} = {r_tau['tau_lim']:.2f} N/mm² → {r_tau['besoin']}")
 
             # ---- Détermination des étriers ----
-            # placeholder pour afficher le bloc résultat AVANT visuellement,
-            # mais calculé APRÈS avoir lu les inputs
-            det_container = st.container()
-            
-            # --- Inputs (après, pour que la session soit à jour)
-            n_etriers_cur = int(st.session_state.get("n_etriers", 1))
-            d_etrier_cur  = int(st.session_state.get("ø_etrier", 8))
-            pas_cur       = float(st.session_state.get("pas_etrier", 30.0))
-            
-            ce1, ce2, ce3 = st.columns(3)
-            with ce1:
-                st.number_input("Nbr. étriers", min_value=1, max_value=8,
-                                value=n_etriers_cur, step=1, key="n_etriers")
-            with ce2:
-                diam_list = [6, 8, 10, 12]
-                idx = diam_list.index(d_etrier_cur) if d_etrier_cur in diam_list else diam_list.index(8)
-                st.selectbox("Ø étriers (mm)", diam_list, index=idx, key="ø_etrier")
-            with ce3:
-                float_input_fr_simple("Pas choisi (cm)", key="pas_etrier",
-                                      default=pas_cur, min_value=1.0)
-            
-            # Relecture des valeurs à jour
-            n_etriers_cur = int(st.session_state["n_etriers"])
-            d_etrier_cur  = int(st.session_state["ø_etrier"])
-            pas_cur       = float(st.session_state["pas_etrier"])
-            
-            # Calculs (en cm)
-            Ast_e  = n_etriers_cur * 2 * math.pi * (d_etrier_cur/2)**2      # mm²
-            pas_th = Ast_e * fyd * d_utile * 10 / (10 * V * 1e3)            # cm
-            s_max  = min(0.75 * d_utile, 30.0)                              # cm
-            
-            etat_pas = "ok" if pas_cur <= min(pas_th, s_max) else "nok"
-            
-            # Rendu du bloc résultat (au-dessus) avec 3 colonnes (la 3e vide pour alignement)
-            with det_container:
-                open_bloc("Détermination des étriers", etat_pas)
-                cpt1, cpt2, cpt3 = st.columns([1,1,1])
-                with cpt1: st.markdown(f"**Pas théorique = {pas_th:.1f} cm**")
-                with cpt2: st.markdown(f"**Pas maximal = {s_max:.1f} cm**")
-                with cpt3: st.markdown("")  # colonne vide pour l’alignement visuel
-                close_bloc()
+            bloc_etriers("etriers", "Détermination des étriers", "", "n_etriers", "ø_etrier", "pas_etrier")
 
         # ---- Vérification effort tranchant réduit ----
-        if st.session_state.get("ajouter_effort_reduit", False) and st.session_state.get("V_lim", 0.0) > 0:
-            V_lim = st.session_state["V_lim"]
-            tau_r = V_lim * 1e3 / (0.75 * b * h * 100)
-            if   tau_r <= tau_1: besoin_r, etat_r, nom_lim_r, tau_lim_r = "Pas besoin d’étriers", "ok",  "τ_adm_I", tau_1
-            elif tau_r <= tau_2: besoin_r, etat_r, nom_lim_r, tau_lim_r = "Besoin d’étriers",     "ok",  "τ_adm_II", tau_2
-            elif tau_r <= tau_4: besoin_r, etat_r, nom_lim_r, tau_lim_r = "Besoin de barres inclinées et d’étriers", "warn", "τ_adm_IV", tau_4
-            else:                 besoin_r, etat_r, nom_lim_r, tau_lim_r = "Pas acceptable",       "nok", "τ_adm_IV", tau_4
-
-            open_bloc("Vérification de l'effort tranchant réduit", etat_r)
-            st.markdown(f"τ = {tau_r:.2f} N/mm² ≤ {nom_lim_r} = {tau_lim_r:.2f} N/mm² → {besoin_r}")
-            close_bloc()
-
-            # ---- Détermination des étriers réduits ----
-            det_r_container = st.container()
-            
-            n_et_r_cur = int(st.session_state.get("n_etriers_r", 1))
-            d_et_r_cur = int(st.session_state.get("ø_etrier_r", 8))
-            pas_r_cur  = float(st.session_state.get("pas_etrier_r", 30.0))
-            
-            cr1, cr2, cr3 = st.columns(3)
-            with cr1:
-                st.number_input("Nbr. étriers (réduit)", min_value=1, max_value=8,
-                                value=n_et_r_cur, step=1, key="n_etriers_r")
-            with cr2:
-                diam_list_r = [6, 8, 10, 12]
-                idxr = diam_list_r.index(d_et_r_cur) if d_et_r_cur in diam_list_r else diam_list_r.index(8)
-                st.selectbox("Ø étriers (mm) (réduit)", diam_list_r, index=idxr, key="ø_etrier_r")
-            with cr3:
-                float_input_fr_simple("Pas choisi (cm) (réduit)", key="pas_etrier_r",
-                                      default=pas_r_cur, min_value=1.0)
-            
-            # Relecture à jour
-            n_et_r_cur = int(st.session_state["n_etriers_r"])
-            d_et_r_cur = int(st.session_state["ø_etrier_r"])
-            pas_r_cur  = float(st.session_state["pas_etrier_r"])
-            
-            # Calculs (en cm) – V_lim > 0 garanti par le if parent
-            Ast_er   = n_et_r_cur * 2 * math.pi * (d_et_r_cur/2)**2         # mm²
-            pas_th_r = Ast_er * fyd * d_utile * 10 / (10 * V_lim * 1e3)     # cm
-            s_max_r  = min(0.75 * d_utile, 30.0)                            # cm
-            
-            etat_pas_r = "ok" if pas_r_cur <= min(pas_th_r, s_max_r) else "nok"
-            
-            with det_r_container:
-                open_bloc("Détermination des étriers réduits", etat_pas_r)
-                crp1, crp2, crp3 = st.columns([1,1,1])
-                with crp1: st.markdown(f"**Pas théorique = {pas_th_r:.1f} cm**")
-                with crp2: st.markdown(f"**Pas maximal = {s_max_r:.1f} cm**")
-                with crp3: st.markdown("")  # colonne vide pour alignement
-                close_bloc()
+        if etat.get("ajouter_effort_reduit", False) and etat.get("V_lim", 0.0) > 0:
+            r_tau_r = CALCUL.valeur("cisaillement_reduit", etat)
+            with bloc("cisaillement_reduit", "Vérification de l'effort tranchant réduit", r_tau_r["etat"]):
+                st.markdown(f"τ = {r_tau_r['tau']:.2f} N/mm² ≤ {r_tau_r['nom_lim']} = {r_tau_r['tau_lim']:.2f} N/mm² → {r_tau_r['besoin']}")
+
+            # ---- Détermination des étriers réduits (V_lim > 0 garanti par le if parent) ----
+            bloc_etriers("etriers_reduits", "Détermination des étriers réduits", " (réduit)",
+                         "n_etriers_r", "ø_etrier_r", "pas_etrier_r")
+
+    _sauvegarde()
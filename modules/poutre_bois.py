@@ -1,8 +1,11 @@
 # modules/poutre_bois.py
 import math
 import numpy as np
+import pandas as pd
 import streamlit as st
 
+from modules.cache import cache
+
 # ============================================================
 # BDD intégrée (valeurs usuelles EN 338 – à ajuster si besoin)
 # unités: MPa pour contraintes/modules, kg/m3 pour masses
@@ -36,6 +39,14 @@ KMOD = {                                 # par classe de service et durée domin
 }
 KDEF = {1:0.60, 2:0.80, 3:2.00}
 
+# EC5-1-2 (feu, méthode de la section réduite) – bois massif résineux
+FIRE_DURATIONS = [15, 30, 45, 60, 90, 120]   # min (R15…R120)
+BETA_N     = 0.8                             # mm/min, vitesse de carbonisation fictive (ρk ≥ 290 kg/m³)
+D0_FI      = 7.0                             # mm, couche à résistance nulle
+K_FI       = 1.25                            # f20 = kfi·fk (bois massif)
+GAMMA_M_FI = 1.0
+KMOD_FI    = 1.0
+
 # --- géométrie rectangulaire
 def sect_rect(b_mm, h_mm):
     A = b_mm*h_mm                    # mm²
@@ -57,6 +68,39 @@ def kh_depth(h_mm):
     kh = (150.0/max(h_mm,1.0))**0.2
     return min(max(kh,0.6),1.3)
 
+# --- profondeur de carbonisation efficace d_ef = βn·t + k0·d0 (accepte un vecteur de durées)
+def char_depth_ef(t_min):
+    t = np.asarray(t_min, dtype=float)
+    k0 = np.minimum(t/20.0, 1.0)
+    return BETA_N*t + k0*D0_FI      # mm
+
+# --- section résiduelle : 3 faces (dessous + côtés) ou 4 faces exposées
+def residual_dims(b_mm, h_mm, t_min, faces=3):
+    d_ef = char_depth_ef(t_min)
+    b_ef = np.maximum(np.asarray(b_mm, dtype=float) - 2.0*d_ef, 0.0)
+    h_ef = np.maximum(np.asarray(h_mm, dtype=float) - (2.0 if faces == 4 else 1.0)*d_ef, 0.0)
+    return b_ef, h_ef
+
+# --- matrice d'utilisation feu : sections (lignes) × durées (colonnes), mise en cache par jeu de charges
+@cache(disque=True)
+def fire_util_matrix(cls, b_list, h_list, durations, M_fi, V_fi, faces=3):
+    mat = TIMBER_BDD[cls]
+    fm_fi = KMOD_FI * K_FI * mat["fm_k"] / GAMMA_M_FI
+    fv_fi = KMOD_FI * K_FI * mat["fv_k"] / GAMMA_M_FI
+
+    b = np.asarray(b_list, dtype=float)[:, None]
+    h = np.asarray(h_list, dtype=float)[:, None]
+    t = np.asarray(durations, dtype=float)[None, :]
+    b_ef, h_ef = residual_dims(b, h, t, faces)
+
+    valid = (b_ef > 0) & (h_ef > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        A_ef, I_ef, W_ef = sect_rect(b_ef, h_ef)
+        u_m = (M_fi*1e6 / W_ef) / fm_fi
+        u_v = shear_tau_rect(V_fi, b_ef, h_ef) / fv_fi
+    util = np.where(valid, np.maximum(u_m, u_v), np.inf)
+    return util, b_ef, h_ef
+
 def show():
     st.header("Dimensionnement **poutre en bois** (EC5)")
 
@@ -101,6 +145,16 @@ def show():
         check_fc90 = st.toggle("Compression ⟂ fil à l’appui", value=False)
         a_app_mm = st.number_input("Largeur d’appui a (mm)", 30.0, 200.0, 60.0, step=5.0, disabled=not check_fc90)
 
+        st.subheader("6) Résistance au feu (option)")
+        check_fire = st.toggle("Vérification au feu (section réduite EC5-1-2)", value=False)
+        f1, f2, f3 = st.columns(3)
+        with f1:
+            faces = st.radio("Faces exposées", [3, 4], horizontal=True, disabled=not check_fire)
+        with f2:
+            psi_fi = st.number_input("ψ_fi (comb. accidentelle)", 0.0, 1.0, 0.50, step=0.05, disabled=not check_fire)
+        with f3:
+            R_req = st.selectbox("Exigence", [f"R{t}" for t in FIRE_DURATIONS], index=3, disabled=not check_fire)
+
     # -------------------- Calculs
     A, I, W = sect_rect(b_mm, h_mm)
     kh = kh_depth(h_mm)
@@ -144,6 +198,22 @@ def show():
     u_wi = w_inst / lim_inst_mm if lim_inst_mm>0 else np.nan
     u_wf = w_fin  / lim_fin_mm  if lim_fin_mm>0  else np.nan
 
+    # Feu : toutes les sections candidates × toutes les durées en un seul calcul
+    if check_fire:
+        q_fi = qG + psi_fi*qQ
+        M_fi = q_fi * L_m**2 / 8.0
+        V_fi = q_fi * L_m / 2.0
+        cands = [(s["tag"], s["b"], s["h"]) for s in SECTIONS_STD]
+        # section courante repérée par ses dimensions (une section libre 100,5×200 n’est pas la 100×200)
+        i_cur = next((i for i, c in enumerate(cands) if c[1] == b_mm and c[2] == h_mm), None)
+        if i_cur is None:
+            i_cur = len(cands)
+            cands.append((f"{b_mm:g}x{h_mm:g}", b_mm, h_mm))
+        util_fi, b_ef_fi, h_ef_fi = fire_util_matrix(
+            cls, tuple(c[1] for c in cands), tuple(c[2] for c in cands),
+            tuple(FIRE_DURATIONS), M_fi, V_fi, faces,
+        )
+
     # -------------------- Colonne droite : résultats
     with right:
         st.subheader("Résultats")
@@ -173,6 +243,24 @@ def show():
             st.write(f"Finale : w = {w_fin:.1f} mm | lim. {lim_fin} = {lim_fin_mm:.1f} mm")
             (st.success if u_wf<=1.0 else st.error)(f"Taux : **{u_wf*100:.0f}%**")
 
+        if check_fire:
+            st.markdown("#### Feu (section réduite)")
+            j_req = FIRE_DURATIONS.index(int(R_req[1:]))
+            u_cur = util_fi[i_cur, j_req]
+            st.write(f"- **q_fi** = G + ψ_fi·Q = {q_fi:.2f} kN/m ; **M_fi** = {M_fi:.2f} kN·m ; **V_fi** = {V_fi:.2f} kN")
+            st.write(f"- **d_ef** ({R_req}) = {float(char_depth_ef(FIRE_DURATIONS[j_req])):.1f} mm → "
+                     f"section résiduelle {b_ef_fi[i_cur, j_req]:.0f}×{h_ef_fi[i_cur, j_req]:.0f} mm")
+            (st.success if u_cur<=1.0 else st.error)(
+                f"{R_req} : **{u_cur*100:.0f}%**" if np.isfinite(u_cur) else f"{R_req} : section entièrement carbonisée"
+            )
+
+            cells = np.where(util_fi <= 1.0, "✅ ", "❌ ").astype(object) + np.where(
+                np.isfinite(util_fi), np.char.mod("%.0f%%", np.nan_to_num(util_fi*100, posinf=0.0)), "—"
+            )
+            df_fi = pd.DataFrame(cells, index=[c[0] for c in cands], columns=[f"R{t}" for t in FIRE_DURATIONS])
+            with st.expander("Matrice sections × durées", expanded=False):
+                st.dataframe(df_fi, use_container_width=True)
+
         st.caption(
             f"{cls}: fm,k={mat['fm_k']} MPa, fv,k={mat['fv_k']} MPa, fc,90,k={mat['fc90_k']} MPa, "
             f"E0,mean={mat['E0_mean']} MPa, Gmean={mat['G_mean']} MPa | "
@@ -181,4 +269,5 @@ def show():
 
         st.markdown("---")
         st.caption("Hypothèses: poutre simplement appuyée, charge uniforme. Vérifs EC5 simplifiées (flexion, cisaillement, flèches). "
+                   "Feu : section réduite EC5-1-2 (βn = 0,8 mm/min, d0 = 7 mm, kfi = 1,25). "
                    "Ajuste la BDD et les facteurs selon ton Annexe Nationale.")
@@ -0,0 +1,163 @@
+# modules/prechauffage.py
+"""
+Préchauffage des caches au démarrage du serveur.
+
+Sans préchauffage, le premier utilisateur de chaque page paie l’import des
+modules, le chargement des catalogues et la construction des tables de
+recherche. Les étapes ci-dessous remplissent les caches (modules.cache) du
+processus une fois pour toutes :
+
+  - au premier import de streamlit_app (au_demarrage(), une seule fois par
+    processus ; PRECHAUFFAGE=0 dans l’environnement pour le désactiver) ;
+  - en ligne de commande, pour mesurer chaque étape ou compiler les .pyc
+    après un déploiement :
+
+    python -m modules.prechauffage [--etape catalogues ...]
+
+Chaque étape est chronométrée ; une erreur est rapportée sans interrompre les
+suivantes ni le démarrage de l’application.
+"""
+import argparse
+import importlib
+import os
+import sys
+import threading
+import time
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PAGES = (
+    "accueil", "poutre", "dalle", "corniere", "garde_corps", "poutre_bois",
+    "tableau_armatures", "age_beton", "choix_profile", "flambement",
+    "tableau_profiles", "enrobage", "rigidite_sol",
+)
+
+_verrou = threading.Lock()
+_rapport = None     # dernier rapport de au_demarrage() (None : pas encore lancé)
+
+
+def _imports():
+    for nom in PAGES:
+        importlib.import_module(f"modules.{nom}")
+    return f"{len(PAGES)} pages"
+
+
+def _materiaux():
+    from modules import poutre, poutre_bois, rigidite_sol
+
+    betons = poutre.load_beton_data()
+    _, sols = rigidite_sol.load_abaque()
+    return f"{len(betons)} bétons, {len(poutre_bois.TIMBER_BDD)} bois, {len(sols)} sols"
+
+
+def _catalogues():
+    from modules import choix_profile, corniere, tableau_profiles
+
+    profils = choix_profile.load_profiles()
+    cat = tableau_profiles.load_catalogue()
+    return f"{len(profils)} profilés, {len(cat['nom'])} lignes catalogue, {len(corniere.ANGLES_STD)} cornières"
+
+
+def _tables():
+    from modules.armatures import index_dispositions
+    from modules.tableau_armatures import load_tableau
+
+    n = sum(len(index_dispositions(t)["As"]) for t in ("poutre", "dalle"))
+    return f"{len(load_tableau())} sections, {n} dispositions"
+
+
+def _recherche():
+    from modules import corniere, garde_corps
+    from modules.recherche import index_sections
+
+    listes = (corniere.ANGLES_NOMS, garde_corps.STD_RHS, garde_corps.STD_CHS)
+    for designations in listes:
+        index_sections(tuple(designations))
+    return f"{len(listes)} index"
+
+
+def _interface():
+    from modules import logos, styles
+
+    logos.css_logos()
+    for nom in sorted(os.listdir(styles.STATIC)):
+        if nom.endswith(".css"):
+            styles._feuille(nom)
+    return "logos, feuilles de style"
+
+
+# (nom, libellé, fonction) dans l’ordre d’exécution
+ETAPES = (
+    ("imports", "Import des pages", _imports),
+    ("materiaux", "Matériaux (béton, bois, sols)", _materiaux),
+    ("catalogues", "Catalogues profilés et cornières", _catalogues),
+    ("tables", "Tables d’armatures", _tables),
+    ("recherche", "Index de recherche des sections", _recherche),
+    ("interface", "Logos et CSS", _interface),
+)
+
+
+def prechauffer(etapes=None):
+    """
+    Exécute les étapes demandées (défaut : toutes).
+    Les chargeurs lisent les fichiers de données en chemins relatifs : le
+    répertoire courant doit être la racine du dépôt, comme pour l’application.
+    Renvoie [{"etape", "libelle", "duree_ms", "resultat", "erreur"}, ...].
+    """
+    rapport = []
+    for nom, libelle, fn in ETAPES:
+        if etapes and nom not in etapes:
+            continue
+        t0 = time.perf_counter()
+        resultat, erreur = None, None
+        try:
+            resultat = fn()
+        except Exception as e:
+            erreur = f"{type(e).__name__}: {e}"
+        rapport.append({
+            "etape": nom, "libelle": libelle,
+            "duree_ms": (time.perf_counter() - t0) * 1000.0,
+            "resultat": resultat, "erreur": erreur,
+        })
+    return rapport
+
+
+def formater(rapport):
+    """Rapport en texte aligné (une ligne par étape + total)."""
+    lignes = [f"{'étape':34s} {'durée [ms]':>11s}  détail"]
+    for r in rapport:
+        detail = f"ERREUR {r['erreur']}" if r["erreur"] else r["resultat"]
+        lignes.append(f"{r['libelle']:34s} {r['duree_ms']:11.1f}  {detail}")
+    lignes.append(f"{'total':34s} {sum(r['duree_ms'] for r in rapport):11.1f}")
+    return "\n".join(lignes)
+
+
+def au_demarrage():
+    """
+    Préchauffage au premier import de streamlit_app (une fois par processus,
+    les reruns suivants ne font rien). Le rapport est écrit sur stderr.
+    """
+    global _rapport
+    if os.environ.get("PRECHAUFFAGE", "1") == "0":
+        return None
+    with _verrou:
+        if _rapport is None:
+            _rapport = prechauffer()
+            print("Préchauffage des caches :\n" + formater(_rapport), file=sys.stderr)
+    return _rapport
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    p.add_argument("--etape", action="append", choices=[e[0] for e in ETAPES],
+                   help="étape à exécuter (répétable ; défaut : toutes)")
+    a = p.parse_args(argv)
+    sys.path.insert(0, RACINE)
+    os.chdir(RACINE)        # processus dédié : aucune session ne lit de fichier en parallèle
+    rapport = prechauffer(a.etape)
+    print(formater(rapport))
+    return 1 if any(r["erreur"] for r in rapport) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
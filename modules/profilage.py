@@ -0,0 +1,125 @@
+# modules/profilage.py
+"""
+Chronométrage d’une page en mode ?profile=1.
+
+Le relevé est attaché au thread du script (un par session Streamlit) et
+n’existe que pendant un run profilé : hors de ce mode, jalon() et releve()
+se limitent à une lecture d’attribut, sans mesure ni allocation.
+
+  - jalon("saisie") : étape de la page ; le temps écoulé jusqu’au jalon
+    suivant (ou la fin de la page) lui est attribué, sans réindenter le code ;
+  - les nœuds recalculés des graphes (modules.graphe) et les noyaux mis en
+    cache (modules.cache, hors succès) sont chronométrés automatiquement ;
+  - page(nom, show) exécute show(), puis affiche le tableau des temps et,
+    sur demande, un profil cProfile du run à télécharger (.prof, lisible par
+    pstats / snakeviz).
+
+Un rerun limité à un fragment n’exécute pas streamlit_app : il n’est pas profilé.
+"""
+import cProfile
+import io
+import marshal
+import pstats
+import threading
+import time
+
+CLE_CPROFILE = "_profil_cprofile"
+
+_local = threading.local()
+
+
+class Releve:
+    def __init__(self, page):
+        self.page = page
+        self.t0 = time.perf_counter()
+        self.lignes = []                 # (début, type, nom, durée [ms])
+        self._jalon = ("étape", "préparation", self.t0)
+        self.total_ms = None
+
+    def jalon(self, nom):
+        maintenant = time.perf_counter()
+        type_, ancien, t = self._jalon
+        self.lignes.append((t, type_, ancien, (maintenant - t) * 1000.0))
+        self._jalon = ("étape", nom, maintenant)
+
+    def chrono(self, type_, nom, fn, *args, **kwargs):
+        """Appelle fn en ajoutant une ligne (type_, nom, durée)."""
+        t = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self.lignes.append((t, type_, nom, (time.perf_counter() - t) * 1000.0))
+
+    def terminer(self):
+        self.jalon(None)
+        self.total_ms = (time.perf_counter() - self.t0) * 1000.0
+
+
+def releve():
+    """Relevé du run en cours (None hors mode profilage)."""
+    return getattr(_local, "releve", None)
+
+
+def jalon(nom):
+    """Début de l’étape nom de la page (sans effet hors mode profilage)."""
+    r = getattr(_local, "releve", None)
+    if r is not None:
+        r.jalon(nom)
+
+
+def executer(nom, show, capturer=False):
+    """Exécute show() sous relevé (et cProfile si capturer) → (Releve, cProfile.Profile | None)."""
+    r = Releve(nom)
+    prof = cProfile.Profile() if capturer else None
+    _local.releve = r
+    try:
+        if prof is not None:
+            prof.enable()
+        show()
+    finally:
+        if prof is not None:
+            prof.disable()
+        _local.releve = None
+        r.terminer()
+    return r, prof
+
+
+def tableau(r):
+    """Lignes du tableau des temps, dans l’ordre d’exécution (calculs sous leur étape)."""
+    total = r.total_ms or 1e-9
+    lignes = [
+        {"type": t, "étape": n if t == "étape" else f"  └ {n}",
+         "durée [ms]": round(ms, 2), "part": f"{ms / total:.0%}"}
+        for _, t, n, ms in sorted(r.lignes, key=lambda l: (l[0], l[1] != "étape"))
+    ]
+    lignes.append({"type": "page", "étape": r.page, "durée [ms]": round(r.total_ms, 2), "part": "100%"})
+    return lignes
+
+
+def export_cprofile(prof):
+    """Profil au format de Profile.dump_stats (octets)."""
+    prof.create_stats()
+    return marshal.dumps(prof.stats)
+
+
+def resume_cprofile(prof, n=15):
+    flux = io.StringIO()
+    pstats.Stats(prof, stream=flux).strip_dirs().sort_stats("cumulative").print_stats(n)
+    return flux.getvalue()
+
+
+def page(nom, show):
+    """Exécute la page puis affiche le panneau de profilage en bas de page."""
+    import streamlit as st
+
+    r, prof = executer(nom, show, capturer=st.session_state.get(CLE_CPROFILE, False))
+    with st.expander(f"⏱️ Profil – {nom} : {r.total_ms:.0f} ms", expanded=True):
+        st.dataframe(tableau(r), hide_index=True, use_container_width=True)
+        st.checkbox("Capturer un profil cProfile des runs suivants", key=CLE_CPROFILE)
+        if prof is not None:
+            st.code(resume_cprofile(prof), language=None)
+            st.download_button(
+                "⬇️ Profil cProfile (.prof)", data=export_cprofile(prof),
+                file_name=f"profil_{nom}_{time.strftime('%Y%m%d_%H%M%S')}.prof",
+                mime="application/octet-stream", key="_profil_dl",
+            )
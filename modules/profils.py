@@ -0,0 +1,101 @@
+# modules/profils.py
+"""
+Catalogue des profilés métalliques en colonnes (un tableau numpy par propriété).
+
+Le fichier profiles_test.json ({nom: {propriété: valeur}}) est lu une fois
+et transposé : filtres, tri et pagination se font par masques et argsort
+sur les colonnes, et seule la page demandée est convertie en DataFrame.
+"""
+import json
+import re
+
+import numpy as np
+import pandas as pd
+
+# propriété → libellé affiché (unités du fichier)
+COLONNES = {
+    "masse": "masse [kg/m]",
+    "h": "h [mm]", "b": "b [mm]", "tw": "tw [mm]", "tf": "tf [mm]", "r": "r [mm]",
+    "hi": "hi [mm]", "d": "d [mm]",
+    "A": "A [cm²]", "Avz": "Avz [cm²]",
+    "Iy": "Iy [cm⁴]", "Wel": "Wel,y [cm³]", "Wpl_y": "Wpl,y [cm³]", "iy": "iy [cm]",
+    "Iz": "Iz [cm⁴]", "Wel_z": "Wel,z [cm³]", "Wpl_z": "Wpl,z [cm³]", "iz": "iz [cm]",
+}
+FAMILLES = ("HEA", "HEB", "HEM", "IPE", "IPEA")
+
+
+def _nombre(v):
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def charger_catalogue(chemin="profiles_test.json"):
+    """{"nom": str[], "type": str[], propriété: float[] (NaN si absente)}."""
+    with open(chemin, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+    noms = list(raw)
+    cat = {
+        "nom": np.array(noms, dtype=object),
+        "type": np.array([str(raw[n].get("type", "")) for n in noms], dtype=object),
+    }
+    for c in COLONNES:
+        cat[c] = np.array([_nombre(raw[n].get(c)) for n in noms], dtype=float)
+    return cat
+
+
+def bornes(cat, col):
+    """(min, max) d’une colonne numérique, NaN ignorés."""
+    v = cat[col][np.isfinite(cat[col])]
+    return (float(v.min()), float(v.max())) if len(v) else (0.0, 0.0)
+
+
+def filtrer(cat, familles=None, intervalles=None, recherche=""):
+    """
+    Indices des profilés retenus : familles (types), intervalles {col: (min, max)}
+    (None = pas de borne ; une valeur NaN est exclue dès qu’une borne est donnée),
+    recherche = sous-chaîne du nom (insensible à la casse, espaces ignorés).
+    """
+    garde = np.ones(len(cat["nom"]), dtype=bool)
+    if familles:
+        garde &= np.isin(cat["type"], list(familles))
+    for col, (lo, hi) in (intervalles or {}).items():
+        v = cat[col]
+        if lo is not None:
+            garde &= v >= lo
+        if hi is not None:
+            garde &= v <= hi
+    motif = "".join(str(recherche).split()).upper()
+    if motif:
+        garde &= np.array([motif in n.replace(" ", "").upper() for n in cat["nom"]], dtype=bool)
+    return np.flatnonzero(garde)
+
+
+def cle_naturelle(texte):
+    """« HEA 100 » < « HEA 1000 » : les nombres du nom sont comparés numériquement."""
+    return [(0, int(t), "") if t.isdigit() else (1, 0, t.upper()) for t in re.findall(r"\d+|\D+", str(texte))]
+
+
+def trier(cat, idx, col="masse", croissant=True):
+    """Indices idx triés selon col (tri stable, NaN en fin) ; col="nom" : ordre alphabétique."""
+    v = cat[col][idx]
+    if col in ("nom", "type"):
+        cles = [cle_naturelle(s) for s in v]
+        ordre = sorted(range(len(v)), key=cles.__getitem__, reverse=not croissant)
+        return idx[np.asarray(ordre, dtype=np.int64)]
+    cle = v if croissant else -v
+    ordre = np.argsort(np.where(np.isnan(cle), np.inf, cle), kind="stable")
+    return idx[ordre]
+
+
+def page(cat, idx, numero=1, taille=25, colonnes=None):
+    """DataFrame de la page numero (1 = première) des indices idx, et nombre de pages."""
+    n_pages = max(1, -(-len(idx) // taille))
+    numero = min(max(1, int(numero)), n_pages)
+    sel = idx[(numero - 1) * taille: numero * taille]
+    cols = list(colonnes or COLONNES)
+    df = pd.DataFrame({"Profil": cat["nom"][sel], "Famille": cat["type"][sel]})
+    for c in cols:
+        df[COLONNES[c]] = cat[c][sel]
+    return df, n_pages
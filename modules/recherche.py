@@ -0,0 +1,125 @@
+# modules/recherche.py
+"""
+Recherche rapide dans les désignations de sections (profilés, cornières, tubes).
+
+Chaque désignation est ramenée à une forme canonique FAMILLE + dimensions
+(« HEA 100 » → HEA100, « 80 × 40 × 3 » → 80X40X3, « Ø48,3x3.2 » → 48.3X3.2).
+L’index, construit une fois par liste, comprend :
+  - deux listes triées (clé complète, dimensions seules) pour la recherche
+    par préfixe en O(log n) : « HEA 2 » → HEA 200…280, « 80x40 » → 80x40x…, « 300 » → IPE 300… ;
+  - un index de trigrammes pour les fautes de frappe (« HAE 200 ») : les
+    candidats sont classés par ressemblance de la famille (lettres communes),
+    puis par écart à la dimension saisie (« HEA 2 » sans HEA 2xx → HEA 160, 140…).
+Seuls les meilleurs résultats sont renvoyés au widget.
+"""
+import re
+from bisect import bisect_left
+from collections import Counter
+
+from modules.cache import cache
+from modules.profils import cle_naturelle
+
+_NOMBRE = re.compile(r"\d+(?:[.,]\d+)?")
+_SYMBOLES = {"Ø", "D", "L", "RHS", "CHS", "SHS", "TUBE", "CORNIERE", "CORNIÈRE"}
+
+
+def canonique(texte):
+    """(famille, dimensions) : « HEA 100 » → ("HEA", "100"), « 80×40×3 » → ("", "80X40X3")."""
+    t = str(texte).upper().replace("×", "X").replace("*", "X")
+    nombres = [n.replace(",", ".") for n in _NOMBRE.findall(t)]
+    lettres = _NOMBRE.sub(" ", t).replace("X", " ").split()
+    famille = "".join(l for l in lettres if l not in _SYMBOLES)
+    return famille, "X".join(nombres)
+
+
+def _trigrammes(cle):
+    """Trigrammes de la clé, sans bourrage (« ␣␣H », « ␣HE » rapprochaient toutes les clés de même initiale)."""
+    return {cle[i:i + 3] for i in range(len(cle) - 2)}
+
+
+def _ressemblance(a, b):
+    """Part de lettres communes entre deux familles (insensible à l’ordre : « HAE » ~ « HEA »)."""
+    if not a or not b:
+        return 0.0
+    return sum((Counter(a) & Counter(b)).values()) / max(len(a), len(b))
+
+
+def _ecart(q, d):
+    """
+    Écart relatif entre la première dimension saisie q et celle d’une section d ;
+    q est lu comme un préfixe (« 2 » face à 160 → 200). 0 si d commence par q.
+    """
+    if not q or d.startswith(q):
+        return 0.0
+    if not d:
+        return float("inf")
+    a, b = q.split("X")[0], d.split("X")[0]
+    v = float(a) * 10 ** max(0, len(b.split(".")[0]) - len(a.split(".")[0]))
+    return abs(float(b) - v) / max(float(b), v, 1e-9)
+
+
+class IndexSections:
+    def __init__(self, designations):
+        self.noms = list(dict.fromkeys(designations))
+        self.cles = [canonique(n) for n in self.noms]
+        self._complet = sorted((f + d, i) for i, (f, d) in enumerate(self.cles))
+        self._dims = sorted((d, i) for i, (_, d) in enumerate(self.cles))
+        self._tri = {}
+        for i, (f, d) in enumerate(self.cles):
+            for g in _trigrammes(f + d):
+                self._tri.setdefault(g, []).append(i)
+        self._ordre = sorted(range(len(self.noms)), key=lambda i: cle_naturelle(self.noms[i]))
+
+    @staticmethod
+    def _prefixe(table, q):
+        j = bisect_left(table, (q, -1))
+        res = []
+        while j < len(table) and table[j][0].startswith(q):
+            res.append(table[j][1])
+            j += 1
+        return res
+
+    def chercher(self, requete, limite=20):
+        """Désignations correspondant à requete, les plus pertinentes d’abord (au plus limite)."""
+        if not str(requete).strip():
+            return [self.noms[i] for i in self._ordre[:limite]]
+        famille, dims = canonique(requete)
+        q = famille + dims
+
+        # 1) préfixe sur la clé complète (ou sur les dimensions si pas de famille)
+        table = self._complet if famille else self._dims
+        trouves = self._prefixe(table, q if famille else dims)
+        trouves.sort(key=lambda i: (self.cles[i][0] + self.cles[i][1] != q, cle_naturelle(self.noms[i])))
+
+        # 2) sous-chaîne
+        if len(trouves) < limite:
+            vus = set(trouves)
+            trouves += [i for i in self._ordre if i not in vus and q in self.cles[i][0] + self.cles[i][1]]
+
+        # 3) rien trouvé : fautes de frappe
+        if not trouves:
+            trouves = self._approchants(famille, dims)
+        return [self.noms[i] for i in trouves[:limite]]
+
+    def _approchants(self, famille, dims):
+        """
+        Candidats : sections ayant des trigrammes communs avec une requête sans
+        dimension, toutes sinon. Classement : ressemblance de la famille (au moins
+        la moitié des lettres), écart à la dimension saisie, trigrammes communs.
+        """
+        scores = Counter(i for g in _trigrammes(famille + dims) for i in self._tri.get(g, ()))
+        candidats = scores if scores and famille and not dims else range(len(self.noms))
+        res = []
+        for i in candidats:
+            f, d = self.cles[i]
+            r = _ressemblance(famille, f) if famille else 1.0
+            if r < 0.5:
+                continue
+            res.append((-round(r, 2), _ecart(dims, d), -scores.get(i, 0), cle_naturelle(self.noms[i]), i))
+        return [c[-1] for c in sorted(res)]
+
+
+@cache(copie=False)
+def index_sections(designations):
+    """Index (mis en cache par processus) pour un tuple de désignations."""
+    return IndexSections(designations)
@@ -0,0 +1,205 @@
+# modules/ressorts.py
+"""
+Raideurs de ressorts nodaux pour un modèle éléments finis externe.
+
+À partir d’une liste de nœuds (avec aires tributaires) ou d’un maillage
+(nœuds + éléments triangles / quadrangles) et d’un champ k (uniforme, par zone
+ou par sondage CPT), calcule K = k · A_trib pour chaque nœud, en tableaux numpy,
+puis écrit le résultat en texte / CSV par blocs.
+
+    python -m modules.ressorts noeuds.csv --elements elements.csv --k 20 -o ressorts.csv
+"""
+import argparse
+import io
+import sys
+
+import numpy as np
+import pandas as pd
+
+from modules.cpt import detecter_format
+from modules.unites import MNpm3_to_kNpm3
+
+BLOC = 50_000     # lignes écrites par bloc
+
+# Noms de colonnes acceptés (insensible à la casse)
+COL_NOEUDS = {
+    "id": ("id", "node", "noeud", "nœud", "n"),
+    "x": ("x",),
+    "y": ("y",),
+    "A": ("a", "aire", "area", "a_trib"),
+}
+
+
+def lire_table(source):
+    """Table délimitée (chemin, bytes ou fichier ouvert) → DataFrame ; séparateurs détectés."""
+    if isinstance(source, bytes):
+        text = source.decode("utf-8", errors="replace")
+    elif hasattr(source, "read"):
+        raw = source.read()
+        text = raw.decode("utf-8", errors="replace") if isinstance(raw, bytes) else raw
+    else:
+        with open(source, encoding="utf-8", errors="replace") as f:
+            text = f.read()
+    sep, dec = detecter_format(text)
+    return pd.read_csv(io.StringIO(text), sep=sep, decimal=dec, comment="#",
+                       engine="python" if sep == r"\s+" else "c")
+
+
+def lire_noeuds(source):
+    """
+    Table de nœuds (id, x, y, [A]) → dict de tableaux.
+    A (aire tributaire, m²) vaut NaN si la colonne est absente.
+    """
+    df = lire_table(source)
+    cols = {str(c).strip().lower(): c for c in df.columns}
+
+    def _col(cle):
+        return next((cols[a] for a in COL_NOEUDS[cle] if a in cols), None)
+
+    cx, cy = _col("x"), _col("y")
+    if cx is None or cy is None:
+        raise ValueError("Colonnes x et y introuvables dans la table des nœuds.")
+    cid, cA = _col("id"), _col("A")
+    n = len(df)
+    return {
+        "id": df[cid].to_numpy() if cid is not None else np.arange(1, n + 1),
+        "x": pd.to_numeric(df[cx], errors="coerce").to_numpy(float),
+        "y": pd.to_numeric(df[cy], errors="coerce").to_numpy(float),
+        "A": pd.to_numeric(df[cA], errors="coerce").to_numpy(float) if cA is not None else np.full(n, np.nan),
+    }
+
+
+def lire_elements(source):
+    """
+    Table d’éléments : une ligne par élément, 3 ou 4 identifiants de nœuds
+    (colonnes n1..n4 ; n4 vide ou ≤ 0 pour un triangle). Renvoie un tableau (ne, 4), −1 = absent.
+    """
+    df = lire_table(source)
+    cols = [c for c in df.columns if str(c).strip().lower() not in ("id", "element", "élément")]
+    conn = df[cols[:4]].apply(pd.to_numeric, errors="coerce").to_numpy(float)
+    if conn.shape[1] == 3:
+        conn = np.column_stack([conn, np.full(len(conn), np.nan)])
+    conn = np.where(np.isfinite(conn) & (conn > 0), conn, -1).astype(np.int64)
+    return conn
+
+
+def aires_tributaires(noeuds, elements):
+    """
+    Aire tributaire par nœud : aire de chaque élément (formule du lacet)
+    répartie à parts égales entre ses sommets (np.add.at, sans boucle).
+    """
+    ids = np.asarray(noeuds["id"]).astype(np.int64)
+    ordre = np.argsort(ids)
+    pos = np.searchsorted(ids, elements, sorter=ordre)
+    pos = ordre[np.clip(pos, 0, len(ids) - 1)]
+    valide = (elements >= 0) & (ids[pos] == elements)
+    if np.any((elements >= 0) & ~valide):
+        raise ValueError("Un élément référence un nœud absent de la table des nœuds.")
+
+    # triangle : on duplique le 3e sommet (le 4e côté est alors de longueur nulle)
+    idx = np.where(valide, pos, pos[:, [2]])
+    x, y = noeuds["x"][idx], noeuds["y"][idx]
+    aire = 0.5 * np.abs(np.sum(x * np.roll(y, -1, axis=1) - np.roll(x, -1, axis=1) * y, axis=1))
+    nb = valide.sum(axis=1)
+
+    A = np.zeros(len(ids))
+    np.add.at(A, idx[valide], np.repeat(aire / nb, nb))
+    return A
+
+
+# ---------- Champ de raideur k ----------
+def k_zones(x, y, k_defaut, zones=()):
+    """
+    k [kN/m³] par nœud : valeur par défaut, remplacée par les zones rectangulaires
+    (xmin, xmax, ymin, ymax, k) dans l’ordre donné (la dernière l’emporte).
+    """
+    k = np.full(len(x), float(k_defaut))
+    for xmin, xmax, ymin, ymax, kz in zones:
+        k[(x >= xmin) & (x <= xmax) & (y >= ymin) & (y <= ymax)] = kz
+    return k
+
+
+def k_sondages(x, y, xs, ys, ks, methode="plus proche", puissance=2.0, n_voisins=4):
+    """
+    k [kN/m³] par nœud à partir de sondages ponctuels (xs, ys, ks) :
+    sondage le plus proche, ou pondération inverse des distances sur les n voisins.
+    """
+    from scipy.spatial import cKDTree
+
+    ks = np.asarray(ks, dtype=float)
+    arbre = cKDTree(np.column_stack([xs, ys]))
+    pts = np.column_stack([x, y])
+    if methode == "plus proche" or len(ks) == 1:
+        _, i = arbre.query(pts, k=1)
+        return ks[i]
+
+    nv = min(int(n_voisins), len(ks))
+    d, i = arbre.query(pts, k=nv)
+    w = 1.0 / np.maximum(d, 1e-9) ** puissance
+    return np.sum(w * ks[i], axis=1) / np.sum(w, axis=1)
+
+
+def raideurs(A, k):
+    """Raideur nodale K = k · A_trib [kN/m]."""
+    return np.asarray(k, dtype=float) * np.asarray(A, dtype=float)
+
+
+# ---------- Écriture ----------
+def ecrire(f, noeuds, A, k, K, format="csv"):
+    """
+    Écrit les ressorts dans le flux texte f, par blocs de BLOC lignes.
+    format="csv" : id;x;y;A;k;K (en-tête, unités m, m², kN/m³, kN/m)
+    format="txt" : id K (séparateur espace, sans en-tête)
+    """
+    n = len(K)
+    if format == "csv":
+        f.write("id;x [m];y [m];A [m2];k [kN/m3];K [kN/m]\n")
+    for d in range(0, n, BLOC):
+        s = slice(d, d + BLOC)
+        if format == "csv":
+            bloc = pd.DataFrame({"id": noeuds["id"][s], "x": noeuds["x"][s], "y": noeuds["y"][s],
+                                 "A": A[s], "k": k[s], "K": K[s]})
+            bloc.to_csv(f, sep=";", header=False, index=False, float_format="%.6g")
+        else:
+            pd.DataFrame({"id": noeuds["id"][s], "K": K[s]}).to_csv(
+                f, sep=" ", header=False, index=False, float_format="%.6g")
+
+
+# ---------- Ligne de commande ----------
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Ressorts nodaux K = k·A_trib pour un modèle EF.")
+    p.add_argument("noeuds", help="table des nœuds (id, x, y, [A])")
+    p.add_argument("--elements", help="table des éléments (n1..n4) pour calculer les aires tributaires")
+    p.add_argument("--k", type=float, default=20.0, help="k uniforme [MN/m3]")
+    p.add_argument("--zones", help="table de zones (xmin, xmax, ymin, ymax, k [MN/m3])")
+    p.add_argument("--sondages", help="table de sondages (x, y, k [MN/m3])")
+    p.add_argument("--idw", action="store_true", help="inverse des distances au lieu du plus proche")
+    p.add_argument("--format", default="csv", choices=["csv", "txt"])
+    p.add_argument("-o", "--sortie", help="fichier de sortie (défaut : sortie standard)")
+    a = p.parse_args(argv)
+
+    nd = lire_noeuds(a.noeuds)
+    A = aires_tributaires(nd, lire_elements(a.elements)) if a.elements else nd["A"]
+    if np.isnan(A).any():
+        p.error("aires tributaires manquantes : fournir la colonne A ou --elements")
+
+    if a.sondages:
+        s = lire_table(a.sondages).to_numpy(float)
+        k = k_sondages(nd["x"], nd["y"], s[:, 0], s[:, 1], MNpm3_to_kNpm3(s[:, 2]),
+                       methode="inverse distance" if a.idw else "plus proche")
+    else:
+        zones = lire_table(a.zones).to_numpy(float) if a.zones else np.empty((0, 5))
+        zones[:, 4] = MNpm3_to_kNpm3(zones[:, 4])
+        k = k_zones(nd["x"], nd["y"], MNpm3_to_kNpm3(a.k), zones)
+
+    K = raideurs(A, k)
+    if a.sortie:
+        with open(a.sortie, "w", encoding="utf-8", newline="") as f:
+            ecrire(f, nd, A, k, K, a.format)
+    else:
+        ecrire(sys.stdout, nd, A, k, K, a.format)
+    print(f"{len(K)} ressorts, ΣA = {A.sum():.2f} m², ΣK = {K.sum():.4g} kN/m", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,129 @@
+import io
+import json
 import math
+import unicodedata
+import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import streamlit as st
 
+from modules import cpt, ressorts, tassements, unites, winkler
+from modules.cache import cache
+from modules.profilage import jalon
+from modules.ui import fragment, interrupteur_saisie_groupee, png, saisie_groupee
+from modules.styles import inclure
+from modules.unites import (
+    E_GPa_to_kPa,
+    E_MPa_to_kPa,
+    from_kPa_to,
+    kNpm3_to_MNpm3,
+    MNpm3_to_kNpm3,
+    to_kPa_from,
+)
+
+
+ABAQUE_COLONNES = ["Type de sol", "γ (kN/m³)", "k_min (MN/m³)", "k_max (MN/m³)", "qₐ_min (kg/cm²)", "qₐ_max (kg/cm²)"]
+
+
+def _normalise(texte):
+    """Minuscules sans accents (recherche par mots-clés)."""
+    nfkd = unicodedata.normalize("NFKD", str(texte).lower())
+    return "".join(c for c in nfkd if not unicodedata.combining(c))
+
+
+@cache(copie=False)
+def load_abaque(chemin="sols_abaque.json"):
+    """
+    Abaque sols (fichier versionné) chargé une seule fois et partagé entre sessions.
+    Le DataFrame renvoyé ne doit pas être modifié en place.
+    """
+    with open(chemin, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    df = pd.DataFrame(data["sols"]).rename(
+        columns={"type": "Type de sol", "gamma": "γ (kN/m³)", "k_min": "k_min (MN/m³)", "k_max": "k_max (MN/m³)"}
+    )
+    df["_texte"] = (
+        df["Type de sol"] + " " + df["desc"] + " " + df["mots_cles"].map(" ".join)
+    ).map(_normalise)
+    return data.get("version", 0), df
+
+
+@cache(disque=True, fichiers=("modules/cpt.py", "modules/unites.py"))
+def cpt_lot(logs, alphaE, z_nappe, gamma, B, nu, D_f, n_B):
+    """Lecture + E(z) + k équivalent pour un lot de logs CPT ((nom, bytes), ...)."""
+    parsed = {nom: cpt.lire_cpt(data) for nom, data in logs}
+    return cpt.k_lot(parsed, B, nu=nu, D_f=D_f, n_B=n_B, alphaE=alphaE, z_nappe=z_nappe, gamma=gamma)
+
+
+@cache(disque=True, fichiers=("modules/winkler.py",))
+def radier(Lx, Ly, t, E, nu, k, nx, ny, q, charges, lignes):
+    """Radier sur ressorts (mis en cache : la factorisation creuse est la partie coûteuse)."""
+    return winkler.radier_winkler(Lx, Ly, t, E, nu, k, nx=nx, ny=ny, q=q, charges=charges, lignes=lignes)
+
+
+@cache()
+def noeuds_ressorts(noeuds_b, elements_b):
+    """Lecture des nœuds et aires tributaires (données du maillage, indépendantes de k)."""
+    nd = ressorts.lire_noeuds(noeuds_b)
+    if elements_b:
+        nd["A"] = ressorts.aires_tributaires(nd, ressorts.lire_elements(elements_b))
+    return nd
+
+
+@cache(disque=True, fichiers=("modules/ressorts.py", "modules/cpt.py", "modules/unites.py"))
+def export_ressorts(noeuds_b, elements_b, k_defaut, zones, sondages, methode, format):
+    """Champ k par nœud, K = k·A et texte d’export (zones / sondages en kN/m³)."""
+    nd = noeuds_ressorts(noeuds_b, elements_b)
+    if sondages:
+        s = np.asarray(sondages, dtype=float)
+        k = ressorts.k_sondages(nd["x"], nd["y"], s[:, 0], s[:, 1], s[:, 2], methode=methode)
+    else:
+        k = ressorts.k_zones(nd["x"], nd["y"], k_defaut, zones)
+    K = ressorts.raideurs(nd["A"], k)
+    buf = io.StringIO()
+    ressorts.ecrire(buf, nd, nd["A"], k, K, format)
+    return nd, k, K, buf.getvalue().encode("utf-8")
+
+
+@cache(disque=True, fichiers=("modules/tassements.py", "modules/unites.py"))
+def tassements_site(semelles, layers, nu, r_coupure, z_max, point):
+    """Tassements avec interaction ; semelles = (x, y, B, L, Q) par ligne, layers = ((h, E MPa), ...)."""
+    t = np.asarray(semelles, dtype=float).reshape(-1, 5)
+    couches = tassements.couches_depuis_profil([{"h": h, "E": E} for h, E in layers], z_max or None)
+    res = tassements.tassements_site(
+        {"x": t[:, 0], "y": t[:, 1], "B": t[:, 2], "L": t[:, 3], "Q": t[:, 4]},
+        couches, nu=nu, r_coupure=r_coupure, point=point,
+    )
+    res.pop("S")
+    return res
+
+
+@cache()
+def carte_radier(champ, val, Lx, Ly, contour=None):
+    """Carte PNG du champ affiché sur le radier ; contour = (x, y, p, q_adm) : isoligne p = q_adm."""
+    fig, ax = plt.subplots(figsize=(8, 8 * Ly / Lx + 0.5))
+    im = ax.imshow(val, origin="lower", cmap="viridis", aspect="equal", extent=(0, Lx, 0, Ly))
+    if contour is not None:
+        x, y, p, q_adm = contour
+        ax.contour(x, y, p, levels=[q_adm], colors="red", linewidths=1.5)
+    fig.colorbar(im, ax=ax, label=champ, shrink=0.8)
+    ax.set_xlabel("x (m)")
+    ax.set_ylabel("y (m)")
+    return png(fig)
+
+
+@cache()
+def plan_tassements(t, s_mm):
+    """Plan PNG des semelles (x, y, B, L, Q par ligne) colorées par tassement [mm]."""
+    fig, ax = plt.subplots(figsize=(8, 5))
+    ax.scatter(t[:, 0], t[:, 1], c=s_mm, s=40 + 200 * t[:, 2] * t[:, 3] / (t[:, 2] * t[:, 3]).max(),
+               marker="s", cmap="viridis")
+    fig.colorbar(ax.collections[0], ax=ax, label="s (mm)")
+    ax.set_aspect("equal")
+    ax.set_xlabel("x (m)")
+    ax.set_ylabel("y (m)")
+    return png(fig)
+
 
 def show():
     """
@@ -11,67 +133,11 @@ def show():
     # -----------------------------
     # 🎨 Style
     # -----------------------------
-    STYLES = """
-    <style>
-    h1, h2, h3 { margin: 0 0 .5rem 0; }
-    .section-title { font-size: 1.25rem; font-weight: 700; margin: .25rem 0 .5rem 0; }
-    .card { background: white; border-radius: 16px; padding: 1rem 1.25rem;
-            box-shadow: 0 2px 10px rgba(15,23,42,.05); border: 1px solid #EEF2F7; }
-    .badge { display:inline-block; padding:.25rem .6rem; border-radius:999px;
-             background:#F5F7FB; color:#334155; font-size:.85rem; }
-    .metric-box { background:#F5F7FB; border-radius:12px; padding:.75rem 1rem;
-                  border:1px solid #E2E8F0; }
-    .small { color:#64748B; font-size:.9rem; }
-    .topbar button { border-radius: 12px !important; height: 48px; font-weight: 600; }
-    .katex-display { text-align:left !important; margin: .25rem 0 .5rem 0 !important; }
-    .katex-display > .katex { text-align:left !important; }
-    .memo-chip {
-        display:inline-block; padding: 2px 8px; border-radius: 999px;
-        background:#EEF2FF; color:#3730A3; font-size: .8rem;
-    }
-    </style>
-    """
-    st.markdown(STYLES, unsafe_allow_html=True)
+    inclure("rigidite_sol.css")
 
     # =============================================================
-    # 🧰 Helpers unités & affichage
+    # 🧰 Helpers affichage
     # =============================================================
-    def to_kPa_from(value: float, unit: str) -> float:
-        """Convertit une pression entrée (kPa, MPa, kg/cm²) en kPa."""
-        if unit == "kPa":
-            return value
-        if unit == "MPa":
-            return value * 1000.0
-        if unit == "kg/cm²":
-            return value * 98.0665
-        return value
-
-    def from_kPa_to(value_kPa: float, unit: str) -> float:
-        """Convertit une pression depuis kPa vers l’unité souhaitée."""
-        if unit == "kPa":
-            return value_kPa
-        if unit == "MPa":
-            return value_kPa / 1000.0
-        if unit == "kg/cm²":
-            return value_kPa / 98.0665
-        return value_kPa
-
-    def E_MPa_to_kPa(E_MPa: float) -> float:
-        """E en MPa (N/mm²) → kPa (kN/m²)."""
-        return E_MPa * 1000.0
-
-    def E_GPa_to_kPa(E_GPa: float) -> float:
-        """E en GPa → kPa."""
-        return E_GPa * 1_000_000.0
-
-    def kNpm3_to_MNpm3(val_kNpm3: float) -> float:
-        """k de kN/m³ → MN/m³."""
-        return val_kNpm3 / 1000.0
-
-    def MNpm3_to_kNpm3(val_MNpm3: float) -> float:
-        """k de MN/m³ → kN/m³."""
-        return val_MNpm3 * 1000.0
-
     def param_table(rows):
         """Affiche un tableau de paramètres (nom, description, valeur, unité)."""
         df = pd.DataFrame(rows, columns=["Paramètre", "Description", "Valeur", "Unité"])
@@ -94,6 +160,7 @@ def show():
     # =============================================================
     # 🧭 Barre du haut
     # =============================================================
+    jalon("barre du haut")
     col_top = st.columns([1, 1, 1, 1, 1, 1])
     with col_top[0]:
         if st.button("🏠 Accueil", use_container_width=True, key="home_btn"):
@@ -120,6 +187,7 @@ def show():
     # =============================================================
     # 🧱 En-tête
     # =============================================================
+    jalon("en-tête")
     st.markdown("# Raideur élastique des sols")
     st.markdown(
         "<span class='small'>Outil de pré-dimensionnement : on modélise le sol par des ressorts verticaux (modèle de Winkler).</span>",
@@ -147,749 +215,1369 @@ def show():
         )
 
     # =============================================================
-    # 🧭 Deux colonnes
+    # 🧩 Panneau de calcul (fragment : une saisie ne relance que ce bloc,
+    #    pas le style, la barre du haut ni l’en-tête)
     # =============================================================
-    col_left, col_right = st.columns([0.5, 0.5])
+    @fragment
+    def panneau():
+        # =============================================================
+        # 🧭 Deux colonnes
+        # =============================================================
+        jalon("saisie")
+        col_left, col_right = st.columns([0.5, 0.5])
+
+        # =============================================================
+        # ================         COLONNE GAUCHE        ==============
+        # =============================================================
+        with col_left:
+            st.markdown("### Informations et entrées")
+
+            # --- Configuration avancée ---
+            st.session_state.adv_open = st.checkbox(
+                "Afficher la configuration avancée",
+                value=st.session_state.adv_open,
+            )
+            if st.session_state.adv_open:
+                c1, c2 = st.columns(2)
+                with c1:
+                    old_unit = st.session_state.press_unit
+                    new_unit = st.selectbox(
+                        "Pressions / contraintes",
+                        ["kPa", "MPa", "kg/cm²"],
+                        index=["kPa", "MPa", "kg/cm²"].index(st.session_state.press_unit),
+                        help="Unité d’entrée des pressions. Les calculs sont faits en kPa en interne.",
+                    )
+                    # Conversion auto si changement d’unité
+                    if new_unit != old_unit and "solo_q" in st.session_state:
+                        q_kPa = to_kPa_from(st.session_state.solo_q, old_unit)
+                        st.session_state.solo_q = from_kPa_to(q_kPa, new_unit)
+                    if new_unit != old_unit and "solo_qad" in st.session_state:
+                        qad_kPa = to_kPa_from(st.session_state.solo_qad, old_unit)
+                        st.session_state.solo_qad = from_kPa_to(qad_kPa, new_unit)
+                    st.session_state.press_unit = new_unit
 
-    # =============================================================
-    # ================         COLONNE GAUCHE        ==============
-    # =============================================================
-    with col_left:
-        st.markdown("### Informations et entrées")
+                with c2:
+                    old_munit = st.session_state.module_unit
+                    new_munit = st.selectbox(
+                        "Modules E",
+                        ["MPa", "GPa"],
+                        index=0 if st.session_state.module_unit == "MPa" else 1,
+                        help="Unité d’entrée pour E. Conversion automatique en kPa pour les calculs.",
+                    )
+                    if new_munit != old_munit and "solo_E" in st.session_state:
+                        if old_munit == "MPa" and new_munit == "GPa":
+                            st.session_state.solo_E /= 1000.0
+                        elif old_munit == "GPa" and new_munit == "MPa":
+                            st.session_state.solo_E *= 1000.0
+                    st.session_state.module_unit = new_munit
+
+            # --- Choix du cas ---
+            cas = st.selectbox(
+                "Quel cas souhaitez-vous traiter ?",
+                (
+                    "1. Sol homogène",
+                    "2. Sol multicouche",
+                    "3. CPT",
+                    "4. Plat sur béton",
+                    "5. Convertisseur & vérification",
+                    "6. Abaque sols",
+                    "7. Poutre sur sol élastique",
+                    "8. Radier sur sol élastique",
+                    "9. Export ressorts nodaux (EF)",
+                    "10. Tassements site (interaction)",
+                ),
+                index=0,
+            )
 
-        # --- Configuration avancée ---
-        st.session_state.adv_open = st.checkbox(
-            "Afficher la configuration avancée",
-            value=st.session_state.adv_open,
-        )
-        if st.session_state.adv_open:
-            c1, c2 = st.columns(2)
-            with c1:
-                old_unit = st.session_state.press_unit
-                new_unit = st.selectbox(
-                    "Pressions / contraintes",
-                    ["kPa", "MPa", "kg/cm²"],
-                    index=["kPa", "MPa", "kg/cm²"].index(st.session_state.press_unit),
-                    help="Unité d’entrée des pressions. Les calculs sont faits en kPa en interne.",
+            # -------------------------
+            # Formulaires selon le cas
+            # -------------------------
+            interrupteur_saisie_groupee()
+            # sélecteurs (méthode, source de k, options) hors du formulaire : ils changent
+            # les champs affichés et s’appliquent tout de suite ; seules les valeurs sont groupées
+            if cas.startswith("1."):
+                # ----- CAS 1 : sol homogène -----
+                st.markdown("**Sol homogène — choix de la méthode**")
+                method = st.radio(
+                    "Méthode de calcul",
+                    [
+                        "1. À partir d’un couple (q, w)",
+                        "2. À partir d’une contrainte admissible (q_ad, s_ad)",
+                        "3. À partir du module E du sol (E, B, ν)",
+                    ],
+                    horizontal=True,
                 )
-                # Conversion auto si changement d’unité
-                if new_unit != old_unit and "solo_q" in st.session_state:
-                    q_kPa = to_kPa_from(st.session_state.solo_q, old_unit)
-                    st.session_state.solo_q = from_kPa_to(q_kPa, new_unit)
-                if new_unit != old_unit and "solo_qad" in st.session_state:
-                    qad_kPa = to_kPa_from(st.session_state.solo_qad, old_unit)
-                    st.session_state.solo_qad = from_kPa_to(qad_kPa, new_unit)
-                st.session_state.press_unit = new_unit
-
-            with c2:
-                old_munit = st.session_state.module_unit
-                new_munit = st.selectbox(
-                    "Modules E",
-                    ["MPa", "GPa"],
-                    index=0 if st.session_state.module_unit == "MPa" else 1,
-                    help="Unité d’entrée pour E. Conversion automatique en kPa pour les calculs.",
+
+                st.markdown(
+                    "<span class='memo-chip'>Principe : k relie la pression q (kPa) au tassement w (m).</span>",
+                    unsafe_allow_html=True,
                 )
-                if new_munit != old_munit and "solo_E" in st.session_state:
-                    if old_munit == "MPa" and new_munit == "GPa":
-                        st.session_state.solo_E /= 1000.0
-                    elif old_munit == "GPa" and new_munit == "MPa":
-                        st.session_state.solo_E *= 1000.0
-                st.session_state.module_unit = new_munit
-
-        # --- Choix du cas ---
-        cas = st.selectbox(
-            "Quel cas souhaitez-vous traiter ?",
-            (
-                "1. Sol homogène",
-                "2. Sol multicouche",
-                "3. CPT",
-                "4. Plat sur béton",
-                "5. Convertisseur & vérification",
-                "6. Abaque sols",
-            ),
-            index=0,
-        )
 
-        # -------------------------
-        # Formulaires selon le cas
-        # -------------------------
-        if cas.startswith("1"):
-            # ----- CAS 1 : sol homogène -----
-            st.markdown("**Sol homogène — choix de la méthode**")
-            method = st.radio(
-                "Méthode de calcul",
-                [
-                    "1. À partir d’un couple (q, w)",
-                    "2. À partir d’une contrainte admissible (q_ad, s_ad)",
-                    "3. À partir du module E du sol (E, B, ν)",
-                ],
-                horizontal=True,
-            )
+                with saisie_groupee("rig_saisie"):
+                    # (1) q, w
+                    if method.startswith("1."):
+                        st.caption("On connaît une pression de service q et un tassement w : on applique directement k = q / w.")
+                        c1, c2 = st.columns(2)
+                        with c1:
+                            st.session_state.solo_q = st.number_input(
+                                f"q (pression de service) [{st.session_state.press_unit}]",
+                                min_value=0.0,
+                                value=float(st.session_state.get("solo_q", 60.0)),
+                                step=5.0,
+                            )
+                        with c2:
+                            st.session_state.solo_w = st.number_input(
+                                "w (tassement) [mm]",
+                                min_value=0.001,
+                                value=float(st.session_state.get("solo_w", 20.0)),
+                                step=5.0,
+                            )
 
-            st.markdown(
-                "<span class='memo-chip'>Principe : k relie la pression q (kPa) au tassement w (m).</span>",
-                unsafe_allow_html=True,
-            )
+                    # (2) q_ad, s_ad
+                    elif method.startswith("2."):
+                        st.caption(
+                            "On connaît une contrainte admissible q_ad et un tassement admissible s_ad : "
+                            "on prend k = q_ad / s_ad (avec correction SF si q_ad est une contrainte ultime)."
+                        )
+                        c1, c2, c3 = st.columns(3)
+                        with c1:
+                            st.session_state.solo_qad = st.number_input(
+                                f"q ad [{st.session_state.press_unit}]",
+                                min_value=0.0,
+                                value=float(st.session_state.get("solo_qad", 100.0)),
+                                step=5.0,
+                            )
+                        with c2:
+                            st.session_state.solo_sadm = st.number_input(
+                                "s adm [mm]",
+                                min_value=0.1,
+                                value=float(st.session_state.get("solo_sadm", 25.0)),
+                                step=1.0,
+                            )
+                        with c3:
+                            st.session_state.solo_isult = st.toggle(
+                                "q ad est une contrainte ultime ?",
+                                value=st.session_state.get("solo_isult", False),
+                                help="Si oui, q ad est multipliée par SF avant d’être utilisée.",
+                            )
+                            st.session_state.solo_sf = st.number_input(
+                                "SF (si ultime)",
+                                min_value=1.0,
+                                value=float(st.session_state.get("solo_sf", 3.0)),
+                                step=0.5,
+                            )
 
-            # (1) q, w
-            if method.startswith("1."):
-                st.caption("On connaît une pression de service q et un tassement w : on applique directement k = q / w.")
-                c1, c2 = st.columns(2)
-                with c1:
-                    st.session_state.solo_q = st.number_input(
-                        f"q (pression de service) [{st.session_state.press_unit}]",
-                        min_value=0.0,
-                        value=float(st.session_state.get("solo_q", 60.0)),
-                        step=5.0,
-                    )
-                with c2:
-                    st.session_state.solo_w = st.number_input(
-                        "w (tassement) [mm]",
-                        min_value=0.001,
-                        value=float(st.session_state.get("solo_w", 20.0)),
-                        step=5.0,
-                    )
+                    # (3) E, B, ν
+                    else:
+                        st.caption(
+                            "On dispose d’un module de déformation E et d’une largeur B de semelle filante : "
+                            "on prend k ≈ E / [B(1−ν²)]."
+                        )
+                        c1, c2, c3 = st.columns(3)
+                        with c1:
+                            if st.session_state.module_unit == "MPa":
+                                st.session_state.solo_E = st.number_input(
+                                    "E du sol [MPa]",
+                                    min_value=0.0,
+                                    value=float(st.session_state.get("solo_E", 80.0)),
+                                    step=5.0,
+                                )
+                            else:
+                                st.session_state.solo_E = st.number_input(
+                                    "E du sol [GPa]",
+                                    min_value=0.0,
+                                    value=float(st.session_state.get("solo_E", 0.08)),
+                                    step=0.01,
+                                )
+                        with c2:
+                            st.session_state.solo_B = st.number_input(
+                                "B (largeur caractéristique) [m]",
+                                min_value=0.01,
+                                value=float(st.session_state.get("solo_B", 2.0)),
+                                step=0.1,
+                            )
+                        with c3:
+                            st.session_state.solo_nu = st.number_input(
+                                "ν (Poisson)",
+                                min_value=0.0,
+                                max_value=0.49,
+                                value=float(st.session_state.get("solo_nu", 0.30)),
+                                step=0.01,
+                            )
 
-            # (2) q_ad, s_ad
-            elif method.startswith("2."):
+            elif cas.startswith("2"):
+                # ----- CAS 2 : multicouche -----
+                st.markdown("**Sol multicouche — équivalence en série**")
                 st.caption(
-                    "On connaît une contrainte admissible q_ad et un tassement admissible s_ad : "
-                    "on prend k = q_ad / s_ad (avec correction SF si q_ad est une contrainte ultime)."
+                    "On approxime la raideur verticale par : "
+                    "1/k_eq = Σ(h_i / E_i) avec h_i en m et E_i en kPa."
                 )
-                c1, c2, c3 = st.columns(3)
-                with c1:
-                    st.session_state.solo_qad = st.number_input(
-                        f"q ad [{st.session_state.press_unit}]",
-                        min_value=0.0,
-                        value=float(st.session_state.get("solo_qad", 100.0)),
-                        step=5.0,
-                    )
-                with c2:
-                    st.session_state.solo_sadm = st.number_input(
-                        "s adm [mm]",
-                        min_value=0.1,
-                        value=float(st.session_state.get("solo_sadm", 25.0)),
-                        step=1.0,
-                    )
-                with c3:
-                    st.session_state.solo_isult = st.toggle(
-                        "q ad est une contrainte ultime ?",
-                        value=st.session_state.get("solo_isult", False),
-                        help="Si oui, q ad est multipliée par SF avant d’être utilisée.",
-                    )
-                    st.session_state.solo_sf = st.number_input(
-                        "SF (si ultime)",
-                        min_value=1.0,
-                        value=float(st.session_state.get("solo_sf", 3.0)),
-                        step=0.5,
+
+                st.session_state.multi_scale = st.checkbox(
+                    "Appliquer une largeur B et ν équivalents (fondation filante)",
+                    value=st.session_state.get("multi_scale", False),
+                )
+
+                with saisie_groupee("rig_saisie"):
+                    n_layers = st.number_input(
+                        "Nombre de couches",
+                        min_value=1,
+                        max_value=6,
+                        value=int(st.session_state.get("multi_n_layers", 2)),
+                        step=1,
+                        key="multi_n_layers",
                     )
 
-            # (3) E, B, ν
-            else:
+                    layers = []
+                    for i in range(int(n_layers)):
+                        c1, c2 = st.columns(2)
+                        idx = i + 1
+                        with c1:
+                            h_i = st.number_input(
+                                f"Épaisseur h{idx} [m]",
+                                min_value=0.01,
+                                value=float(st.session_state.get(f"multi_h_{i}", 1.0 if i == 0 else 2.0)),
+                                step=0.1,
+                                key=f"multi_h_{i}",
+                            )
+                        with c2:
+                            E_i = st.number_input(
+                                f"E{idx} [MPa]",
+                                min_value=0.1,
+                                value=float(st.session_state.get(f"multi_E_{i}", 30.0 if i == 0 else 60.0)),
+                                step=5.0,
+                                key=f"multi_E_{i}",
+                            )
+                        layers.append({"h": h_i, "E": E_i})
+
+                    st.session_state.multi_layers = layers
+
+                    if st.session_state.multi_scale:
+                        c1, c2 = st.columns(2)
+                        with c1:
+                            st.session_state.multi_B = st.number_input(
+                                "B équivalent [m]",
+                                min_value=0.1,
+                                value=float(st.session_state.get("multi_B", 2.0)),
+                                step=0.1,
+                            )
+                        with c2:
+                            st.session_state.multi_nu = st.number_input(
+                                "ν équivalent",
+                                min_value=0.0,
+                                max_value=0.49,
+                                value=float(st.session_state.get("multi_nu", 0.30)),
+                                step=0.01,
+                            )
+
+            elif cas.startswith("3"):
+                # ----- CAS 3 : CPT -----
+                st.markdown("**CPT — déduction de E puis de k**")
                 st.caption(
-                    "On dispose d’un module de déformation E et d’une largeur B de semelle filante : "
-                    "on prend k ≈ E / [B(1−ν²)]."
+                    "On utilise une corrélation du type E = α_E (q_t − σ'ᵥ0), "
+                    "puis k ≈ E / [B(1−ν²)]."
                 )
-                c1, c2, c3 = st.columns(3)
-                with c1:
-                    if st.session_state.module_unit == "MPa":
-                        st.session_state.solo_E = st.number_input(
-                            "E du sol [MPa]",
-                            min_value=0.0,
-                            value=float(st.session_state.get("solo_E", 80.0)),
-                            step=5.0,
+
+                st.radio(
+                    "Données CPT",
+                    ["Valeur unique", "Logs CPT (fichiers)"],
+                    horizontal=True,
+                    key="cpt_source",
+                )
+
+                with saisie_groupee("rig_saisie"):
+                    if st.session_state.cpt_source == "Logs CPT (fichiers)":
+                        st.caption(
+                            "Colonnes attendues : profondeur z [m], qc [MPa], fs [kPa], u2 [kPa] (csv / txt). "
+                            "σ'ᵥ0 et E sont calculés sur toute la profondeur puis intégrés en série sur "
+                            "la profondeur d’influence [D_f ; D_f + n·B]."
                         )
+                        fichiers = st.file_uploader(
+                            "Logs CPT", type=["csv", "txt"], accept_multiple_files=True, key="cpt_files"
+                        )
+                        st.session_state.cpt_logs = tuple((f.name, f.getvalue()) for f in (fichiers or []))
+
+                        c1, c2, c3 = st.columns(3)
+                        with c1:
+                            st.session_state.cpt_alphaE = st.number_input(
+                                "α_E (facteur CPT → E)", min_value=0.1,
+                                value=float(st.session_state.get("cpt_alphaE", 2.5)), step=0.1,
+                            )
+                        with c2:
+                            st.session_state.cpt_zw = st.number_input(
+                                "Nappe z_w [m]", min_value=0.0,
+                                value=float(st.session_state.get("cpt_zw", 2.0)), step=0.5,
+                            )
+                        with c3:
+                            st.session_state.cpt_gamma = st.number_input(
+                                "γ [kN/m³] (0 = corrélation)", min_value=0.0,
+                                value=float(st.session_state.get("cpt_gamma", 0.0)), step=0.5,
+                            )
+                        c4, c5, c6, c7 = st.columns(4)
+                        with c4:
+                            st.session_state.cpt_B = st.number_input(
+                                "B [m]", min_value=0.1, value=float(st.session_state.get("cpt_B", 2.0)), step=0.1,
+                            )
+                        with c5:
+                            st.session_state.cpt_nu = st.number_input(
+                                "ν", min_value=0.0, max_value=0.49,
+                                value=float(st.session_state.get("cpt_nu", 0.30)), step=0.01,
+                            )
+                        with c6:
+                            st.session_state.cpt_Df = st.number_input(
+                                "D_f [m]", min_value=0.0, value=float(st.session_state.get("cpt_Df", 0.5)), step=0.1,
+                            )
+                        with c7:
+                            st.session_state.cpt_nB = st.number_input(
+                                "n (z_infl = n·B)", min_value=0.5,
+                                value=float(st.session_state.get("cpt_nB", 2.0)), step=0.5,
+                            )
+
                     else:
-                        st.session_state.solo_E = st.number_input(
-                            "E du sol [GPa]",
+                        c1, c2, c3 = st.columns(3)
+                        with c1:
+                            st.session_state.cpt_qt = st.number_input(
+                                "qₜ (résistance de pointe nette) [MPa]",
+                                min_value=0.0,
+                                value=float(st.session_state.get("cpt_qt", 5.0)),
+                                step=0.5,
+                            )
+                        with c2:
+                            st.session_state.cpt_sv0 = st.number_input(
+                                "σ'ᵥ₀ (contrainte verticale effective) [kPa]",
+                                min_value=0.0,
+                                value=float(st.session_state.get("cpt_sv0", 100.0)),
+                                step=10.0,
+                            )
+                        with c3:
+                            st.session_state.cpt_alphaE = st.number_input(
+                                "α_E (facteur CPT → E)",
+                                min_value=0.1,
+                                value=float(st.session_state.get("cpt_alphaE", 2.5)),
+                                step=0.1,
+                            )
+
+                        c4, c5 = st.columns(2)
+                        with c4:
+                            st.session_state.cpt_B = st.number_input(
+                                "B (largeur influence / semelle) [m]",
+                                min_value=0.1,
+                                value=float(st.session_state.get("cpt_B", 2.0)),
+                                step=0.1,
+                            )
+                        with c5:
+                            st.session_state.cpt_nu = st.number_input(
+                                "ν (Poisson équivalent)",
+                                min_value=0.0,
+                                max_value=0.49,
+                                value=float(st.session_state.get("cpt_nu", 0.30)),
+                                step=0.01,
+                            )
+
+            elif cas.startswith("4"):
+                # ----- CAS 4 : plat sur béton -----
+                st.markdown("**Plat métallique sur béton (ressort de contact)**")
+                st.caption(
+                    "On assimile le contact à un ressort en compression du béton (et éventuellement du grout). "
+                    "Pour le béton seul : k_c ≈ E_c / [h_c(1−ν²)] ou k_c ≈ E_c / h_c suivant l’hypothèse."
+                )
+
+                st.session_state.plate_use_nu = st.checkbox(
+                    "Tenir compte de ν du béton",
+                    value=st.session_state.get("plate_use_nu", True),
+                )
+
+                st.markdown("**Lit de mortier / grout (optionnel)**")
+                st.session_state.plate_has_grout = st.checkbox(
+                    "Présence d’un lit de mortier/grout",
+                    value=st.session_state.get("plate_has_grout", False),
+                )
+
+                with saisie_groupee("rig_saisie"):
+                    st.markdown("**Géométrie du plat**")
+                    c1, c2, c3 = st.columns(3)
+                    with c1:
+                        st.session_state.plate_B = st.number_input(
+                            "Largeur plat B [mm]",
+                            min_value=20.0,
+                            value=float(st.session_state.get("plate_B", 200.0)),
+                            step=10.0,
+                        )
+                    with c2:
+                        st.session_state.plate_L = st.number_input(
+                            "Longueur plat L [mm]",
+                            min_value=20.0,
+                            value=float(st.session_state.get("plate_L", 200.0)),
+                            step=10.0,
+                        )
+                    with c3:
+                        st.session_state.plate_alpha = st.number_input(
+                            "α (h_c = α·min(B,L))",
+                            min_value=0.05,
+                            value=float(st.session_state.get("plate_alpha", 0.5)),
+                            step=0.05,
+                        )
+
+                    st.markdown("**Béton support**")
+                    c4, c5 = st.columns(2)
+                    with c4:
+                        st.session_state.plate_Ec = st.number_input(
+                            "E_c béton [GPa]",
+                            min_value=5.0,
+                            value=float(st.session_state.get("plate_Ec", 30.0)),
+                            step=1.0,
+                        )
+
+                    if st.session_state.plate_use_nu:
+                        st.session_state.plate_nu = st.number_input(
+                            "ν béton",
                             min_value=0.0,
-                            value=float(st.session_state.get("solo_E", 0.08)),
+                            max_value=0.49,
+                            value=float(st.session_state.get("plate_nu", 0.20)),
                             step=0.01,
                         )
-                with c2:
-                    st.session_state.solo_B = st.number_input(
-                        "B (largeur caractéristique) [m]",
-                        min_value=0.01,
-                        value=float(st.session_state.get("solo_B", 2.0)),
-                        step=0.1,
-                    )
-                with c3:
-                    st.session_state.solo_nu = st.number_input(
-                        "ν (Poisson)",
-                        min_value=0.0,
-                        max_value=0.49,
-                        value=float(st.session_state.get("solo_nu", 0.30)),
-                        step=0.01,
-                    )
+                    else:
+                        st.session_state.plate_nu = st.session_state.get("plate_nu", 0.20)
+
+                    if st.session_state.plate_has_grout:
+                        c6, c7 = st.columns(2)
+                        with c6:
+                            st.session_state.plate_tg = st.number_input(
+                                "Épaisseur grout t_g [mm]",
+                                min_value=1.0,
+                                value=float(st.session_state.get("plate_tg", 20.0)),
+                                step=1.0,
+                            )
+                        with c7:
+                            st.session_state.plate_Eg = st.number_input(
+                                "E_g grout [GPa]",
+                                min_value=5.0,
+                                value=float(st.session_state.get("plate_Eg", 20.0)),
+                                step=1.0,
+                            )
+                    else:
+                        st.session_state.plate_tg = st.session_state.get("plate_tg", 0.0)
+                        st.session_state.plate_Eg = st.session_state.get("plate_Eg", 20.0)
 
-        elif cas.startswith("2"):
-            # ----- CAS 2 : multicouche -----
-            st.markdown("**Sol multicouche — équivalence en série**")
-            st.caption(
-                "On approxime la raideur verticale par : "
-                "1/k_eq = Σ(h_i / E_i) avec h_i en m et E_i en kPa."
-            )
+            elif cas.startswith("5"):
+                # ----- CAS 5 : convertisseur -----
+                st.markdown("**Convertisseur d’unités (colonnes)**")
+                st.caption(
+                    "Coller une ou plusieurs colonnes de valeurs (copie Excel : tabulations, "
+                    "« ; » ou espaces ; virgule décimale acceptée). Toutes les colonnes sont converties."
+                )
+                grandeur = st.selectbox("Grandeur", list(unites.GRANDEURS), key="conv_grandeur")
+
+                with saisie_groupee("rig_saisie"):
+                    unites_dispo = list(unites.GRANDEURS[grandeur])
+                    c1, c2 = st.columns(2)
+                    with c1:
+                        st.selectbox("De", unites_dispo, key="conv_de")
+                    with c2:
+                        st.selectbox("Vers", unites_dispo, index=min(1, len(unites_dispo) - 1), key="conv_vers")
+                    st.text_area("Valeurs", value=st.session_state.get("conv_texte", "100\n250\n1,5"),
+                                 height=200, key="conv_texte")
+
+            elif cas.startswith("7"):
+                # ----- CAS 7 : poutre / semelle filante sur ressorts -----
+                st.markdown("**Poutre sur sol élastique (semelle filante, longrine)**")
+                st.caption(
+                    "Éléments finis de poutre sur ressorts de Winkler (poutre libre aux extrémités). "
+                    "k peut varier le long de la poutre (sondages CPT)."
+                )
 
-            n_layers = st.number_input(
-                "Nombre de couches",
-                min_value=1,
-                max_value=6,
-                value=int(st.session_state.get("multi_n_layers", 2)),
-                step=1,
-                key="multi_n_layers",
-            )
+                st.radio(
+                    "Raideur k",
+                    ["Valeur saisie", "Sol multicouche (cas 2)", "Logs CPT (cas 3)"],
+                    horizontal=True,
+                    key="bw_k_src",
+                )
 
-            layers = []
-            for i in range(int(n_layers)):
-                c1, c2 = st.columns(2)
-                idx = i + 1
-                with c1:
-                    h_i = st.number_input(
-                        f"Épaisseur h{idx} [m]",
-                        min_value=0.01,
-                        value=float(st.session_state.get(f"multi_h_{i}", 1.0 if i == 0 else 2.0)),
-                        step=0.1,
-                        key=f"multi_h_{i}",
-                    )
-                with c2:
-                    E_i = st.number_input(
-                        f"E{idx} [MPa]",
-                        min_value=0.1,
-                        value=float(st.session_state.get(f"multi_E_{i}", 30.0 if i == 0 else 60.0)),
-                        step=5.0,
-                        key=f"multi_E_{i}",
-                    )
-                layers.append({"h": h_i, "E": E_i})
+                with saisie_groupee("rig_saisie"):
+                    c1, c2, c3 = st.columns(3)
+                    with c1:
+                        st.session_state.bw_L = st.number_input(
+                            "Longueur L [m]", min_value=0.5, value=float(st.session_state.get("bw_L", 12.0)), step=0.5,
+                        )
+                    with c2:
+                        st.session_state.bw_B = st.number_input(
+                            "Largeur B [m]", min_value=0.1, value=float(st.session_state.get("bw_B", 0.8)), step=0.1,
+                        )
+                    with c3:
+                        st.session_state.bw_h = st.number_input(
+                            "Hauteur h [m]", min_value=0.1, value=float(st.session_state.get("bw_h", 0.6)), step=0.05,
+                        )
+                    c4, c5 = st.columns(2)
+                    with c4:
+                        st.session_state.bw_E = st.number_input(
+                            "E béton [GPa]", min_value=5.0, value=float(st.session_state.get("bw_E", 30.0)), step=1.0,
+                        )
+                    with c5:
+                        st.session_state.bw_n = st.number_input(
+                            "Nombre d’éléments", min_value=10, max_value=20000,
+                            value=int(st.session_state.get("bw_n", 400)), step=50,
+                        )
 
-            st.session_state.multi_layers = layers
+                    if st.session_state.bw_k_src == "Valeur saisie":
+                        st.session_state.bw_k = st.number_input(
+                            "k [MN/m³]", min_value=0.1, value=float(st.session_state.get("bw_k", 20.0)), step=1.0,
+                        )
+                    elif st.session_state.bw_k_src == "Logs CPT (cas 3)":
+                        cpt_res = st.session_state.get("cpt_k_results", [])
+                        if cpt_res:
+                            st.caption("Position de chaque sondage le long de la poutre (k interpolé linéairement).")
+                            n_cpt = len(cpt_res)
+                            df_pos = pd.DataFrame(
+                                {
+                                    "Sondage": [r[0] for r in cpt_res],
+                                    "x [m]": [st.session_state.bw_L * i / max(n_cpt - 1, 1) for i in range(n_cpt)],
+                                    "k [MN/m³]": [kNpm3_to_MNpm3(r[1]) for r in cpt_res],
+                                }
+                            )
+                            st.session_state.bw_cpt_pos = st.data_editor(
+                                df_pos, hide_index=True, disabled=["Sondage", "k [MN/m³]"], key="bw_cpt_editor",
+                            )
 
-            st.session_state.multi_scale = st.checkbox(
-                "Appliquer une largeur B et ν équivalents (fondation filante)",
-                value=st.session_state.get("multi_scale", False),
-            )
-            if st.session_state.multi_scale:
-                c1, c2 = st.columns(2)
-                with c1:
-                    st.session_state.multi_B = st.number_input(
-                        "B équivalent [m]",
-                        min_value=0.1,
-                        value=float(st.session_state.get("multi_B", 2.0)),
-                        step=0.1,
+                    st.markdown("**Charges**")
+                    st.session_state.bw_q = st.number_input(
+                        "Charge répartie q [kN/m]", min_value=0.0, value=float(st.session_state.get("bw_q", 50.0)), step=5.0,
                     )
-                with c2:
-                    st.session_state.multi_nu = st.number_input(
-                        "ν équivalent",
-                        min_value=0.0,
-                        max_value=0.49,
-                        value=float(st.session_state.get("multi_nu", 0.30)),
-                        step=0.01,
+                    st.session_state.bw_P = st.data_editor(
+                        pd.DataFrame({"x [m]": [2.0, 10.0], "P [kN]": [300.0, 300.0]}),
+                        num_rows="dynamic", hide_index=True, key="bw_P_editor",
                     )
 
-        elif cas.startswith("3"):
-            # ----- CAS 3 : CPT -----
-            st.markdown("**CPT — déduction de E puis de k**")
-            st.caption(
-                "On utilise une corrélation du type E = α_E (q_t − σ'ᵥ0), "
-                "puis k ≈ E / [B(1−ν²)]."
-            )
-
-            c1, c2, c3 = st.columns(3)
-            with c1:
-                st.session_state.cpt_qt = st.number_input(
-                    "qₜ (résistance de pointe nette) [MPa]",
-                    min_value=0.0,
-                    value=float(st.session_state.get("cpt_qt", 5.0)),
-                    step=0.5,
-                )
-            with c2:
-                st.session_state.cpt_sv0 = st.number_input(
-                    "σ'ᵥ₀ (contrainte verticale effective) [kPa]",
-                    min_value=0.0,
-                    value=float(st.session_state.get("cpt_sv0", 100.0)),
-                    step=10.0,
-                )
-            with c3:
-                st.session_state.cpt_alphaE = st.number_input(
-                    "α_E (facteur CPT → E)",
-                    min_value=0.1,
-                    value=float(st.session_state.get("cpt_alphaE", 2.5)),
-                    step=0.1,
+            elif cas.startswith("8"):
+                # ----- CAS 8 : radier / dallage sur ressorts -----
+                st.markdown("**Radier ou dallage sur sol élastique**")
+                st.caption(
+                    "Plaque mince (Kirchhoff) à bords libres sur ressorts de Winkler, "
+                    "éléments rectangulaires ACM sur maillage régulier."
                 )
 
-            c4, c5 = st.columns(2)
-            with c4:
-                st.session_state.cpt_B = st.number_input(
-                    "B (largeur influence / semelle) [m]",
-                    min_value=0.1,
-                    value=float(st.session_state.get("cpt_B", 2.0)),
-                    step=0.1,
-                )
-            with c5:
-                st.session_state.cpt_nu = st.number_input(
-                    "ν (Poisson équivalent)",
-                    min_value=0.0,
-                    max_value=0.49,
-                    value=float(st.session_state.get("cpt_nu", 0.30)),
-                    step=0.01,
+                st.radio(
+                    "Raideur k",
+                    ["Valeur saisie", "Sol multicouche (cas 2)", "Logs CPT (cas 3, moyenne)"],
+                    horizontal=True,
+                    key="rd_k_src",
                 )
 
-        elif cas.startswith("4"):
-            # ----- CAS 4 : plat sur béton -----
-            st.markdown("**Plat métallique sur béton (ressort de contact)**")
-            st.caption(
-                "On assimile le contact à un ressort en compression du béton (et éventuellement du grout). "
-                "Pour le béton seul : k_c ≈ E_c / [h_c(1−ν²)] ou k_c ≈ E_c / h_c suivant l’hypothèse."
-            )
+                with saisie_groupee("rig_saisie"):
+                    c1, c2, c3 = st.columns(3)
+                    with c1:
+                        st.session_state.rd_Lx = st.number_input(
+                            "Longueur Lx [m]", min_value=1.0, value=float(st.session_state.get("rd_Lx", 20.0)), step=1.0,
+                        )
+                    with c2:
+                        st.session_state.rd_Ly = st.number_input(
+                            "Largeur Ly [m]", min_value=1.0, value=float(st.session_state.get("rd_Ly", 12.0)), step=1.0,
+                        )
+                    with c3:
+                        st.session_state.rd_t = st.number_input(
+                            "Épaisseur t [m]", min_value=0.1, value=float(st.session_state.get("rd_t", 0.35)), step=0.05,
+                        )
+                    c4, c5, c6, c7 = st.columns(4)
+                    with c4:
+                        st.session_state.rd_E = st.number_input(
+                            "E béton [GPa]", min_value=5.0, value=float(st.session_state.get("rd_E", 30.0)), step=1.0,
+                        )
+                    with c5:
+                        st.session_state.rd_nu = st.number_input(
+                            "ν béton", min_value=0.0, max_value=0.45, value=float(st.session_state.get("rd_nu", 0.2)), step=0.05,
+                        )
+                    with c6:
+                        st.session_state.rd_nx = st.number_input(
+                            "Éléments en x", min_value=4, max_value=180, value=int(st.session_state.get("rd_nx", 40)), step=4,
+                        )
+                    with c7:
+                        st.session_state.rd_ny = st.number_input(
+                            "Éléments en y", min_value=4, max_value=180, value=int(st.session_state.get("rd_ny", 24)), step=4,
+                        )
+                    st.caption(f"{3 * (st.session_state.rd_nx + 1) * (st.session_state.rd_ny + 1):,} degrés de liberté")
 
-            st.markdown("**Géométrie du plat**")
-            c1, c2, c3 = st.columns(3)
-            with c1:
-                st.session_state.plate_B = st.number_input(
-                    "Largeur plat B [mm]",
-                    min_value=20.0,
-                    value=float(st.session_state.get("plate_B", 200.0)),
-                    step=10.0,
-                )
-            with c2:
-                st.session_state.plate_L = st.number_input(
-                    "Longueur plat L [mm]",
-                    min_value=20.0,
-                    value=float(st.session_state.get("plate_L", 200.0)),
-                    step=10.0,
-                )
-            with c3:
-                st.session_state.plate_alpha = st.number_input(
-                    "α (h_c = α·min(B,L))",
-                    min_value=0.05,
-                    value=float(st.session_state.get("plate_alpha", 0.5)),
-                    step=0.05,
-                )
+                    if st.session_state.rd_k_src == "Valeur saisie":
+                        st.session_state.rd_k = st.number_input(
+                            "k [MN/m³]", min_value=0.1, value=float(st.session_state.get("rd_k", 20.0)), step=1.0,
+                        )
 
-            st.markdown("**Béton support**")
-            c4, c5 = st.columns(2)
-            with c4:
-                st.session_state.plate_Ec = st.number_input(
-                    "E_c béton [GPa]",
-                    min_value=5.0,
-                    value=float(st.session_state.get("plate_Ec", 30.0)),
-                    step=1.0,
-                )
-            with c5:
-                st.session_state.plate_use_nu = st.checkbox(
-                    "Tenir compte de ν du béton",
-                    value=st.session_state.get("plate_use_nu", True),
+                    st.markdown("**Charges**")
+                    c8, c9 = st.columns(2)
+                    with c8:
+                        st.session_state.rd_q = st.number_input(
+                            "Charge répartie q [kPa]", min_value=0.0, value=float(st.session_state.get("rd_q", 10.0)), step=1.0,
+                        )
+                    with c9:
+                        st.session_state.rd_qadm = st.number_input(
+                            "q_adm sol [kPa]", min_value=1.0, value=float(st.session_state.get("rd_qadm", 150.0)), step=10.0,
+                        )
+                    st.caption("Charges ponctuelles (poteaux)")
+                    st.session_state.rd_P = st.data_editor(
+                        pd.DataFrame({"x [m]": [5.0, 15.0], "y [m]": [6.0, 6.0], "P [kN]": [800.0, 800.0]}),
+                        num_rows="dynamic", hide_index=True, key="rd_P_editor",
+                    )
+                    st.caption("Charges linéiques (voiles)")
+                    st.session_state.rd_lignes = st.data_editor(
+                        pd.DataFrame({"x1 [m]": [0.5], "y1 [m]": [0.5], "x2 [m]": [19.5], "y2 [m]": [0.5], "p [kN/m]": [60.0]}),
+                        num_rows="dynamic", hide_index=True, key="rd_lignes_editor",
+                    )
+
+            elif cas.startswith("9"):
+                # ----- CAS 9 : ressorts nodaux pour un modèle EF -----
+                st.markdown("**Export de ressorts nodaux pour un logiciel EF**")
+                st.caption(
+                    "Table des nœuds : id, x, y [m] et, si aucun maillage n’est fourni, aire tributaire A [m²]. "
+                    "Maillage : une ligne par élément, n1..n4 (n4 vide pour un triangle). "
+                    "K = k · A_trib pour chaque nœud."
                 )
 
-            if st.session_state.plate_use_nu:
-                st.session_state.plate_nu = st.number_input(
-                    "ν béton",
-                    min_value=0.0,
-                    max_value=0.49,
-                    value=float(st.session_state.get("plate_nu", 0.20)),
-                    step=0.01,
+                st.radio(
+                    "Raideur k",
+                    ["Uniforme / par zone", "Sol multicouche (cas 2)", "Sondages CPT (cas 3)"],
+                    horizontal=True,
+                    key="rs_k_src",
                 )
-            else:
-                st.session_state.plate_nu = st.session_state.get("plate_nu", 0.20)
 
-            st.markdown("**Lit de mortier / grout (optionnel)**")
-            st.session_state.plate_has_grout = st.checkbox(
-                "Présence d’un lit de mortier/grout",
-                value=st.session_state.get("plate_has_grout", False),
-            )
+                with saisie_groupee("rig_saisie"):
+                    f_nd = st.file_uploader("Nœuds", type=["csv", "txt"], key="rs_noeuds")
+                    f_el = st.file_uploader("Éléments (optionnel)", type=["csv", "txt"], key="rs_elements")
+                    st.session_state.rs_fichiers = (
+                        f_nd.getvalue() if f_nd else None,
+                        f_el.getvalue() if f_el else None,
+                    )
 
-            if st.session_state.plate_has_grout:
-                c6, c7 = st.columns(2)
-                with c6:
-                    st.session_state.plate_tg = st.number_input(
-                        "Épaisseur grout t_g [mm]",
-                        min_value=1.0,
-                        value=float(st.session_state.get("plate_tg", 20.0)),
-                        step=1.0,
+                    if st.session_state.rs_k_src == "Uniforme / par zone":
+                        st.session_state.rs_k = st.number_input(
+                            "k par défaut [MN/m³]", min_value=0.1, value=float(st.session_state.get("rs_k", 20.0)), step=1.0,
+                        )
+                        st.caption("Zones rectangulaires (la dernière ligne l’emporte en cas de recouvrement)")
+                        st.session_state.rs_zones = st.data_editor(
+                            pd.DataFrame(columns=["xmin [m]", "xmax [m]", "ymin [m]", "ymax [m]", "k [MN/m³]"], dtype=float),
+                            num_rows="dynamic", hide_index=True, key="rs_zones_editor",
+                        )
+                    elif st.session_state.rs_k_src == "Sondages CPT (cas 3)":
+                        cpt_res = st.session_state.get("cpt_k_results", [])
+                        if cpt_res:
+                            st.caption("Position en plan de chaque sondage.")
+                            st.session_state.rs_cpt_pos = st.data_editor(
+                                pd.DataFrame(
+                                    {
+                                        "Sondage": [r[0] for r in cpt_res],
+                                        "x [m]": [10.0 * i for i in range(len(cpt_res))],
+                                        "y [m]": [0.0] * len(cpt_res),
+                                        "k [MN/m³]": [kNpm3_to_MNpm3(r[1]) for r in cpt_res],
+                                    }
+                                ),
+                                hide_index=True, disabled=["Sondage", "k [MN/m³]"], key="rs_cpt_editor",
+                            )
+                            st.radio("Attribution", ["plus proche", "inverse distance"], horizontal=True, key="rs_methode")
+
+                    st.selectbox(
+                        "Format", ["csv", "txt"], key="rs_format",
+                        format_func=lambda f: {"csv": "CSV (id;x;y;A;k;K)", "txt": "Texte (id K)"}[f],
                     )
-                with c7:
-                    st.session_state.plate_Eg = st.number_input(
-                        "E_g grout [GPa]",
-                        min_value=5.0,
-                        value=float(st.session_state.get("plate_Eg", 20.0)),
-                        step=1.0,
+
+            elif cas.startswith("10"):
+                # ----- CAS 10 : tassements d’un ensemble de semelles -----
+                st.markdown("**Tassements d’un ensemble de semelles (interaction)**")
+                st.caption(
+                    "Superposition de Steinbrenner (Boussinesq intégré) sur le profil multicouche du cas 2, "
+                    "profondeurs comptées depuis la base des semelles. Interaction limitée aux semelles "
+                    "dont les bords sont à moins de la distance de coupure."
+                )
+
+                with saisie_groupee("rig_saisie"):
+                    f_sem = st.file_uploader("Plan de fondation (x, y, B, L, Q)", type=["csv", "txt"], key="ts_fichier")
+                    colonnes_sem = ["x [m]", "y [m]", "B [m]", "L [m]", "Q [kN]"]
+                    if f_sem is not None:
+                        try:
+                            df_sem = ressorts.lire_table(f_sem.getvalue())
+                            if df_sem.shape[1] != len(colonnes_sem):
+                                raise ValueError(f"{df_sem.shape[1]} colonne(s), 5 attendues (x, y, B, L, Q)")
+                            df_sem = df_sem.apply(pd.to_numeric)
+                            df_sem.columns = colonnes_sem
+                        except ValueError as e:
+                            st.error(f"Lecture impossible : {e}")
+                            df_sem = pd.DataFrame(columns=colonnes_sem, dtype=float)
+                    else:
+                        df_sem = pd.DataFrame(
+                            {
+                                "x [m]": [0.0, 5.0, 10.0, 0.0, 5.0, 10.0],
+                                "y [m]": [0.0, 0.0, 0.0, 6.0, 6.0, 6.0],
+                                "B [m]": [1.8, 2.2, 1.8, 1.8, 2.2, 1.8],
+                                "L [m]": [1.8, 2.2, 1.8, 1.8, 2.2, 1.8],
+                                "Q [kN]": [600.0, 1100.0, 600.0, 600.0, 1100.0, 600.0],
+                            }
+                        )
+                    st.session_state.ts_semelles = st.data_editor(
+                        df_sem, num_rows="dynamic", hide_index=True, key="ts_editor",
+                    )
+
+                    c1, c2, c3 = st.columns(3)
+                    with c1:
+                        st.session_state.ts_nu = st.number_input(
+                            "ν sol", min_value=0.0, max_value=0.49,
+                            value=float(st.session_state.get("ts_nu", st.session_state.get("multi_nu", 0.30))), step=0.01,
+                        )
+                    with c2:
+                        st.session_state.ts_rc = st.number_input(
+                            "Distance de coupure [m]", min_value=0.0,
+                            value=float(st.session_state.get("ts_rc", 15.0)), step=1.0,
+                        )
+                    with c3:
+                        st.session_state.ts_zmax = st.number_input(
+                            "Base rigide z_max [m] (0 = ∞)", min_value=0.0,
+                            value=float(st.session_state.get("ts_zmax", 0.0)), step=1.0,
+                        )
+                    st.radio(
+                        "Point de calcul", ["caractéristique", "centre"], horizontal=True, key="ts_point",
+                        help="Point caractéristique (0,37·B et 0,37·L du centre) : tassement d’une semelle rigide.",
                     )
+
             else:
-                st.session_state.plate_tg = st.session_state.get("plate_tg", 0.0)
-                st.session_state.plate_Eg = st.session_state.get("plate_Eg", 20.0)
+                # ----- CAS 6 : abaque sols (colonne gauche : rien à saisir) -----
+                st.markdown("**Base de données / abaques sols**")
+                st.caption(
+                    "Valeurs indicatives de poids volumique γ, raideur k (MN/m³) et contraintes "
+                    "admissibles qₐ (kg/cm²) associées à un tassement de référence w_adm. "
+                    "À confirmer par le géotechnicien."
+                )
 
-        elif cas.startswith("5"):
-            # ----- CAS 5 : convertisseur -----
-            st.markdown("**Convertisseur et vérification rapide**")
-            st.info("Zone à compléter : conversions k ↔ E ↔ q,w.")
-
-        else:
-            # ----- CAS 6 : abaque sols (colonne gauche : rien à saisir) -----
-            st.markdown("**Base de données / abaques sols**")
-            st.caption(
-                "Valeurs indicatives de poids volumique γ, raideur k (MN/m³) et contraintes "
-                "admissibles qₐ (kg/cm²) associées à un tassement de référence w_adm. "
-                "À confirmer par le géotechnicien."
-            )
+        # =============================================================
+        # ================        COLONNE DROITE         ==============
+        # =============================================================
+        jalon("résultats")
+        with col_right:
+            st.markdown("### Dimensionnement / Résultats")
 
-    # =============================================================
-    # ================        COLONNE DROITE         ==============
-    # =============================================================
-    with col_right:
-        st.markdown("### Dimensionnement / Résultats")
+            st.session_state.detail_calc = st.checkbox(
+                "📘 Détail des calculs (formules + valeurs numériques)",
+                value=st.session_state.detail_calc,
+            )
 
-        st.session_state.detail_calc = st.checkbox(
-            "📘 Détail des calculs (formules + valeurs numériques)",
-            value=st.session_state.detail_calc,
-        )
+            # ----- CAS 1 : Sol homogène -----
+            if cas.startswith("1."):
+                with st.container(border=True):
+
+                    # On n'affiche que la méthode sélectionnée
+                    # ---------------------------------------
+
+                    # (1) k = q / w
+                    if method.startswith("1."):
+                        if (
+                            "solo_q" in st.session_state
+                            and "solo_w" in st.session_state
+                            and st.session_state.solo_w
+                        ):
+                            q_kPa = to_kPa_from(st.session_state.solo_q, st.session_state.press_unit)
+                            w_m = st.session_state.solo_w / 1000.0
+                            k_kNpm3 = q_kPa / w_m
+                            ksA = kNpm3_to_MNpm3(k_kNpm3)
+                            st.metric("k (MN/m³)", f"{ksA:,.2f}")
+                            if st.session_state.detail_calc:
+                                st.latex(r"k = \dfrac{q}{w}")
+                                st.latex(
+                                    f"k = \\dfrac{{{q_kPa:,.1f}\\,\\text{{kN/m²}}}}{{{w_m:,.3f}\\,\\text{{m}}}}"
+                                    f" = {k_kNpm3:,.1f}\\,\\text{{kN/m³}} = {ksA:,.2f}\\,\\text{{MN/m³}}"
+                                )
+                                param_table(
+                                    [
+                                        ("q", "Pression de service", f"{st.session_state.solo_q:,.3f}", st.session_state.press_unit),
+                                        ("w", "Tassement", f"{st.session_state.solo_w:,.3f}", "mm"),
+                                        ("k", "Raideur de sol", f"{ksA:,.3f}", "MN/m³"),
+                                    ]
+                                )
 
-        # ----- CAS 1 : Sol homogène -----
-        if cas.startswith("1"):
-            with st.container(border=True):
-
-                # On n'affiche que la méthode sélectionnée
-                # ---------------------------------------
-
-                # (1) k = q / w
-                if method.startswith("1."):
-                    if (
-                        "solo_q" in st.session_state
-                        and "solo_w" in st.session_state
-                        and st.session_state.solo_w
-                    ):
-                        q_kPa = to_kPa_from(st.session_state.solo_q, st.session_state.press_unit)
-                        w_m = st.session_state.solo_w / 1000.0
-                        k_kNpm3 = q_kPa / w_m
-                        ksA = kNpm3_to_MNpm3(k_kNpm3)
-                        st.metric("k (MN/m³)", f"{ksA:,.2f}")
-                        if st.session_state.detail_calc:
-                            st.latex(r"k = \dfrac{q}{w}")
-                            st.latex(
-                                f"k = \\dfrac{{{q_kPa:,.1f}\\,\\text{{kN/m²}}}}{{{w_m:,.3f}\\,\\text{{m}}}}"
-                                f" = {k_kNpm3:,.1f}\\,\\text{{kN/m³}} = {ksA:,.2f}\\,\\text{{MN/m³}}"
-                            )
-                            param_table(
-                                [
-                                    ("q", "Pression de service", f"{st.session_state.solo_q:,.3f}", st.session_state.press_unit),
-                                    ("w", "Tassement", f"{st.session_state.solo_w:,.3f}", "mm"),
-                                    ("k", "Raideur de sol", f"{ksA:,.3f}", "MN/m³"),
-                                ]
-                            )
-
-                # (2) k = q_ad / s_ad
-                elif method.startswith("2."):
-                    if "solo_qad" in st.session_state and "solo_sadm" in st.session_state:
-                        sadm_m = st.session_state.solo_sadm / 1000.0
-                        qad_kPa = to_kPa_from(st.session_state.solo_qad, st.session_state.press_unit)
-                        qad_used = qad_kPa * (st.session_state.solo_sf if st.session_state.solo_isult else 1.0)
-                        if sadm_m > 0:
-                            k_kNpm3_B = qad_used / sadm_m
-                            ksB = kNpm3_to_MNpm3(k_kNpm3_B)
-                            st.metric("k (MN/m³)", f"{ksB:,.2f}")
+                    # (2) k = q_ad / s_ad
+                    elif method.startswith("2."):
+                        if "solo_qad" in st.session_state and "solo_sadm" in st.session_state:
+                            sadm_m = st.session_state.solo_sadm / 1000.0
+                            qad_kPa = to_kPa_from(st.session_state.solo_qad, st.session_state.press_unit)
+                            qad_used = qad_kPa * (st.session_state.solo_sf if st.session_state.solo_isult else 1.0)
+                            if sadm_m > 0:
+                                k_kNpm3_B = qad_used / sadm_m
+                                ksB = kNpm3_to_MNpm3(k_kNpm3_B)
+                                st.metric("k (MN/m³)", f"{ksB:,.2f}")
+                                if st.session_state.detail_calc:
+                                    st.latex(r"k = \dfrac{q^{ad}}{s^{adm}}")
+                                    st.latex(
+                                        f"k = \\dfrac{{{qad_used:,.1f}\\,\\text{{kN/m²}}}}{{{sadm_m:,.3f}\\,\\text{{m}}}}"
+                                        f" = {k_kNpm3_B:,.1f}\\,\\text{{kN/m³}} = {ksB:,.2f}\\,\\text{{MN/m³}}"
+                                    )
+                                    param_table(
+                                        [
+                                            ("q ad", "Contrainte (admissible ou ultime×SF)",
+                                             f"{from_kPa_to(qad_used, st.session_state.press_unit):,.3f}",
+                                             st.session_state.press_unit),
+                                            ("s adm", "Tassement admissible", f"{st.session_state.solo_sadm:,.3f}", "mm"),
+                                            ("SF", "Facteur de sécurité",
+                                             f"{st.session_state.solo_sf:,.2f}" if st.session_state.solo_isult else "—",
+                                             "—"),
+                                            ("k", "Raideur de sol", f"{ksB:,.3f}", "MN/m³"),
+                                        ]
+                                    )
+
+                    # (3) k ≈ E / [B(1−ν²)]
+                    elif method.startswith("3."):
+                        if "solo_E" in st.session_state and "solo_B" in st.session_state:
+                            E_input = st.session_state.solo_E
+                            E_MPa = E_input if st.session_state.module_unit == "MPa" else E_input * 1000.0
+                            E_kPa = E_MPa_to_kPa(E_MPa)
+                            B = max(st.session_state.solo_B, 1e-6)
+                            nu = st.session_state.solo_nu
+                            k_kNpm3_C = E_kPa / (B * (1 - nu ** 2))
+                            ksC = kNpm3_to_MNpm3(k_kNpm3_C)
+                            st.metric("k (MN/m³)", f"{ksC:,.2f}")
                             if st.session_state.detail_calc:
-                                st.latex(r"k = \dfrac{q^{ad}}{s^{adm}}")
+                                st.latex(r"k \approx \dfrac{E}{B(1-\nu^2)}")
                                 st.latex(
-                                    f"k = \\dfrac{{{qad_used:,.1f}\\,\\text{{kN/m²}}}}{{{sadm_m:,.3f}\\,\\text{{m}}}}"
-                                    f" = {k_kNpm3_B:,.1f}\\,\\text{{kN/m³}} = {ksB:,.2f}\\,\\text{{MN/m³}}"
+                                    f"k \\approx \\dfrac{{{E_kPa:,.0f}\\,\\text{{kN/m²}}}}"
+                                    f"{{{B:,.2f}\\,\\text{{m}}(1-{nu:.2f}^2)}}"
+                                    f" = {k_kNpm3_C:,.1f}\\,\\text{{kN/m³}} = {ksC:,.2f}\\,\\text{{MN/m³}}"
                                 )
                                 param_table(
                                     [
-                                        ("q ad", "Contrainte (admissible ou ultime×SF)",
-                                         f"{from_kPa_to(qad_used, st.session_state.press_unit):,.3f}",
-                                         st.session_state.press_unit),
-                                        ("s adm", "Tassement admissible", f"{st.session_state.solo_sadm:,.3f}", "mm"),
-                                        ("SF", "Facteur de sécurité",
-                                         f"{st.session_state.solo_sf:,.2f}" if st.session_state.solo_isult else "—",
-                                         "—"),
-                                        ("k", "Raideur de sol", f"{ksB:,.3f}", "MN/m³"),
+                                        ("E", "Module de Young", f"{E_MPa:,.3f}", "MPa"),
+                                        ("B", "Largeur caractéristique", f"{B:,.3f}", "m"),
+                                        ("ν", "Coefficient de Poisson", f"{nu:,.3f}", "—"),
+                                        ("k", "Raideur de sol", f"{ksC:,.3f}", "MN/m³"),
                                     ]
                                 )
 
-                # (3) k ≈ E / [B(1−ν²)]
-                elif method.startswith("3."):
-                    if "solo_E" in st.session_state and "solo_B" in st.session_state:
-                        E_input = st.session_state.solo_E
-                        E_MPa = E_input if st.session_state.module_unit == "MPa" else E_input * 1000.0
-                        E_kPa = E_MPa_to_kPa(E_MPa)
-                        B = max(st.session_state.solo_B, 1e-6)
-                        nu = st.session_state.solo_nu
-                        k_kNpm3_C = E_kPa / (B * (1 - nu ** 2))
-                        ksC = kNpm3_to_MNpm3(k_kNpm3_C)
-                        st.metric("k (MN/m³)", f"{ksC:,.2f}")
-                        if st.session_state.detail_calc:
-                            st.latex(r"k \approx \dfrac{E}{B(1-\nu^2)}")
-                            st.latex(
-                                f"k \\approx \\dfrac{{{E_kPa:,.0f}\\,\\text{{kN/m²}}}}"
-                                f"{{{B:,.2f}\\,\\text{{m}}(1-{nu:.2f}^2)}}"
-                                f" = {k_kNpm3_C:,.1f}\\,\\text{{kN/m³}} = {ksC:,.2f}\\,\\text{{MN/m³}}"
-                            )
-                            param_table(
-                                [
-                                    ("E", "Module de Young", f"{E_MPa:,.3f}", "MPa"),
-                                    ("B", "Largeur caractéristique", f"{B:,.3f}", "m"),
-                                    ("ν", "Coefficient de Poisson", f"{nu:,.3f}", "—"),
-                                    ("k", "Raideur de sol", f"{ksC:,.3f}", "MN/m³"),
-                                ]
-                            )
-
-        # ----- CAS 2 : Sol multicouche -----
-        elif cas.startswith("2"):
-            layers = st.session_state.get("multi_layers", [])
-            denom, H = 0.0, 0.0
-            for lay in layers:
-                h = float(lay["h"])
-                H += h
-                E_MPa = float(lay["E"])
-                E_kPa = E_MPa_to_kPa(E_MPa)
-                if E_kPa > 0:
-                    denom += h / E_kPa
-
-            ks_eq = 0.0
-            if denom > 0:
-                k_kNpm3_eq = 1.0 / denom
-                ks_eq = kNpm3_to_MNpm3(k_kNpm3_eq)
-            st.metric("k_eq (MN/m³)", f"{ks_eq:,.2f}")
-
-            if st.session_state.detail_calc:
-                st.latex(r"k_{eq} = \left( \sum_i \dfrac{h_i}{E_i} \right)^{-1}")
+            # ----- CAS 2 : Sol multicouche -----
+            elif cas.startswith("2"):
+                layers = st.session_state.get("multi_layers", [])
+                denom, H = 0.0, 0.0
+                for lay in layers:
+                    h = float(lay["h"])
+                    H += h
+                    E_MPa = float(lay["E"])
+                    E_kPa = E_MPa_to_kPa(E_MPa)
+                    if E_kPa > 0:
+                        denom += h / E_kPa
+
+                ks_eq = 0.0
                 if denom > 0:
+                    k_kNpm3_eq = 1.0 / denom
+                    ks_eq = kNpm3_to_MNpm3(k_kNpm3_eq)
+                st.metric("k_eq (MN/m³)", f"{ks_eq:,.2f}")
+                st.session_state.k_multi_kNpm3 = MNpm3_to_kNpm3(ks_eq)
+
+                if st.session_state.detail_calc:
+                    st.latex(r"k_{eq} = \left( \sum_i \dfrac{h_i}{E_i} \right)^{-1}")
+                    if denom > 0:
+                        st.latex(
+                            f"k_{{eq}} = \\left( \\sum_i \\dfrac{{h_i}}{{E_i}} \\right)^{{-1}}"
+                            f" = {k_kNpm3_eq:,.1f}\\,\\text{{kN/m³}} = {ks_eq:,.2f}\\,\\text{{MN/m³}}"
+                        )
+                    param_table(
+                        [
+                            ("H", "Somme des épaisseurs", f"{H:,.3f}", "m"),
+                            ("k_eq", "Raideur équivalente", f"{ks_eq:,.3f}", "MN/m³"),
+                        ]
+                    )
+
+                if st.session_state.get("multi_scale"):
+                    H_eff = max(H, 1e-6)
+                    Eeq_kPa = MNpm3_to_kNpm3(ks_eq) * H_eff
+                    Bm = st.session_state.get("multi_B", 2.0)
+                    nu = st.session_state.get("multi_nu", 0.30)
+                    k_kNpm3_B = Eeq_kPa / (Bm * (1 - nu ** 2))
+                    ksB = kNpm3_to_MNpm3(k_kNpm3_B)
+                    st.metric("k (avec B, ν) (MN/m³)", f"{ksB:,.2f}")
+                    st.session_state.k_multi_kNpm3 = k_kNpm3_B
+                    if st.session_state.detail_calc:
+                        st.latex(r"E_{eq} = k_{eq} \cdot H")
+                        st.latex(r"k = \dfrac{E_{eq}}{B(1-\nu^2)}")
+                        st.latex(
+                            f"k = {k_kNpm3_B:,.1f}\\,\\text{{kN/m³}} = {ksB:,.2f}\\,\\text{{MN/m³}}"
+                        )
+
+            # ----- CAS 3 : CPT -----
+            elif cas.startswith("3") and st.session_state.get("cpt_source") == "Logs CPT (fichiers)":
+                logs = st.session_state.get("cpt_logs", ())
+                if not logs:
+                    st.info("Charger un ou plusieurs logs CPT dans la colonne de gauche.")
+                else:
+                    try:
+                        res, profils = cpt_lot(
+                            logs,
+                            st.session_state.cpt_alphaE,
+                            st.session_state.cpt_zw,
+                            st.session_state.cpt_gamma or None,
+                            st.session_state.cpt_B,
+                            st.session_state.cpt_nu,
+                            st.session_state.cpt_Df,
+                            st.session_state.cpt_nB,
+                        )
+                    except ValueError as e:
+                        st.error(f"Lecture impossible : {e}")
+                        res, profils = [], {}
+
+                    if res:
+                        ks_all = kNpm3_to_MNpm3(np.array([r["k"] for r in res]))
+                        st.session_state.cpt_k_results = [(r["nom"], r["k"]) for r in res]
+                        c1, c2, c3 = st.columns(3)
+                        c1.metric("k min (MN/m³)", f"{ks_all.min():,.2f}")
+                        c2.metric("k moyen (MN/m³)", f"{ks_all.mean():,.2f}")
+                        c3.metric("k max (MN/m³)", f"{ks_all.max():,.2f}")
+
+                        df_cpt = pd.DataFrame(
+                            {
+                                "Sondage": [r["nom"] for r in res],
+                                "n mesures": [r["n"] for r in res],
+                                "z max (m)": [r["z_max"] for r in res],
+                                "H infl. (m)": [r["H"] for r in res],
+                                "E_eq (MPa)": from_kPa_to(np.array([r["E_eq"] for r in res]), "MPa"),
+                                "k (MN/m³)": ks_all,
+                            }
+                        )
+                        st.dataframe(df_cpt, use_container_width=True, hide_index=True)
+
+                        choix_cpt = st.selectbox("Profil E(z) du sondage", [r["nom"] for r in res])
+                        prof = profils[choix_cpt]
+                        st.line_chart(
+                            pd.DataFrame(
+                                {"E (MPa)": from_kPa_to(prof["E"], "MPa"), "σ'v0 (kPa)": prof["sv0_eff"]},
+                                index=pd.Index(prof["z"], name="z (m)"),
+                            )
+                        )
+
+                        if st.session_state.detail_calc:
+                            st.latex(r"q_t = q_c + u_2(1-a),\quad \sigma'_{v0} = \int_0^z \gamma\,dz - u_0")
+                            st.latex(r"E(z) = \alpha_E \,(q_t - \sigma'_{v0})")
+                            st.latex(r"E_{eq} = \dfrac{H}{\int_{D_f}^{D_f+nB} dz/E(z)},\quad k \approx \dfrac{E_{eq}}{B(1-\nu^2)}")
+
+            elif cas.startswith("3"):
+                qt_MPa = st.session_state.get("cpt_qt", 0.0)
+                qt_kPa = to_kPa_from(qt_MPa, "MPa")
+                alphaE = st.session_state.get("cpt_alphaE", 2.5)
+                sv0_kPa = st.session_state.get("cpt_sv0", 0.0)
+                delta = max(qt_kPa - sv0_kPa, 0.0)
+                E_kPa = alphaE * delta
+                E_MPa = from_kPa_to(E_kPa, "MPa")
+
+                B = max(st.session_state.get("cpt_B", 2.0), 1e-6)
+                nu = st.session_state.get("cpt_nu", 0.30)
+                k_kNpm3 = E_kPa / (B * (1 - nu ** 2))
+                ks = kNpm3_to_MNpm3(k_kNpm3)
+
+                c1, c2 = st.columns(2)
+                c1.metric("E estimé (MPa)", f"{E_MPa:,.1f}")
+                c2.metric("k (MN/m³)", f"{ks:,.2f}")
+
+                if st.session_state.detail_calc:
+                    st.latex(r"E = \alpha_E \,(q_t - \sigma'_{v0})")
                     st.latex(
-                        f"k_{{eq}} = \\left( \\sum_i \\dfrac{{h_i}}{{E_i}} \\right)^{{-1}}"
-                        f" = {k_kNpm3_eq:,.1f}\\,\\text{{kN/m³}} = {ks_eq:,.2f}\\,\\text{{MN/m³}}"
+                        f"E = {alphaE:,.2f}({qt_kPa:,.0f}-{sv0_kPa:,.0f})"
+                        f" = {E_kPa:,.0f}\\,\\text{{kN/m²}} = {E_MPa:,.1f}\\,\\text{{MPa}}"
                     )
-                param_table(
-                    [
-                        ("H", "Somme des épaisseurs", f"{H:,.3f}", "m"),
-                        ("k_eq", "Raideur équivalente", f"{ks_eq:,.3f}", "MN/m³"),
-                    ]
-                )
+                    st.latex(r"k \approx \dfrac{E}{B(1-\nu^2)}")
+                    st.latex(
+                        f"k \\approx {k_kNpm3:,.1f}\\,\\text{{kN/m³}} = {ks:,.2f}\\,\\text{{MN/m³}}"
+                    )
+
+            # ----- CAS 4 : Plat sur béton -----
+            elif cas.startswith("4"):
+                Bp_mm = st.session_state.get("plate_B", 200.0)
+                Lp_mm = st.session_state.get("plate_L", 200.0)
+                alpha = st.session_state.get("plate_alpha", 0.5)
+                Bp = Bp_mm / 1000.0
+                Lp = Lp_mm / 1000.0
+                hc = alpha * min(Bp, Lp)
+
+                Ec_GPa = st.session_state.get("plate_Ec", 30.0)
+                Ec_kPa = E_GPa_to_kPa(Ec_GPa)
+
+                use_nu = st.session_state.get("plate_use_nu", True)
+                nu_c = st.session_state.get("plate_nu", 0.20)
+
+                if hc > 0:
+                    if use_nu:
+                        kc_kNpm3 = Ec_kPa / (hc * (1 - nu_c ** 2))
+                    else:
+                        kc_kNpm3 = Ec_kPa / hc
+                else:
+                    kc_kNpm3 = 0.0
+
+                has_grout = st.session_state.get("plate_has_grout", False)
+                keq_kNpm3 = kc_kNpm3
+
+                if has_grout and st.session_state.get("plate_tg", 0.0) > 0:
+                    tg_m = st.session_state.get("plate_tg", 20.0) / 1000.0
+                    Eg_GPa = st.session_state.get("plate_Eg", 20.0)
+                    Eg_kPa = E_GPa_to_kPa(Eg_GPa)
+                    kg_kNpm3 = Eg_kPa / tg_m if tg_m > 0 else 0.0
+                    if kc_kNpm3 > 0 and kg_kNpm3 > 0:
+                        keq_kNpm3 = 1.0 / (1.0 / kc_kNpm3 + 1.0 / kg_kNpm3)
+
+                keq = kNpm3_to_MNpm3(keq_kNpm3)
+                st.metric("k_eq (MN/m³)", f"{keq:,.1f}")
 
-            if st.session_state.get("multi_scale"):
-                H_eff = max(H, 1e-6)
-                Eeq_kPa = (ks_eq * 1000.0) * H_eff
-                Bm = st.session_state.get("multi_B", 2.0)
-                nu = st.session_state.get("multi_nu", 0.30)
-                k_kNpm3_B = Eeq_kPa / (Bm * (1 - nu ** 2))
-                ksB = kNpm3_to_MNpm3(k_kNpm3_B)
-                st.metric("k (avec B, ν) (MN/m³)", f"{ksB:,.2f}")
                 if st.session_state.detail_calc:
-                    st.latex(r"E_{eq} = k_{eq} \cdot H")
-                    st.latex(r"k = \dfrac{E_{eq}}{B(1-\nu^2)}")
+                    st.latex(r"h_c = \alpha \,\min(B,L)")
+                    st.latex(
+                        f"h_c = {alpha:,.2f} \\times "
+                        f"\\min({Bp:,.3f},{Lp:,.3f}) = {hc:,.3f}\\,\\text{{m}}"
+                    )
+                    st.latex(r"k_c \approx \dfrac{E_c}{h_c(1-\nu^2)}")
                     st.latex(
-                        f"k = {k_kNpm3_B:,.1f}\\,\\text{{kN/m³}} = {ksB:,.2f}\\,\\text{{MN/m³}}"
+                        f"k_c \\approx {kc_kNpm3:,.1f}\\,\\text{{kN/m³}}"
+                    )
+                    if has_grout:
+                        st.latex(r"\dfrac{1}{k_{eq}} = \dfrac{1}{k_c} + \dfrac{1}{k_g}")
+                    param_table(
+                        [
+                            ("B", "Largeur plat", f"{Bp_mm:,.0f}", "mm"),
+                            ("L", "Longueur plat", f"{Lp_mm:,.0f}", "mm"),
+                            ("h_c", "Épaisseur équivalente béton", f"{hc*1000:,.1f}", "mm"),
+                            ("E_c", "Module béton", f"{Ec_GPa:,.1f}", "GPa"),
+                            ("k_eq", "Raideur équivalente", f"{keq:,.1f}", "MN/m³"),
+                        ]
                     )
 
-        # ----- CAS 3 : CPT -----
-        elif cas.startswith("3"):
-            qt_MPa = st.session_state.get("cpt_qt", 0.0)
-            qt_kPa = qt_MPa * 1000.0
-            alphaE = st.session_state.get("cpt_alphaE", 2.5)
-            sv0_kPa = st.session_state.get("cpt_sv0", 0.0)
-            delta = max(qt_kPa - sv0_kPa, 0.0)
-            E_kPa = alphaE * delta
-            E_MPa = E_kPa / 1000.0
-
-            B = max(st.session_state.get("cpt_B", 2.0), 1e-6)
-            nu = st.session_state.get("cpt_nu", 0.30)
-            k_kNpm3 = E_kPa / (B * (1 - nu ** 2))
-            ks = kNpm3_to_MNpm3(k_kNpm3)
-
-            c1, c2 = st.columns(2)
-            c1.metric("E estimé (MPa)", f"{E_MPa:,.1f}")
-            c2.metric("k (MN/m³)", f"{ks:,.2f}")
-
-            if st.session_state.detail_calc:
-                st.latex(r"E = \alpha_E \,(q_t - \sigma'_{v0})")
-                st.latex(
-                    f"E = {alphaE:,.2f}({qt_kPa:,.0f}-{sv0_kPa:,.0f})"
-                    f" = {E_kPa:,.0f}\\,\\text{{kN/m²}} = {E_MPa:,.1f}\\,\\text{{MPa}}"
-                )
-                st.latex(r"k \approx \dfrac{E}{B(1-\nu^2)}")
-                st.latex(
-                    f"k \\approx {k_kNpm3:,.1f}\\,\\text{{kN/m³}} = {ks:,.2f}\\,\\text{{MN/m³}}"
-                )
+            # ----- CAS 7 : poutre sur sol élastique -----
+            elif cas.startswith("7"):
+                L_bw = st.session_state.bw_L
+                n_bw = int(st.session_state.bw_n)
+                x_nodes = np.linspace(0.0, L_bw, n_bw + 1)
+
+                k_src = st.session_state.bw_k_src
+                k_x = None
+                if k_src == "Valeur saisie":
+                    k_x = MNpm3_to_kNpm3(st.session_state.bw_k)
+                elif k_src == "Sol multicouche (cas 2)":
+                    k_x = st.session_state.get("k_multi_kNpm3")
+                    if not k_x:
+                        st.warning("Calculer d’abord k avec le cas 2 (sol multicouche).")
+                else:
+                    df_pos = st.session_state.get("bw_cpt_pos")
+                    if df_pos is None or df_pos.empty:
+                        st.warning("Charger d’abord des logs CPT dans le cas 3.")
+                    else:
+                        # k = 0 : sondage arrêté au-dessus de la zone d’influence → donnée manquante
+                        sans_k = df_pos["k [MN/m³]"] <= 0
+                        if sans_k.any():
+                            st.warning(
+                                "Sondage(s) sans k (log arrêté au-dessus de la zone d’influence), ignoré(s) : "
+                                + ", ".join(df_pos.loc[sans_k, "Sondage"])
+                            )
+                        df_pos = df_pos[~sans_k]
+                        if not df_pos.empty:
+                            k_x = winkler.k_interpole(
+                                x_nodes, df_pos["x [m]"].to_numpy(float),
+                                MNpm3_to_kNpm3(df_pos["k [MN/m³]"].to_numpy(float)),
+                            )
 
-        # ----- CAS 4 : Plat sur béton -----
-        elif cas.startswith("4"):
-            Bp_mm = st.session_state.get("plate_B", 200.0)
-            Lp_mm = st.session_state.get("plate_L", 200.0)
-            alpha = st.session_state.get("plate_alpha", 0.5)
-            Bp = Bp_mm / 1000.0
-            Lp = Lp_mm / 1000.0
-            hc = alpha * min(Bp, Lp)
+                if k_x is not None and not np.all(np.asarray(k_x) > 0):
+                    st.warning("k doit être strictement positif le long de la poutre.")
+                    k_x = None
+
+                if k_x is not None:
+                    B_bw, h_bw = st.session_state.bw_B, st.session_state.bw_h
+                    EI = E_GPa_to_kPa(st.session_state.bw_E) * B_bw * h_bw ** 3 / 12.0     # kN·m²
+                    df_P = st.session_state.bw_P.dropna()
+                    charges = list(zip(df_P["x [m]"].astype(float), df_P["P [kN]"].astype(float)))
+
+                    res = winkler.poutre_winkler(L_bw, EI, B_bw, k_x, q=st.session_state.bw_q,
+                                                 charges=charges, n_elem=n_bw)
+
+                    c1, c2, c3, c4 = st.columns(4)
+                    c1.metric("w max (mm)", f"{res['w'].max() * 1000:,.2f}")
+                    c2.metric("M max (kN·m)", f"{res['M'].max():,.1f}")
+                    c3.metric("M min (kN·m)", f"{res['M'].min():,.1f}")
+                    c4.metric("p max (kPa)", f"{res['p'].max():,.1f}")
+                    if res["p"].min() < 0:
+                        st.warning("Soulèvement (p < 0) sur une partie de la poutre : "
+                                   "le modèle linéaire suppose des ressorts bilatéraux.")
+
+                    idx = pd.Index(res["x"], name="x (m)")
+                    st.markdown("**Tassement w (mm)**")
+                    st.line_chart(pd.DataFrame({"w (mm)": res["w"] * 1000.0}, index=idx))
+                    st.markdown("**Moment M (kN·m)**")
+                    st.line_chart(pd.DataFrame({"M (kN·m)": res["M"]}, index=idx))
+                    st.markdown("**Pression de contact p (kPa)**")
+                    st.line_chart(pd.DataFrame({"p (kPa)": res["p"]}, index=idx))
+
+                    if st.session_state.detail_calc:
+                        st.latex(r"EI\,w^{(4)} + k\,B\,w = q")
+                        st.latex(
+                            f"EI = E\\,\\dfrac{{B h^3}}{{12}} = {EI:,.0f}\\,\\text{{kN·m²}}"
+                        )
 
-            Ec_GPa = st.session_state.get("plate_Ec", 30.0)
-            Ec_kPa = E_GPa_to_kPa(Ec_GPa)
+            # ----- CAS 8 : radier sur sol élastique -----
+            elif cas.startswith("8"):
+                k_src = st.session_state.rd_k_src
+                k_rd = None
+                if k_src == "Valeur saisie":
+                    k_rd = MNpm3_to_kNpm3(st.session_state.rd_k)
+                elif k_src == "Sol multicouche (cas 2)":
+                    k_rd = st.session_state.get("k_multi_kNpm3")
+                    if not k_rd:
+                        st.warning("Calculer d’abord k avec le cas 2 (sol multicouche).")
+                else:
+                    cpt_res = st.session_state.get("cpt_k_results", [])
+                    if cpt_res:
+                        k_rd = float(np.mean([r[1] for r in cpt_res]))
+                    else:
+                        st.warning("Charger d’abord des logs CPT dans le cas 3.")
+
+                if k_rd:
+                    df_P = st.session_state.rd_P.dropna()
+                    df_L = st.session_state.rd_lignes.dropna()
+                    res = radier(
+                        st.session_state.rd_Lx, st.session_state.rd_Ly, st.session_state.rd_t,
+                        E_GPa_to_kPa(st.session_state.rd_E), st.session_state.rd_nu, k_rd,
+                        int(st.session_state.rd_nx), int(st.session_state.rd_ny), st.session_state.rd_q,
+                        tuple(map(tuple, df_P.to_numpy(float))), tuple(map(tuple, df_L.to_numpy(float))),
+                    )
+                    q_adm = st.session_state.rd_qadm
+                    p_max = float(res["p"].max())
+
+                    c1, c2, c3, c4 = st.columns(4)
+                    c1.metric("w max (mm)", f"{res['w'].max() * 1000:,.2f}")
+                    c2.metric("mx max/min (kN·m/m)", f"{res['mx'].max():,.1f} / {res['mx'].min():,.1f}")
+                    c3.metric("my max/min (kN·m/m)", f"{res['my'].max():,.1f} / {res['my'].min():,.1f}")
+                    c4.metric("p max (kPa)", f"{p_max:,.1f}", f"{p_max / q_adm * 100:.0f} % de q_adm",
+                              delta_color="inverse" if p_max > q_adm else "off")
+                    if p_max > q_adm:
+                        part = float((res["p"] > q_adm).mean() * 100)
+                        st.error(f"p > q_adm sur {part:.1f} % des nœuds du radier.")
+                    if res["p"].min() < 0:
+                        st.warning("Soulèvement (p < 0) sur une partie du radier : "
+                                   "le modèle linéaire suppose des ressorts bilatéraux.")
+
+                    champ = st.radio(
+                        "Champ affiché", ["Tassement w (mm)", "Pression p (kPa)", "Moment mx (kN·m/m)", "Moment my (kN·m/m)"],
+                        horizontal=True, key="rd_champ",
+                    )
+                    val = {
+                        "Tassement w (mm)": res["w"] * 1000.0, "Pression p (kPa)": res["p"],
+                        "Moment mx (kN·m/m)": res["mx"], "Moment my (kN·m/m)": res["my"],
+                    }[champ]
+                    contour = (res["x"], res["y"], res["p"], q_adm) if champ.startswith("Pression") else None
+                    st.image(
+                        carte_radier(champ, val, st.session_state.rd_Lx, st.session_state.rd_Ly, contour),
+                        width="stretch",
+                    )
 
-            use_nu = st.session_state.get("plate_use_nu", True)
-            nu_c = st.session_state.get("plate_nu", 0.20)
+                    if st.session_state.detail_calc:
+                        D_rd = E_GPa_to_kPa(st.session_state.rd_E) * st.session_state.rd_t ** 3 / (
+                            12.0 * (1.0 - st.session_state.rd_nu ** 2))
+                        st.latex(r"D\,\nabla^4 w + k\,w = q")
+                        st.latex(f"D = \\dfrac{{E t^3}}{{12(1-\\nu^2)}} = {D_rd:,.0f}\\,\\text{{kN·m}}")
+                        st.latex(r"m = -D\,\kappa \quad ; \quad p = k\,w \le q_{adm}")
+                        st.caption(f"{res['ndof']:,} ddl – k = {kNpm3_to_MNpm3(k_rd):,.1f} MN/m³")
+
+            # ----- CAS 9 : export ressorts nodaux -----
+            elif cas.startswith("9"):
+                noeuds_b, elements_b = st.session_state.get("rs_fichiers", (None, None))
+                k_src = st.session_state.rs_k_src
+                k_defaut, zones, sondages = None, (), ()
+                if k_src == "Uniforme / par zone":
+                    k_defaut = MNpm3_to_kNpm3(st.session_state.rs_k)
+                    dz = st.session_state.rs_zones.dropna().to_numpy(float, copy=True)
+                    dz[:, 4] = MNpm3_to_kNpm3(dz[:, 4])
+                    zones = tuple(map(tuple, dz))
+                elif k_src == "Sol multicouche (cas 2)":
+                    k_defaut = st.session_state.get("k_multi_kNpm3")
+                    if not k_defaut:
+                        st.warning("Calculer d’abord k avec le cas 2 (sol multicouche).")
+                else:
+                    df_pos = st.session_state.get("rs_cpt_pos")
+                    if df_pos is None or df_pos.empty:
+                        st.warning("Charger d’abord des logs CPT dans le cas 3.")
+                    else:
+                        sondages = tuple(zip(df_pos["x [m]"].astype(float), df_pos["y [m]"].astype(float),
+                                             MNpm3_to_kNpm3(df_pos["k [MN/m³]"].astype(float))))
+
+                if noeuds_b is None:
+                    st.info("Charger la table des nœuds.")
+                elif k_defaut or sondages:
+                    try:
+                        nd, k_n, K_n, texte = export_ressorts(
+                            noeuds_b, elements_b, k_defaut, zones, sondages,
+                            st.session_state.get("rs_methode", "plus proche"), st.session_state.rs_format,
+                        )
+                    except ValueError as e:
+                        st.error(str(e))
+                    else:
+                        if np.isnan(nd["A"]).any():
+                            st.error("Aires tributaires manquantes : ajouter une colonne A ou charger le maillage.")
+                        else:
+                            c1, c2, c3, c4 = st.columns(4)
+                            c1.metric("Nœuds", f"{len(K_n):,}")
+                            c2.metric("Σ A (m²)", f"{nd['A'].sum():,.2f}")
+                            c3.metric("k min / max (MN/m³)",
+                                      f"{kNpm3_to_MNpm3(k_n.min()):,.1f} / {kNpm3_to_MNpm3(k_n.max()):,.1f}")
+                            c4.metric("Σ K (MN/m)", f"{K_n.sum() / 1000:,.1f}")
+                            st.dataframe(
+                                pd.DataFrame({"id": nd["id"][:200], "x [m]": nd["x"][:200], "y [m]": nd["y"][:200],
+                                              "A [m²]": nd["A"][:200], "K [kN/m]": K_n[:200]}),
+                                hide_index=True, use_container_width=True,
+                            )
+                            st.caption("Aperçu des 200 premiers nœuds.")
+                            st.download_button(
+                                "⬇️ Télécharger les ressorts", data=texte,
+                                file_name=f"ressorts.{st.session_state.rs_format}", mime="text/plain",
+                            )
 
-            if hc > 0:
-                if use_nu:
-                    kc_kNpm3 = Ec_kPa / (hc * (1 - nu_c ** 2))
+                        if st.session_state.detail_calc:
+                            st.latex(r"K_i = k(x_i, y_i)\,A_{trib,i}")
+                            st.latex(r"A_{trib,i} = \sum_{e \ni i} \dfrac{A_e}{n_e}")
+
+            # ----- CAS 10 : tassements site -----
+            elif cas.startswith("10"):
+                layers = st.session_state.get("multi_layers", [])
+                df_sem = st.session_state.ts_semelles.dropna()
+                if not layers:
+                    st.warning("Définir d’abord le profil de sol avec le cas 2 (sol multicouche).")
+                elif df_sem.empty:
+                    st.info("Saisir ou charger au moins une semelle.")
                 else:
-                    kc_kNpm3 = Ec_kPa / hc
+                    res = tassements_site(
+                        tuple(map(tuple, df_sem.to_numpy(float))),
+                        tuple((l["h"], l["E"]) for l in layers),
+                        st.session_state.ts_nu, st.session_state.ts_rc,
+                        st.session_state.ts_zmax, st.session_state.ts_point,
+                    )
+                    s_mm = res["s"] * 1000.0
+                    c1, c2, c3, c4 = st.columns(4)
+                    c1.metric("Semelles", f"{len(s_mm):,}")
+                    c2.metric("s max (mm)", f"{s_mm.max():,.1f}")
+                    c3.metric("s min (mm)", f"{s_mm.min():,.1f}")
+                    c4.metric("Effet d’interaction moyen", f"+{(res['s'] / res['s_propre']).mean() * 100 - 100:.0f} %")
+
+                    df_res = df_sem.reset_index(drop=True).assign(
+                        **{
+                            "q [kPa]": res["q"],
+                            "s seule [mm]": res["s_propre"] * 1000.0,
+                            "s [mm]": s_mm,
+                            "voisins": res["voisins"],
+                            "k isolé [MN/m³]": kNpm3_to_MNpm3(res["k_iso"]),
+                            "k eff [MN/m³]": kNpm3_to_MNpm3(res["k_eff"]),
+                        }
+                    )
+                    st.dataframe(df_res.round(2), hide_index=True, use_container_width=True)
+                    st.download_button(
+                        "⬇️ Télécharger (CSV)", data=df_res.to_csv(sep=";", index=False).encode("utf-8"),
+                        file_name="tassements_site.csv", mime="text/csv",
+                    )
+
+                    st.image(plan_tassements(df_sem.to_numpy(float), s_mm), width="stretch")
+
+                    if st.session_state.detail_calc:
+                        st.latex(
+                            r"s_i = \sum_j q_j \sum_{c} \pm \sum_{\ell} "
+                            r"\dfrac{C(z_{b,\ell}) - C(z_{h,\ell})}{E_\ell}"
+                        )
+                        st.latex(
+                            r"C = B_c\left[(1-\nu^2)F_1 + (1-\nu-2\nu^2)F_2\right] \quad ; \quad "
+                            r"k_{eff,i} = \dfrac{q_i}{s_i}"
+                        )
+
+            # ----- CAS 5 : convertisseur -----
+            elif cas.startswith("5"):
+                texte = st.session_state.get("conv_texte", "").strip()
+                de, vers = st.session_state.conv_de, st.session_state.conv_vers
+                groupe = unites.GRANDEURS[st.session_state.conv_grandeur]
+                if de not in groupe or vers not in groupe:
+                    st.info("Choisir les unités.")
+                elif texte:
+                    sep = "\t" if "\t" in texte else (";" if ";" in texte else r"\s+")
+                    try:
+                        df_in = pd.read_csv(io.StringIO(texte), sep=sep, header=None, dtype=str,
+                                            engine="python", skip_blank_lines=True)
+                        vals = df_in.apply(lambda c: pd.to_numeric(c.str.strip().str.replace(",", "."), errors="coerce"))
+                        conv = unites.convertir(vals.to_numpy(float), de, vers)
+                    except ValueError as e:      # pd.errors.ParserError compris (lignes de longueurs différentes)
+                        st.error(f"Lecture impossible : {e}")
+                    else:
+                        df_out = pd.DataFrame(
+                            {
+                                **{f"col {i + 1} [{de}]": vals.iloc[:, i] for i in range(vals.shape[1])},
+                                **{f"col {i + 1} [{vers}]": conv[:, i] for i in range(vals.shape[1])},
+                            }
+                        )
+                        n_nan = int(vals.isna().to_numpy().sum())
+                        if n_nan:
+                            st.warning(f"{n_nan} valeur(s) non numérique(s) ignorée(s).")
+                        st.dataframe(df_out, hide_index=True, use_container_width=True)
+                        st.download_button(
+                            "⬇️ Télécharger (CSV)", data=df_out.to_csv(sep=";", index=False).encode("utf-8"),
+                            file_name="conversion.csv", mime="text/csv",
+                        )
+                        if st.session_state.detail_calc:
+                            st.latex(
+                                f"1\\,\\text{{{de}}} = {unites.convertir(1.0, de, vers):.6g}\\,\\text{{{vers}}}"
+                            )
+
+            # ----- CAS 6 : abaque sols -----
             else:
-                kc_kNpm3 = 0.0
-
-            has_grout = st.session_state.get("plate_has_grout", False)
-            keq_kNpm3 = kc_kNpm3
-
-            if has_grout and st.session_state.get("plate_tg", 0.0) > 0:
-                tg_m = st.session_state.get("plate_tg", 20.0) / 1000.0
-                Eg_GPa = st.session_state.get("plate_Eg", 20.0)
-                Eg_kPa = E_GPa_to_kPa(Eg_GPa)
-                kg_kNpm3 = Eg_kPa / tg_m if tg_m > 0 else 0.0
-                if kc_kNpm3 > 0 and kg_kNpm3 > 0:
-                    keq_kNpm3 = 1.0 / (1.0 / kc_kNpm3 + 1.0 / kg_kNpm3)
-
-            keq = kNpm3_to_MNpm3(keq_kNpm3)
-            st.metric("k_eq (MN/m³)", f"{keq:,.1f}")
-
-            if st.session_state.detail_calc:
-                st.latex(r"h_c = \alpha \,\min(B,L)")
-                st.latex(
-                    f"h_c = {alpha:,.2f} \\times "
-                    f"\\min({Bp:,.3f},{Lp:,.3f}) = {hc:,.3f}\\,\\text{{m}}"
+                # Tassement de référence pour convertir k → qadm
+                st.markdown("#### Réglage du tassement de référence")
+                st.session_state.abaque_w = st.number_input(
+                    "Tassement de référence w_adm [mm]",
+                    min_value=1.0,
+                    max_value=100.0,
+                    value=float(st.session_state.abaque_w),
+                    step=5.0,
+                    help="Tassement admissible utilisé pour convertir k (MN/m³) en qₐ (kg/cm²). "
+                         "En Belgique, 20 mm est une valeur courante pour les tassements de service.",
                 )
-                st.latex(r"k_c \approx \dfrac{E_c}{h_c(1-\nu^2)}")
-                st.latex(
-                    f"k_c \\approx {kc_kNpm3:,.1f}\\,\\text{{kN/m³}}"
+                w_adm = st.session_state.abaque_w
+                # facteur de conversion : q(kg/cm²) = k(MN/m³)*w(mm)/98.0665
+                factor_q = w_adm / unites.KGCM2_KPA
+
+                version, sols = load_abaque()
+                recherche = st.text_input(
+                    "🔎 Rechercher un sol (mots-clés)", key="abaque_recherche",
+                    placeholder="ex. sable limoneux, klei, remblai…",
                 )
-                if has_grout:
-                    st.latex(r"\dfrac{1}{k_{eq}} = \dfrac{1}{k_c} + \dfrac{1}{k_g}")
-                param_table(
-                    [
-                        ("B", "Largeur plat", f"{Bp_mm:,.0f}", "mm"),
-                        ("L", "Longueur plat", f"{Lp_mm:,.0f}", "mm"),
-                        ("h_c", "Épaisseur équivalente béton", f"{hc*1000:,.1f}", "mm"),
-                        ("E_c", "Module béton", f"{Ec_GPa:,.1f}", "GPa"),
-                        ("k_eq", "Raideur équivalente", f"{keq:,.1f}", "MN/m³"),
-                    ]
-                )
-
-        # ----- CAS 5 : convertisseur -----
-        elif cas.startswith("5"):
-            st.info("À compléter : petits outils de conversion (k ↔ E ↔ q,w).")
-
-        # ----- CAS 6 : abaque sols -----
-        else:
-            # Tassement de référence pour convertir k → qadm
-            st.markdown("#### Réglage du tassement de référence")
-            st.session_state.abaque_w = st.number_input(
-                "Tassement de référence w_adm [mm]",
-                min_value=1.0,
-                max_value=100.0,
-                value=float(st.session_state.abaque_w),
-                step=5.0,
-                help="Tassement admissible utilisé pour convertir k (MN/m³) en qₐ (kg/cm²). "
-                     "En Belgique, 20 mm est une valeur courante pour les tassements de service.",
-            )
-            w_adm = st.session_state.abaque_w
-            # facteur de conversion : q(kg/cm²) = k(MN/m³)*w(mm)/98.0665
-            factor_q = w_adm / 98.0665
-
-            soils = [
-                {
-                    "type": "Tourbe",
-                    "gamma": 10.0,
-                    "k_min": 1,
-                    "k_max": 5,
-                    "desc": "Sol très organique, très compressible, souvent saturé, capacité portante très faible. "
-                            "On évite de fonder dedans (remblais, pieux, substitution...).",
-                },
-                {
-                    "type": "Argile très molle",
-                    "gamma": 16.0,
-                    "k_min": 2,
-                    "k_max": 10,
-                    "desc": "Argile très plastique et peu consolidée, grande compressibilité et faibles résistances.",
-                },
-                {
-                    "type": "Argile molle à moyenne",
-                    "gamma": 18.0,
-                    "k_min": 10,
-                    "k_max": 40,
-                    "desc": "Argile normalement consolidée ou légèrement surconsolidée, tassements notables.",
-                },
-                {
-                    "type": "Argile ferme / surconsolidée",
-                    "gamma": 19.0,
-                    "k_min": 20,
-                    "k_max": 80,
-                    "desc": "Argile raide à très raide, surconsolidée ou bien drainée, meilleure tenue et tassements plus limités.",
-                },
-                {
-                    "type": "Limon",
-                    "gamma": 18.0,
-                    "k_min": 15,
-                    "k_max": 60,
-                    "desc": "Silt / limon, comportement intermédiaire entre argiles et sables, sensibles à l’eau et au compactage.",
-                },
-                {
-                    "type": "Sable lâche",
-                    "gamma": 18.0,
-                    "k_min": 10,
-                    "k_max": 30,
-                    "desc": "Sable peu compacté, tassements importants sous charges et comportement peu rigide.",
-                },
-                {
-                    "type": "Sable moyennement compact",
-                    "gamma": 19.0,
-                    "k_min": 30,
-                    "k_max": 80,
-                    "desc": "Sable courant sous les bâtiments, portance correcte, tassements modérés.",
-                },
-                {
-                    "type": "Sable dense / graveleux",
-                    "gamma": 20.0,
-                    "k_min": 80,
-                    "k_max": 200,
-                    "desc": "Sables très compacts ou graves denses, très bonne portance, tassements faibles.",
-                },
-            ]
-
-            df = pd.DataFrame(
-                [
-                    {
-                        "Type de sol": s["type"],
-                        "γ (kN/m³)": s["gamma"],
-                        "k_min (MN/m³)": s["k_min"],
-                        "k_max (MN/m³)": s["k_max"],
-                        "qₐ_min (kg/cm²)": s["k_min"] * factor_q,
-                        "qₐ_max (kg/cm²)": s["k_max"] * factor_q,
+                mots = _normalise(recherche).split()
+                if mots:
+                    masque = np.logical_and.reduce([sols["_texte"].str.contains(m, regex=False) for m in mots])
+                    sols = sols[masque]
+
+                # seules les colonnes qₐ dépendent de w_adm
+                df = sols.assign(
+                    **{
+                        "qₐ_min (kg/cm²)": sols["k_min (MN/m³)"] * factor_q,
+                        "qₐ_max (kg/cm²)": sols["k_max (MN/m³)"] * factor_q,
                     }
-                    for s in soils
-                ]
-            )
-            st.dataframe(df, use_container_width=True)
+                )
+                st.dataframe(df, column_order=ABAQUE_COLONNES, use_container_width=True, hide_index=True)
+                st.caption(f"Abaque sols v{version} – {len(df)} type(s) de sol affiché(s).")
 
-            st.markdown("#### Fiche sol")
+                if df.empty:
+                    st.info("Aucun sol ne correspond à la recherche.")
+                else:
+                    st.markdown("#### Fiche sol")
 
-            choix = st.selectbox(
-                "Afficher la fiche d’un type de sol :",
-                [s["type"] for s in soils],
-                index=6,
-            )
+                    types = df["Type de sol"].tolist()
+                    choix = st.selectbox(
+                        "Afficher la fiche d’un type de sol :",
+                        types,
+                        index=types.index("Sable moyennement compact") if "Sable moyennement compact" in types else 0,
+                    )
 
-            sol_sel = next(s for s in soils if s["type"] == choix)
-            q_min = sol_sel["k_min"] * factor_q
-            q_max = sol_sel["k_max"] * factor_q
+                    sol_sel = df[df["Type de sol"] == choix].iloc[0]
+                    st.markdown(f"**{sol_sel['Type de sol']}**")
+                    st.markdown(sol_sel["desc"])
+                    st.markdown(
+                        f"- γ ≈ **{sol_sel['γ (kN/m³)']} kN/m³**  \n"
+                        f"- k ≈ **{sol_sel['k_min (MN/m³)']} à {sol_sel['k_max (MN/m³)']} MN/m³**  \n"
+                        f"- pour w_adm = **{w_adm:.0f} mm** :  \n"
+                        f"  → qₐ ≈ **{sol_sel['qₐ_min (kg/cm²)']:.2f} à {sol_sel['qₐ_max (kg/cm²)']:.2f} kg/cm²**"
+                    )
 
-            st.markdown(f"**{sol_sel['type']}**")
-            st.markdown(sol_sel["desc"])
+            # Bas de page
+            st.divider()
             st.markdown(
-                f"- γ ≈ **{sol_sel['gamma']} kN/m³**  \n"
-                f"- k ≈ **{sol_sel['k_min']} à {sol_sel['k_max']} MN/m³**  \n"
-                f"- pour w_adm = **{w_adm:.0f} mm** :  \n"
-                f"  → qₐ ≈ **{q_min:.2f} à {q_max:.2f} kg/cm²**"
+                "<div class='small'>"
+                "Les valeurs de k et qₐ sont indicatives et réservées au pré-dimensionnement. "
+                "Toujours se référer au rapport géotechnique et à l’EN 1997 (Eurocode 7) pour le dimensionnement final."
+                "</div>",
+                unsafe_allow_html=True,
             )
 
-        # Bas de page
-        st.divider()
-        st.markdown(
-            "<div style='color:#64748B;font-size:.9rem;'>"
-            "Les valeurs de k et qₐ sont indicatives et réservées au pré-dimensionnement. "
-            "Toujours se référer au rapport géotechnique et à l’EN 1997 (Eurocode 7) pour le dimensionnement final."
-            "</div>",
-            unsafe_allow_html=True,
-        )
+    panneau()
@@ -0,0 +1,51 @@
+# modules/styles.py
+"""
+Feuilles de style des pages (dossier static/).
+
+Avec server.enableStaticServing (.streamlit/config.toml), une page n’envoie
+plus à chaque rerun qu’une balise <link> : le navigateur télécharge le CSS une
+fois et le garde en cache (paramètre ?v= = empreinte du fichier). Sans service
+statique, repli sur un <style> minifié, lu et préparé une seule fois par processus.
+"""
+import hashlib
+import os
+import re
+
+import streamlit as st
+
+from modules.cache import cache
+
+STATIC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static")
+URL_STATIC = "app/static"
+
+
+@cache(copie=False)
+def _feuille(nom):
+    """(CSS minifié, version) du fichier static/nom."""
+    with open(os.path.join(STATIC, nom), encoding="utf-8") as f:
+        css = f.read()
+    version = hashlib.sha1(css.encode("utf-8")).hexdigest()[:10]
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css).replace(";}", "}")
+    return css.strip(), version
+
+
+def _service_statique():
+    try:
+        return bool(st.get_option("server.enableStaticServing"))
+    except Exception:
+        return False
+
+
+def inclure(*noms):
+    """Ajoute à la page les feuilles static/<nom> (un seul élément markdown)."""
+    statique = _service_statique()
+    html = []
+    for nom in noms:
+        css, version = _feuille(nom)
+        if statique:
+            html.append(f'<link rel="stylesheet" href="{URL_STATIC}/{nom}?v={version}">')
+        else:
+            html.append(f"<style>{css}</style>")
+    st.markdown("".join(html), unsafe_allow_html=True)
@@ -1,5 +1,14 @@
 import streamlit as st
 
+from modules.cache import cache
+from modules.armatures import DIAMETRES, ESPACEMENTS, dispositions, tableau_sections
+
+
+@cache()
+def load_tableau():
+    return tableau_sections()
+
+
 def show():
     # --- Titre + bouton Accueil ---
     col1, col2 = st.columns([5, 1])
@@ -11,5 +20,50 @@ def show():
 
     st.markdown("---")
 
-    # --- Affichage du tableau sans avertissement ---
-    st.image("Tableau armature.png", caption="Tableau des sections d’armatures en mm² et espacement fixe (cm)", use_container_width=True)
+    df = load_tableau()
+    cols_barres = [c for c in df.columns if c.endswith(")")]
+    cols_esp = [f"e={e:g} cm" for e in ESPACEMENTS]
+
+    # --- Filtres (le tri se fait en cliquant sur l’en-tête des colonnes) ---
+    f1, f2 = st.columns([3, 2])
+    with f1:
+        diam = st.multiselect("Diamètres Ø [mm]", DIAMETRES, default=list(DIAMETRES), key="ta_diam")
+    with f2:
+        vue = st.radio("Colonnes", ["Tout", "Nombre de barres", "Espacement fixe"],
+                       horizontal=True, key="ta_vue")
+
+    cols = ["Ø [mm]"]
+    if vue != "Espacement fixe":
+        cols += cols_barres
+    cols.append("poids [kg/m]")
+    if vue != "Nombre de barres":
+        cols += cols_esp
+
+    config = {c: st.column_config.NumberColumn(c, format="%.0f") for c in cols_barres + cols_esp}
+    config["Ø [mm]"] = st.column_config.NumberColumn("Ø [mm]", format="%d")
+    config["poids [kg/m]"] = st.column_config.NumberColumn("poids [kg/m]", format="%.3f")
+
+    st.dataframe(df.loc[df["Ø [mm]"].isin(diam), cols], column_config=config,
+                 hide_index=True, use_container_width=True)
+    st.caption(
+        "Sections en mm² : n barres, ou n barres par mètre (espacement e = 100/n cm) ; "
+        "espacement fixe : mm²/m. Poids : acier 7860 kg/m³."
+    )
+
+    # --- Recherche inverse : As requise → dispositions ---
+    st.markdown("### 🔎 Dispositions pour une section requise")
+    r1, r2, r3 = st.columns([2, 2, 1])
+    with r1:
+        type_ = st.radio("Élément", ["poutre", "dalle"], horizontal=True, key="ta_type",
+                         format_func=lambda t: {"poutre": "Poutre (n × Ø)", "dalle": "Dalle (Ø / e)"}[t])
+    with r2:
+        unite = "mm²" if type_ == "poutre" else "mm²/m"
+        As_req = st.number_input(f"As requise [{unite}]", min_value=0.0, value=500.0, step=50.0, key="ta_As")
+    with r3:
+        limite = st.number_input("Résultats", min_value=1, max_value=100, value=10, step=1, key="ta_limite")
+
+    res = dispositions(As_req, type_, limite=int(limite))
+    fmt = {c: st.column_config.NumberColumn(c, format="%.0f") for c in res.columns if c.startswith("As")}
+    fmt.update({c: st.column_config.NumberColumn(c, format="%.2f") for c in res.columns if c.startswith("masse")})
+    st.dataframe(res, column_config=fmt, hide_index=True, use_container_width=True)
+    st.caption("Triées par masse d’acier croissante (à masse égale : moins de barres / espacement le plus grand).")
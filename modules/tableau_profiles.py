@@ -1,5 +1,70 @@
 import streamlit as st
 
+from modules.catalogues import catalogue
+from modules.profils import COLONNES, FAMILLES, bornes, charger_catalogue, filtrer, page, trier
+
+TAILLES_PAGE = (25, 50, 100)
+FILTRES_NUM = ("Wel", "Iy", "masse")
+
+
+@catalogue
+def load_catalogue():
+    return charger_catalogue()
+
+
 def show():
-    st.title("Tableaux des profils métalliques")
-    st.write("À venir...")
+    col1, col2 = st.columns([5, 1])
+    with col1:
+        st.title("Tableaux des profils métalliques")
+    with col2:
+        if st.button("🏠 Accueil", key="retour_accueil_profils"):
+            st.session_state.page = "Accueil"
+
+    cat = load_catalogue()
+    familles_cat = sorted(set(cat["type"]), key=lambda f: (f not in FAMILLES, f))
+
+    # --- Filtres (appliqués côté serveur, seule la page affichée est envoyée) ---
+    f1, f2 = st.columns([3, 2])
+    with f1:
+        familles = st.multiselect("Familles", familles_cat, default=familles_cat, key="tp_familles")
+    with f2:
+        recherche = st.text_input("Recherche (nom)", placeholder="ex. IPE 300", key="tp_recherche")
+
+    intervalles = {}
+    with st.expander("Filtres numériques", expanded=False):
+        cols = st.columns(len(FILTRES_NUM))
+        for c, col in zip(FILTRES_NUM, cols):
+            lo, hi = bornes(cat, c)
+            with col:
+                v_min = st.number_input(f"{COLONNES[c]} min", value=lo, min_value=0.0, key=f"tp_{c}_min")
+                v_max = st.number_input(f"{COLONNES[c]} max", value=hi, min_value=0.0, key=f"tp_{c}_max")
+            if v_min > lo or v_max < hi:
+                intervalles[c] = (v_min, v_max)
+
+    t1, t2, t3 = st.columns([2, 1, 1])
+    with t1:
+        tri = st.selectbox("Trier par", ["nom"] + list(COLONNES), key="tp_tri",
+                           format_func=lambda c: "Profil" if c == "nom" else COLONNES[c])
+    with t2:
+        croissant = st.radio("Ordre", ["croissant", "décroissant"], horizontal=True, key="tp_ordre") == "croissant"
+    with t3:
+        taille = st.selectbox("Lignes / page", TAILLES_PAGE, key="tp_taille")
+
+    idx = trier(cat, filtrer(cat, familles, intervalles, recherche), tri, croissant)
+
+    # retour à la première page quand la sélection change
+    signature = (tuple(familles), recherche, tuple(sorted(intervalles.items())), tri, croissant, taille)
+    if st.session_state.get("tp_signature") != signature:
+        st.session_state.tp_signature = signature
+        st.session_state.tp_page = 1
+
+    n_pages = max(1, -(-len(idx) // taille))
+    st.session_state.tp_page = min(st.session_state.get("tp_page", 1), n_pages)
+    p1, p2 = st.columns([1, 4])
+    with p1:
+        numero = st.number_input("Page", min_value=1, max_value=n_pages, step=1, key="tp_page")
+    df, n_pages = page(cat, idx, numero, taille)
+    with p2:
+        st.caption(f"{len(idx)} profilé(s) sur {len(cat['nom'])} — page {numero} / {n_pages}")
+
+    st.dataframe(df, hide_index=True, use_container_width=True)
@@ -0,0 +1,124 @@
+# modules/tassements.py
+"""
+Tassements d’un ensemble de semelles avec interaction (sol multicouche élastique).
+
+Chaque semelle rectangulaire (centre x, y, dimensions B × L, charge Q) applique
+une pression q = Q / (B·L). Le tassement en un point est obtenu par
+superposition de rectangles de coin (Steinbrenner, intégration de Boussinesq),
+couche par couche : s = Σ_i [C(z_bas,i) − C(z_haut,i)] / E_i.
+
+L’interaction n’est calculée que pour les couples de semelles proches
+(index spatial cKDTree + distance de coupure) ; la matrice de souplesse
+S (tassement en i par kPa sous j) est creuse et s = S · q.
+"""
+import numpy as np
+
+from modules.unites import E_MPa_to_kPa
+
+# position du point caractéristique (tassement flexible = tassement rigide) : 0.37·B depuis le centre
+POINT_CARAC = 0.37
+
+
+def _coin(a, b, H, nu):
+    """
+    Facteur de tassement du coin d’un rectangle a × b sous q = 1, pour une couche
+    de 0 à H sur base rigide, multiplié par E : (1−ν²)·F1 + (1−ν−2ν²)·F2, × min(a, b).
+    Tableaux numpy diffusables ; H = inf → demi-espace.
+    """
+    a, b = np.abs(a), np.abs(b)
+    Bc = np.minimum(a, b)
+    Lc = np.maximum(a, b)
+    nul = Bc <= 1e-12
+    Bc = np.where(nul, 1.0, Bc)
+    A = Lc / Bc
+    r1 = np.sqrt(A * A + 1.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        D = np.where(np.isinf(H), np.inf, H / Bc)
+        fini = np.isfinite(D)
+        Df = np.where(fini, D, 0.0)
+        rD = np.sqrt(A * A + Df * Df)
+        rD1 = np.sqrt(A * A + Df * Df + 1.0)
+        F1_fini = (A * np.log((1.0 + r1) * rD / (A * (1.0 + rD1)))
+                   + np.log((A + r1) * np.sqrt(1.0 + Df * Df) / (A + rD1))) / np.pi
+        F1_inf = (A * np.log((1.0 + r1) / A) + np.log(A + r1)) / np.pi
+        F2 = np.where(fini & (Df > 0), Df / (2.0 * np.pi) * np.arctan(A / np.maximum(Df * rD1, 1e-300)), 0.0)
+    F1 = np.where(fini, F1_fini, F1_inf)
+    F1 = np.where(fini & (Df <= 0), 0.0, F1)
+    f = Bc * ((1.0 - nu ** 2) * F1 + (1.0 - nu - 2.0 * nu ** 2) * F2)
+    return np.where(nul, 0.0, f)
+
+
+def _coin_multicouche(a, b, couches, nu):
+    """Σ_i [C(z_bas) − C(z_haut)] / E_i ; couches = (z_haut, z_bas, E [kPa]) en tableaux."""
+    z_h, z_b, E = couches
+    a, b = np.asarray(a, dtype=float)[..., None], np.asarray(b, dtype=float)[..., None]
+    return np.sum((_coin(a, b, z_b, nu) - _coin(a, b, z_h, nu)) / E, axis=-1)
+
+
+def influence_rectangle(px, py, cx, cy, B, L, couches, nu):
+    """
+    Tassement [m] au point (px, py) sous q = 1 kPa appliqué sur le rectangle
+    centré (cx, cy), B selon x, L selon y : superposition signée de 4 rectangles de coin.
+    """
+    x1, x2 = cx - B / 2.0 - px, cx + B / 2.0 - px
+    y1, y2 = cy - L / 2.0 - py, cy + L / 2.0 - py
+    s = 0.0
+    for u, v, sg in ((x2, y2, 1.0), (x1, y2, -1.0), (x2, y1, -1.0), (x1, y1, 1.0)):
+        s = s + sg * np.sign(u) * np.sign(v) * _coin_multicouche(u, v, couches, nu)
+    return s
+
+
+def couches_depuis_profil(layers, z_max=None):
+    """
+    Profil du cas 2 [{"h": m, "E": MPa}, ...] → (z_haut, z_bas, E [kPa]) depuis la base des semelles.
+    La dernière couche est prolongée jusqu’à z_max (None = demi-espace).
+    """
+    h = np.array([float(l["h"]) for l in layers])
+    E = E_MPa_to_kPa(np.array([float(l["E"]) for l in layers]))
+    z_b = np.cumsum(h)
+    z_h = z_b - h
+    if len(z_b):
+        z_b[-1] = np.inf if z_max is None else max(float(z_max), z_h[-1])
+    return z_h, z_b, E
+
+
+def tassements_site(semelles, couches, nu=0.30, r_coupure=20.0, point="caractéristique"):
+    """
+    semelles : dict de tableaux x, y, B, L [m], Q [kN] (n semelles, axes parallèles à x, y).
+    Renvoie q [kPa], s_propre [m] (semelle seule), s [m] (avec interaction),
+    k_iso = q / s_propre et k_eff = q / s [kN/m³], nb de voisins, matrice de souplesse S.
+    """
+    from scipy.sparse import coo_matrix
+    from scipy.spatial import cKDTree
+
+    x, y = np.asarray(semelles["x"], float), np.asarray(semelles["y"], float)
+    B, L = np.asarray(semelles["B"], float), np.asarray(semelles["L"], float)
+    Q = np.asarray(semelles["Q"], float)
+    n = len(x)
+    q = Q / (B * L)
+
+    # point de calcul sur chaque semelle
+    f = POINT_CARAC if point == "caractéristique" else 0.0
+    px, py = x + f * B, y + f * L
+
+    # couples (i reçoit de j) à distance de coupure, bords compris
+    demi_diag = 0.5 * np.hypot(B, L)
+    arbre = cKDTree(np.column_stack([x, y]))
+    paires = arbre.query_pairs(r_coupure + 2.0 * demi_diag.max(), output_type="ndarray")
+    i = np.concatenate([np.arange(n), paires[:, 0], paires[:, 1]])
+    j = np.concatenate([np.arange(n), paires[:, 1], paires[:, 0]])
+    d = np.hypot(x[i] - x[j], y[i] - y[j]) - demi_diag[i] - demi_diag[j]
+    garde = (i == j) | (d <= r_coupure)
+    i, j = i[garde], j[garde]
+
+    val = influence_rectangle(px[i], py[i], x[j], y[j], B[j], L[j], couches, nu)
+    S = coo_matrix((val, (i, j)), shape=(n, n)).tocsr()
+
+    s_propre = S.diagonal() * q
+    s = S @ q
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k_iso = np.where(s_propre > 0, q / s_propre, np.inf)
+        k_eff = np.where(s > 0, q / s, np.inf)
+    voisins = np.bincount(i, minlength=n) - 1
+    return {"q": q, "s_propre": s_propre, "s": s, "k_iso": k_iso, "k_eff": k_eff,
+            "voisins": voisins, "S": S}
@@ -0,0 +1,107 @@
+# modules/ui.py
+"""
+Aides d’interface communes aux pages Streamlit.
+"""
+import io
+from contextlib import contextmanager
+
+import streamlit as st
+
+from modules import enregistrement, metriques
+
+# clé de session du mode « saisie groupée » (partagée par les pages)
+CLE_SAISIE_GROUPEE = "saisie_groupee"
+
+
+def fragment(fn=None, **kwargs):
+    """
+    Décorateur de bloc réexécutable seul (st.fragment).
+    Repli sur st.experimental_fragment pour les anciennes versions de Streamlit,
+    sinon la fonction est simplement exécutée avec la page.
+    """
+    deco = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+    if enregistrement.ACTIF or metriques.ACTIF:
+        # reruns du fragment seul : trace de la session et journal des métriques (page, session, durée)
+        if fn is None:
+            return lambda f: fragment(f, **kwargs)
+        if enregistrement.ACTIF:
+            fn = enregistrement.suivre(fn)
+        if metriques.ACTIF:
+            fn = metriques.suivre(fn)
+    if deco is None:
+        return fn if fn is not None else (lambda f: f)
+    return deco(fn, **kwargs) if fn is not None else deco(**kwargs)
+
+
+def png(fig):
+    """Figure matplotlib → octets PNG (rendu de st.pyplot), puis fermeture de la figure."""
+    import matplotlib.pyplot as plt
+
+    buf = io.BytesIO()
+    try:
+        fig.savefig(buf, format="png", dpi=200, bbox_inches="tight")
+    finally:
+        plt.close(fig)
+    return buf.getvalue()
+
+
+def interrupteur_saisie_groupee():
+    """Interrupteur du mode « saisie groupée » ; la valeur est conservée d’une page à l’autre."""
+    st.session_state[CLE_SAISIE_GROUPEE] = st.toggle(
+        "Saisie groupée",
+        value=st.session_state.get(CLE_SAISIE_GROUPEE, False),
+        help="Les champs ne relancent plus le calcul à chaque modification : "
+             "tout est recalculé une seule fois au clic sur « Appliquer ».",
+    )
+    return st.session_state[CLE_SAISIE_GROUPEE]
+
+
+def saisie_groupee_active():
+    return bool(st.session_state.get(CLE_SAISIE_GROUPEE, False))
+
+
+@contextmanager
+def saisie_groupee(cle, libelle="✔️ Appliquer"):
+    """
+    Regroupe les champs du bloc dans un st.form si le mode « saisie groupée » est actif :
+    un seul rerun à la validation, avec les mêmes clés de session qu’en saisie directe.
+    Sinon, le bloc est affiché tel quel. Renvoie True si le formulaire est actif.
+    """
+    if not saisie_groupee_active():
+        yield False
+        return
+    with st.form(cle, border=False):
+        yield True
+        st.form_submit_button(libelle, type="primary", use_container_width=True)
+
+
+def selectbox_recherche(label, designations, key=None, defaut=None, limite=20, placeholder="ex. HEA 2, 80x40"):
+    """
+    Selectbox précédée d’un champ de recherche (modules.recherche) : seules les
+    limite meilleures correspondances sont envoyées comme options.
+    Sans recherche : toutes les désignations, dans l’ordre donné.
+    La valeur courante (ou defaut si elle a disparu de la liste) reste proposée
+    tant qu’aucune recherche ne l’exclut ; avec key, elle survit aux changements de liste.
+    """
+    from modules.recherche import index_sections
+
+    designations = tuple(designations)
+    c1, c2 = st.columns([1, 2])
+    with c1:
+        q = st.text_input(f"🔎 {label}", key=f"{key or label}__recherche", placeholder=placeholder)
+        if q.strip():
+            options = index_sections(designations).chercher(q, limite)
+            if not options:
+                st.caption("Aucun résultat.")
+        else:
+            options = list(designations)
+
+    courant = st.session_state.get(key, defaut) if key else defaut
+    if courant not in designations:
+        courant = defaut
+    if courant in designations and courant not in options and (not q.strip() or not options):
+        options = [courant] + options
+    if not options:
+        options = list(designations[:1])
+    with c2:
+        return st.selectbox(label, options, index=options.index(courant) if courant in options else 0, key=key)
@@ -0,0 +1,68 @@
+# modules/unites.py
+"""
+Conversions d’unités partagées entre les pages.
+
+Toutes les fonctions acceptent un scalaire, une liste, un tableau numpy ou une
+Series pandas et renvoient le même genre d’objet (les listes deviennent des
+tableaux numpy) : une colonne entière se convertit en une seule multiplication.
+"""
+import numpy as np
+
+KGCM2_KPA = 98.0665   # 1 kg/cm² en kPa
+
+# facteurs vers l’unité de base de chaque grandeur
+PRESSION = {"kPa": 1.0, "MPa": 1000.0, "GPa": 1_000_000.0, "kg/cm²": KGCM2_KPA, "N/mm²": 1000.0}
+RAIDEUR = {"kN/m³": 1.0, "MN/m³": 1000.0, "kg/cm³": KGCM2_KPA * 100.0}
+LONGUEUR = {"m": 1.0, "cm": 0.01, "mm": 0.001}
+
+GRANDEURS = {
+    "Pression / contrainte / module": PRESSION,
+    "Raideur k": RAIDEUR,
+    "Longueur": LONGUEUR,
+}
+
+
+def _num(valeur):
+    """Scalaires, tableaux et Series passent tels quels ; les séquences deviennent des tableaux."""
+    if isinstance(valeur, (list, tuple)):
+        return np.asarray(valeur, dtype=float)
+    return valeur
+
+
+def convertir(valeur, de, vers):
+    """Convertit valeur de l’unité « de » vers l’unité « vers » (même grandeur)."""
+    for table in GRANDEURS.values():
+        if de in table and vers in table:
+            return _num(valeur) * (table[de] / table[vers])
+    raise ValueError(f"Conversion impossible : {de} → {vers}")
+
+
+# ---------- Raccourcis utilisés par les pages ----------
+def to_kPa_from(value, unit):
+    """Convertit une pression entrée (kPa, MPa, kg/cm²) en kPa."""
+    return _num(value) * PRESSION.get(unit, 1.0)
+
+
+def from_kPa_to(value_kPa, unit):
+    """Convertit une pression depuis kPa vers l’unité souhaitée."""
+    return _num(value_kPa) / PRESSION.get(unit, 1.0)
+
+
+def E_MPa_to_kPa(E_MPa):
+    """E en MPa (N/mm²) → kPa (kN/m²)."""
+    return _num(E_MPa) * PRESSION["MPa"]
+
+
+def E_GPa_to_kPa(E_GPa):
+    """E en GPa → kPa."""
+    return _num(E_GPa) * PRESSION["GPa"]
+
+
+def kNpm3_to_MNpm3(val_kNpm3):
+    """k de kN/m³ → MN/m³."""
+    return _num(val_kNpm3) / RAIDEUR["MN/m³"]
+
+
+def MNpm3_to_kNpm3(val_MNpm3):
+    """k de MN/m³ → kN/m³."""
+    return _num(val_MNpm3) * RAIDEUR["MN/m³"]
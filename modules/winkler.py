@@ -0,0 +1,211 @@
+# modules/winkler.py
+"""
+Poutre et radier sur appuis élastiques (modèle de Winkler).
+
+Poutre : éléments Euler-Bernoulli, assemblage vectorisé directement en stockage
+bande (2 ddl par nœud : w, θ), puis Cholesky en bande (scipy.linalg.solveh_banded).
+Radier : plaque de Kirchhoff en éléments rectangulaires ACM (3 ddl par nœud),
+assemblage COO → CSC vectorisé et factorisation creuse (scipy.sparse.linalg.splu).
+Convention : w > 0 vers le bas (tassement), q et P > 0 vers le bas,
+p = k·w > 0 en compression du sol, M > 0 en flexion positive (fibre inférieure tendue).
+"""
+import math
+
+import numpy as np
+from scipy.linalg import solveh_banded
+
+BANDE = 3   # demi-largeur de bande (4 ddl par élément → 3 sur-diagonales)
+
+
+def _matrices_elementaires(le, EI, kB):
+    """Matrices 4×4 (flexion + ressorts répartis cohérents) pour chaque élément. kB : k·B [kN/m²]."""
+    le = np.asarray(le, dtype=float)
+    L2, L3 = le**2, le**3
+    Kb = np.empty((le.size, 4, 4))
+    Kb[:, 0] = np.stack([12.0 / L3, 6.0 / L2, -12.0 / L3, 6.0 / L2], axis=-1)
+    Kb[:, 1] = np.stack([6.0 / L2, 4.0 / le, -6.0 / L2, 2.0 / le], axis=-1)
+    Kb[:, 2] = np.stack([-12.0 / L3, -6.0 / L2, 12.0 / L3, -6.0 / L2], axis=-1)
+    Kb[:, 3] = np.stack([6.0 / L2, 2.0 / le, -6.0 / L2, 4.0 / le], axis=-1)
+    Kb *= np.asarray(EI, dtype=float).reshape(-1, 1, 1)
+
+    Ks = np.empty_like(Kb)
+    Ks[:, 0] = np.stack([156.0 * np.ones_like(le), 22.0 * le, 54.0 * np.ones_like(le), -13.0 * le], axis=-1)
+    Ks[:, 1] = np.stack([22.0 * le, 4.0 * L2, 13.0 * le, -3.0 * L2], axis=-1)
+    Ks[:, 2] = np.stack([54.0 * np.ones_like(le), 13.0 * le, 156.0 * np.ones_like(le), -22.0 * le], axis=-1)
+    Ks[:, 3] = np.stack([-13.0 * le, -3.0 * L2, -22.0 * le, 4.0 * L2], axis=-1)
+    Ks *= (np.asarray(kB, dtype=float) * le / 420.0).reshape(-1, 1, 1)
+    return Kb + Ks
+
+
+def poutre_winkler(L, EI, B, k, q=0.0, charges=(), n_elem=200):
+    """
+    Poutre libre-libre de longueur L [m] sur ressorts de Winkler.
+
+    EI [kN·m²], B largeur d’appui [m], k > 0 scalaire ou tableau aux n_elem+1 nœuds [kN/m³],
+    q charge répartie [kN/m] (scalaire ou tableau aux nœuds), charges = [(x [m], P [kN]), ...].
+    Renvoie un dict de tableaux aux nœuds : x, w [m], theta, M [kN·m], V [kN], p [kPa].
+    """
+    n_elem = max(int(n_elem), 1)
+    n_nodes = n_elem + 1
+    ndof = 2 * n_nodes
+    x = np.linspace(0.0, float(L), n_nodes)
+    le = np.diff(x)
+
+    k_n = np.broadcast_to(np.asarray(k, dtype=float), (n_nodes,))
+    if not np.all(k_n > 0):
+        # poutre libre-libre : sans ressort partout, la matrice n’est pas définie positive
+        raise ValueError("k doit être strictement positif en tout nœud de la poutre")
+    q_n = np.broadcast_to(np.asarray(q, dtype=float), (n_nodes,))
+    kB_e = 0.5 * (k_n[:-1] + k_n[1:]) * B
+    q_e = 0.5 * (q_n[:-1] + q_n[1:])
+
+    Ke = _matrices_elementaires(le, EI, kB_e)
+
+    # --- assemblage en bande (forme « upper » de solveh_banded : ab[BANDE + i - j, j] = K[i, j])
+    dofs = 2 * np.arange(n_elem)[:, None] + np.arange(4)[None, :]          # (n_elem, 4)
+    I = np.broadcast_to(dofs[:, :, None], Ke.shape)
+    J = np.broadcast_to(dofs[:, None, :], Ke.shape)
+    upper = I <= J
+    ab = np.zeros((BANDE + 1, ndof))
+    np.add.at(ab, (BANDE + I[upper] - J[upper], J[upper]), Ke[upper])
+
+    # --- chargement : q répartie (vecteur cohérent) + charges ponctuelles au nœud le plus proche
+    Fe = (q_e * le / 2.0)[:, None] * np.stack([np.ones_like(le), le / 6.0, np.ones_like(le), -le / 6.0], axis=-1)
+    F = np.zeros(ndof)
+    np.add.at(F, dofs, Fe)
+    for xp, P in charges:
+        i = int(np.clip(np.rint(float(xp) / L * n_elem), 0, n_elem))
+        F[2 * i] += float(P)
+
+    u = solveh_banded(ab, F, lower=False, check_finite=False)
+    w, theta = u[0::2], u[1::2]
+
+    # --- efforts internes à partir des forces d’extrémité des éléments
+    ue = u[dofs]
+    fe = np.einsum("eij,ej->ei", Ke, ue) - Fe
+    M = np.empty(n_nodes)
+    V = np.empty(n_nodes)
+    M[:-1], M[-1] = fe[:, 1], -fe[-1, 3]
+    V[:-1], V[-1] = -fe[:, 0], fe[-1, 2]
+
+    return {"x": x, "w": w, "theta": theta, "M": M, "V": V, "p": k_n * w}
+
+
+def k_interpole(x, positions, valeurs):
+    """k(x) par interpolation linéaire entre des valeurs ponctuelles (ex. un k par sondage CPT)."""
+    positions = np.asarray(positions, dtype=float)
+    valeurs = np.asarray(valeurs, dtype=float)
+    order = np.argsort(positions)
+    return np.interp(np.asarray(x, dtype=float), positions[order], valeurs[order])
+
+
+# =============================================================
+# Radier / dallage sur ressorts – éléments de plaque ACM (rectangle, 12 ddl)
+# ddl par nœud : w, ∂w/∂x, ∂w/∂y  ;  maillage régulier nx × ny éléments
+# =============================================================
+_GAUSS3 = (np.array([-np.sqrt(0.6), 0.0, np.sqrt(0.6)]), np.array([5.0, 8.0, 5.0]) / 9.0)
+
+
+def _acm_base(x, y):
+    """Base polynomiale ACM (12 termes) et dérivées utiles, pour des tableaux x, y."""
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    o, z = np.ones_like(x), np.zeros_like(x)
+    P   = np.stack([o, x, y, x*x, x*y, y*y, x**3, x*x*y, x*y*y, y**3, x**3*y, x*y**3], axis=-1)
+    Px  = np.stack([z, o, z, 2*x, y, z, 3*x*x, 2*x*y, y*y, z, 3*x*x*y, y**3], axis=-1)
+    Py  = np.stack([z, z, o, z, x, 2*y, z, x*x, 2*x*y, 3*y*y, x**3, 3*x*y*y], axis=-1)
+    Pxx = np.stack([z, z, z, 2*o, z, z, 6*x, 2*y, z, z, 6*x*y, z], axis=-1)
+    Pyy = np.stack([z, z, z, z, z, 2*o, z, z, 2*x, 6*y, z, 6*x*y], axis=-1)
+    Pxy = np.stack([z, z, z, z, o, z, z, 2*x, 2*y, z, 3*x*x, 3*y*y], axis=-1)
+    return P, Px, Py, Pxx, Pyy, Pxy
+
+
+def _acm_element(a, b, D0, nu):
+    """Matrice de rigidité 12×12 d’un élément a×b et opérateur ddl → courbures au centre."""
+    xn = np.array([0.0, a, a, 0.0])
+    yn = np.array([0.0, 0.0, b, b])
+    P, Px, Py, *_ = _acm_base(xn, yn)
+    C = np.empty((12, 12))
+    C[0::3], C[1::3], C[2::3] = P, Px, Py
+    Cinv = np.linalg.inv(C)
+
+    Dm = D0 * np.array([[1.0, nu, 0.0], [nu, 1.0, 0.0], [0.0, 0.0, (1.0 - nu) / 2.0]])
+    g, wg = _GAUSS3
+    gx, gy = np.meshgrid(a * (g + 1) / 2, b * (g + 1) / 2, indexing="ij")
+    wxy = np.outer(wg, wg).ravel() * a * b / 4.0
+    _, _, _, Pxx, Pyy, Pxy = _acm_base(gx.ravel(), gy.ravel())
+    Bp = np.stack([Pxx, Pyy, 2.0 * Pxy], axis=1)                       # (ng, 3, 12)
+    Kp = np.einsum("g,gki,kl,glj->ij", wxy, Bp, Dm, Bp)
+    Ke = Cinv.T @ Kp @ Cinv
+
+    _, _, _, cxx, cyy, cxy = _acm_base(np.array([a / 2]), np.array([b / 2]))
+    Bc = np.stack([cxx[0], cyy[0], 2.0 * cxy[0]]) @ Cinv                # (3, 12)
+    return Ke, Bc, Dm
+
+
+def radier_winkler(Lx, Ly, t, E, nu, k, nx=40, ny=40, q=0.0, charges=(), lignes=()):
+    """
+    Plaque rectangulaire libre Lx × Ly [m], épaisseur t [m], E [kPa], sur ressorts k [kN/m³]
+    (scalaire ou tableau (ny+1, nx+1) aux nœuds).
+    q pression uniforme [kPa], charges = [(x, y, P kN)], lignes = [(x1, y1, x2, y2, p kN/m)].
+    Renvoie x, y, w [m] (ny+1, nx+1), p = k·w [kPa], mx, my, mxy [kN·m/m] au centre des éléments, ndof.
+    """
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.linalg import splu
+
+    nx, ny = max(int(nx), 1), max(int(ny), 1)
+    a, b = Lx / nx, Ly / ny
+    n_nodes = (nx + 1) * (ny + 1)
+    ndof = 3 * n_nodes
+    x = np.linspace(0.0, Lx, nx + 1)
+    y = np.linspace(0.0, Ly, ny + 1)
+
+    D0 = E * t**3 / (12.0 * (1.0 - nu**2))
+    Ke, Bc, Dm = _acm_element(a, b, D0, nu)
+
+    # connectivité (nœuds numérotés ligne par ligne : n = j·(nx+1) + i)
+    i0, j0 = np.meshgrid(np.arange(nx), np.arange(ny), indexing="xy")
+    n0 = (j0 * (nx + 1) + i0).ravel()
+    conn = np.stack([n0, n0 + 1, n0 + nx + 2, n0 + nx + 1], axis=1)     # (ne, 4)
+    edofs = (3 * conn[:, :, None] + np.arange(3)).reshape(-1, 12)         # (ne, 12)
+
+    # ressorts concentrés : k·A_trib sur les ddl w
+    A_trib = np.zeros(n_nodes)
+    np.add.at(A_trib, conn, a * b / 4.0)
+    k_n = np.broadcast_to(np.asarray(k, dtype=float), (ny + 1, nx + 1)).ravel()
+
+    rows = np.concatenate([np.repeat(edofs, 12, axis=1).ravel(), 3 * np.arange(n_nodes)])
+    cols = np.concatenate([np.tile(edofs, (1, 12)).ravel(), 3 * np.arange(n_nodes)])
+    vals = np.concatenate([np.broadcast_to(Ke.ravel(), (len(edofs), 144)).ravel(), k_n * A_trib])
+    K = coo_matrix((vals, (rows, cols)), shape=(ndof, ndof)).tocsc()
+
+    # chargement
+    F = np.zeros(ndof)
+    F[0::3] += q * A_trib
+
+    def _noeud(xp, yp):
+        i = np.clip(np.rint(np.asarray(xp) / a), 0, nx).astype(int)
+        j = np.clip(np.rint(np.asarray(yp) / b), 0, ny).astype(int)
+        return j * (nx + 1) + i
+
+    if len(charges):
+        ch = np.asarray(charges, dtype=float).reshape(-1, 3)
+        np.add.at(F, 3 * _noeud(ch[:, 0], ch[:, 1]), ch[:, 2])
+    for x1, y1, x2, y2, p in lignes:
+        Ls = math.hypot(x2 - x1, y2 - y1)
+        ns = max(int(np.ceil(2.0 * Ls / min(a, b))), 1)
+        s = (np.arange(ns) + 0.5) / ns
+        np.add.at(F, 3 * _noeud(x1 + s * (x2 - x1), y1 + s * (y2 - y1)), p * Ls / ns)
+
+    # K symétrique définie positive : ordonnancement symétrique, pas de pivotage
+    u = splu(K, permc_spec="MMD_AT_PLUS_A", diag_pivot_thresh=0.0,
+             options={"SymmetricMode": True}).solve(F)
+
+    w = u[0::3].reshape(ny + 1, nx + 1)
+    kappa = np.einsum("kj,ej->ek", Bc, u[edofs])                          # courbures au centre
+    m = -kappa @ Dm.T
+    shape_e = (ny, nx)
+    return {
+        "x": x, "y": y, "w": w, "p": k_n.reshape(ny + 1, nx + 1) * w,
+        "mx": m[:, 0].reshape(shape_e), "my": m[:, 1].reshape(shape_e), "mxy": m[:, 2].reshape(shape_e),
+        "ndof": ndof,
+    }
@@ -13,20 +13,32 @@ from modules import (
     garde_corps,     # existant
     poutre_bois,
     rigidite_sol,     # ⬅️ nouveau module
+    enregistrement,
+    metriques,
+    prechauffage,
+    profilage,
 )
 
 st.set_page_config(page_title="Études Structure", layout="wide", initial_sidebar_state="collapsed")
 
+# ---- Caches (catalogues, tables, index) remplis une seule fois par processus
+prechauffage.au_demarrage()
+
 # ---- Récupération fiable du paramètre ?page=...
 page_param = None
+profil_param = None
 try:
     qp = st.query_params
     page_param = qp.get("page", None)
+    profil_param = qp.get("profile", None)
 except Exception:
     qp = st.experimental_get_query_params()
     if "page" in qp:
         v = qp["page"]
         page_param = v[0] if isinstance(v, list) else v
+    if "profile" in qp:
+        v = qp["profile"]
+        profil_param = v[0] if isinstance(v, list) else v
 
 if page_param:
     st.session_state.page = page_param
@@ -56,5 +68,13 @@ pages = {
     "Rigidité du sol": rigidite_sol.show,
 }
 
-# ---- Affichage
-pages.get(st.session_state.page, accueil.show)()
+# ---- Affichage (?profile=1 : temps par étape et profil cProfile en bas de page)
+# durée du rerun enregistrée dans le journal des métriques si METRIQUES=1 (modules.metriques),
+# saisies inscrites dans la trace de la session si ENREGISTRER_SESSIONS=1 (modules.enregistrement)
+show = pages.get(st.session_state.page, accueil.show)
+with metriques.rerun(st.session_state.page, st.session_state), \
+        enregistrement.rerun(st.session_state.page, st.session_state):
+    if profil_param == "1":
+        profilage.page(st.session_state.page, show)
+    else:
+        show()